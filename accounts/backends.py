@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+
+
+def user_cache_key(user_id) -> str:
+    return f"accounts:user:{user_id}"
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    ModelBackend that keeps the user of a session in the cache for
+    USER_CACHE_TIMEOUT seconds, so authenticated requests do not load it from
+    the database every time. Saving or deleting the user drops the entry.
+    """
+
+    def get_user(self, user_id):
+        timeout = getattr(settings, "USER_CACHE_TIMEOUT", 0)
+        if not timeout:
+            return super().get_user(user_id)
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(user_id)
+            if user is not None:
+                cache.set(key, user, timeout)
+            return user
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:30
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+# Prefix searches filter with LOWER(column) LIKE 'term%', which a btree only
+# serves with the text_pattern_ops operator class on non-C collations.
+PATTERN_INDEXES = {
+    "accounts_user_email_prefix_idx": "email",
+    "accounts_user_first_name_prefix_idx": "first_name",
+    "accounts_user_last_name_prefix_idx": "last_name",
+}
+
+
+def create_prefix_indexes(apps, schema_editor):
+    """
+    Create the PostgreSQL prefix search indexes. Other databases search
+    without them.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, column in PATTERN_INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON accounts_customuser "
+            f"(LOWER({column}) text_pattern_ops)"
+        )
+
+
+def drop_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in PATTERN_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(
+                django.db.models.functions.text.Lower("email"),
+                name="accounts_user_email_lower_idx",
+            ),
+        ),
+        migrations.RunPython(create_prefix_indexes, drop_prefix_indexes),
+    ]
@@ -0,0 +1,47 @@
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY
+from django.contrib.sessions.backends.cached_db import KEY_PREFIX
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.cache import caches
+from django.db import migrations
+from django.utils import timezone
+
+LEGACY_BACKEND = "django.contrib.auth.backends.ModelBackend"
+BACKEND = "accounts.backends.CachedModelBackend"
+
+
+def move_sessions_to_cached_backend(apps, schema_editor):
+    """
+    Point the sessions that logged in through ModelBackend, which is no
+    longer in AUTHENTICATION_BACKENDS, at CachedModelBackend so they stay
+    logged in. Their cached_db copies are dropped so the rewritten rows are
+    read. Signed cookie sessions cannot be rewritten and log in again.
+    """
+    Session = apps.get_model("sessions", "Session")
+    store = SessionStore()
+    cache = caches[settings.SESSION_CACHE_ALIAS]
+    changed = []
+    sessions = Session.objects.filter(expire_date__gt=timezone.now())
+    for session in sessions.iterator(chunk_size=1000):
+        data = store.decode(session.session_data)
+        if data.get(BACKEND_SESSION_KEY) != LEGACY_BACKEND:
+            continue
+        data[BACKEND_SESSION_KEY] = BACKEND
+        session.session_data = store.encode(data)
+        changed.append(session)
+        cache.delete(KEY_PREFIX + session.session_key)
+    Session.objects.bulk_update(changed, ["session_data"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0002_user_search_indexes"),
+        ("sessions", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            move_sessions_to_cached_backend, migrations.RunPython.noop
+        ),
+    ]
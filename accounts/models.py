@@ -4,9 +4,40 @@ from django.contrib.auth.models import (
     PermissionsMixin,
 )
 from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Lower
 
 
-class CustomUserManager(BaseUserManager):
+class CustomUserQuerySet(models.QuerySet):
+    """
+    Case-insensitive lookups that filter on ``LOWER(column)`` so they can use
+    the expression indexes of the accounts migrations.
+    """
+
+    def with_email(self, email: str):
+        """
+        Users whose email is ``email``, ignoring case.
+        """
+        return self.alias(email_lower=Lower("email")).filter(email_lower=email.lower())
+
+    def search(self, term: str):
+        """
+        Users whose email, first name or last name starts with ``term``,
+        ignoring case.
+        """
+        term = term.lower()
+        return self.alias(
+            email_lower=Lower("email"),
+            first_name_lower=Lower("first_name"),
+            last_name_lower=Lower("last_name"),
+        ).filter(
+            Q(email_lower__startswith=term)
+            | Q(first_name_lower__startswith=term)
+            | Q(last_name_lower__startswith=term)
+        )
+
+
+class CustomUserManager(BaseUserManager.from_queryset(CustomUserQuerySet)):
     """Manager for CustomUser where email is the unique identifier"""
 
     def create_user(self, email, password=None, **extra_fields):
@@ -45,5 +76,12 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = []
 
+    class Meta:
+        indexes = [
+            # Case-insensitive email lookups. The prefix search indexes only
+            # exist on PostgreSQL, see migration 0002.
+            models.Index(Lower("email"), name="accounts_user_email_lower_idx"),
+        ]
+
     def __str__(self):
         return self.email
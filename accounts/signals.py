@@ -0,0 +1,18 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from accounts.backends import user_cache_key
+
+
+def invalidate_cached_user(sender, instance, **kwargs):
+    """
+    Drop the cached copy of a user once the write has been committed.
+    """
+    key = user_cache_key(instance.pk)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+post_save.connect(invalidate_cached_user, sender=get_user_model())
+post_delete.connect(invalidate_cached_user, sender=get_user_model())
@@ -1,8 +1,17 @@
 from http import HTTPStatus
+from importlib import import_module
 
-from django.test import Client, TestCase
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
+from accounts.backends import CachedModelBackend
 from accounts.models import CustomUser as User
 
 
@@ -44,3 +53,89 @@ class LoginViewTestCase(TestCase):
         )
         self.assertEqual(response.status_code, HTTPStatus.FOUND)
         self.assertEqual(response.url, reverse("clubs:index"))
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    SESSION_ENGINE="django.contrib.sessions.backends.cached_db",
+    USER_CACHE_TIMEOUT=300,
+)
+class CachedSessionAndUserTestCase(TestCase):
+    """Test case for the cached session engine and the cached user backend."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="janedoe@example.com", password="securepassword123"
+        )
+        self.backend = CachedModelBackend()
+
+    def test_user_served_from_cache(self):
+        """
+        Test that a user is loaded from the database once.
+        """
+        self.backend.get_user(self.user.pk)
+        with self.assertNumQueries(0):
+            user = self.backend.get_user(self.user.pk)
+        self.assertEqual(user, self.user)
+
+    def test_saving_user_drops_cached_copy(self):
+        """
+        Test that changes to the user row are seen on the next request.
+        """
+        self.backend.get_user(self.user.pk)
+        self.user.first_name = "Jane"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+        self.assertEqual(self.backend.get_user(self.user.pk).first_name, "Jane")
+
+    def test_deactivated_user_not_returned(self):
+        """
+        Test that a deactivated user is logged out.
+        """
+        self.backend.get_user(self.user.pk)
+        self.user.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+        self.assertIsNone(self.backend.get_user(self.user.pk))
+
+    def test_authenticated_request_skips_session_and_user_queries(self):
+        """
+        Test that a logged in page view does not query sessions or users.
+        """
+        self.client.login(email="janedoe@example.com", password="securepassword123")
+        self.client.get(reverse("clubs:index"))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("clubs:index"))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        tables = " ".join(query["sql"] for query in queries)
+        self.assertNotIn("django_session", tables)
+        self.assertNotIn('FROM "accounts_customuser"', tables)
+
+
+class LegacySessionMigrationTestCase(TestCase):
+    """Test case for moving ModelBackend sessions to CachedModelBackend."""
+
+    def test_legacy_session_stays_logged_in(self):
+        """
+        Test that a session started with ModelBackend is still logged in
+        after the migration.
+        """
+        user = User.objects.create_user(
+            email="janedoe@example.com", password="securepassword123"
+        )
+        session = SessionStore()
+        session[SESSION_KEY] = str(user.pk)
+        session[BACKEND_SESSION_KEY] = "django.contrib.auth.backends.ModelBackend"
+        session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        session.create()
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = session.session_key
+        response = self.client.get(reverse("clubs:index"))
+        self.assertEqual(response.status_code, HTTPStatus.FOUND)
+
+        migration = import_module(
+            "accounts.migrations.0003_move_sessions_to_cached_backend"
+        )
+        migration.move_sessions_to_cached_backend(apps, None)
+        response = self.client.get(reverse("clubs:index"))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
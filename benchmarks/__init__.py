@@ -0,0 +1,7 @@
+"""
+Benchmarks for the clubs app.
+
+Each module is run with ``python -m benchmarks.<name>``. They create and
+destroy their own test database, so they never touch real data. Set
+``BENCHMARK_DATABASE=sqlite`` to run them without PostgreSQL.
+"""
@@ -0,0 +1,87 @@
+import json
+import os
+import statistics
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+from pathlib import Path
+
+import django
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+def setup_django() -> None:
+    """
+    Configure Django for a benchmark run.
+    """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "investment_club.settings")
+    from django.conf import settings
+
+    if os.getenv("BENCHMARK_DATABASE") == "sqlite":
+        settings.DATABASES["default"] = {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": str(RESULTS_DIR.parent / "benchmark.sqlite3"),
+        }
+    # Benchmarks render templates without running collectstatic first.
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "staticfiles": {
+            "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+        },
+    }
+    django.setup()
+
+
+@contextmanager
+def test_database():
+    """
+    Create a migrated test database for the duration of the block.
+    """
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def analyze(connection) -> None:
+    """
+    Refresh the planner statistics after seeding.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+
+def measure(func: Callable, repeat: int = 20) -> dict:
+    """
+    Call ``func`` ``repeat`` times and summarise the latencies in milliseconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return {
+        "runs": repeat,
+        "mean_ms": round(statistics.fmean(timings), 3),
+        "p50_ms": round(timings[len(timings) // 2], 3),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 3),
+    }
+
+
+def write_results(name: str, results: dict) -> Path:
+    """
+    Store benchmark results as ``benchmarks/results/<name>.json``.
+    """
+    RESULTS_DIR.mkdir(exist_ok=True)
+    path = RESULTS_DIR / f"{name}.json"
+    path.write_text(json.dumps(results, indent=2, default=str))
+    return path
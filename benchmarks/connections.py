@@ -0,0 +1,137 @@
+"""
+Requests per second of the club list view when a new database connection is
+opened for every request, when connections persist between requests and,
+with psycopg 3 and psycopg_pool installed, when they come from a pool.
+
+    python -m benchmarks.connections --threads 4 --requests 500
+
+The requests go through the WSGI handler, so connections are closed at the
+end of each request exactly as under gunicorn. Run it against PostgreSQL: an
+in-memory SQLite test database is never really closed, so every mode looks
+the same there.
+"""
+
+import argparse
+import threading
+import time
+from wsgiref.util import setup_testing_defaults
+
+from benchmarks.common import setup_django, test_database, write_results
+
+MODES = ("per-request", "persistent", "pool")
+
+
+def configure(connection, mode: str, threads: int) -> None:
+    """
+    Point the default connection settings at ``mode`` and drop any open
+    connection so the next request uses them.
+    """
+    connection.close()
+    if hasattr(connection, "close_pool"):
+        connection.close_pool()
+    options = connection.settings_dict.setdefault("OPTIONS", {})
+    options.pop("pool", None)
+    connection.settings_dict["CONN_MAX_AGE"] = 60 if mode == "persistent" else 0
+    connection.settings_dict["CONN_HEALTH_CHECKS"] = mode == "persistent"
+    if mode == "pool":
+        options["pool"] = {"min_size": 1, "max_size": threads, "timeout": 10}
+
+
+def pool_supported(connection) -> bool:
+    """
+    Django pools connections only on PostgreSQL with psycopg 3.
+    """
+    if connection.vendor != "postgresql":
+        return False
+    try:
+        import psycopg_pool  # noqa: F401
+    except ImportError:
+        return False
+    from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+    return is_psycopg3
+
+
+def run_mode(handler, environ: dict, threads: int, requests: int) -> dict:
+    """
+    Send ``requests`` GETs from each of ``threads`` threads and return the
+    throughput and the number of connections opened.
+    """
+    from django.db import connections
+    from django.db.backends.signals import connection_created
+
+    opened = []
+
+    def count(sender, connection, **kwargs):
+        opened.append(connection.alias)
+
+    def worker():
+        for _ in range(requests):
+            response = handler(dict(environ), lambda status, headers: None)
+            b"".join(response)
+            response.close()
+        connections.close_all()
+
+    connection_created.connect(count)
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    connection_created.disconnect(count)
+    return {
+        "requests": requests * threads,
+        "requests_per_second": round(requests * threads / elapsed, 1),
+        "connections_opened": len(opened),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.db import connection
+    from django.test import Client
+    from django.urls import reverse
+
+    from clubs.services.synthetic_data import SyntheticDataSize, seed_synthetic_data
+
+    with test_database():
+        club = seed_synthetic_data(SyntheticDataSize(1, 10, 1, 100))[0]
+        client = Client()
+        client.force_login(club.created_by)
+        environ = {
+            "PATH_INFO": reverse("clubs:index"),
+            "HTTP_HOST": "testserver",
+            "HTTP_COOKIE": (
+                f"{settings.SESSION_COOKIE_NAME}="
+                f"{client.cookies[settings.SESSION_COOKIE_NAME].value}"
+            ),
+        }
+        setup_testing_defaults(environ)
+        handler = WSGIHandler()
+
+        results = {}
+        for mode in MODES:
+            if mode == "pool" and not pool_supported(connection):
+                print("pool: skipped, needs PostgreSQL with psycopg 3 and psycopg_pool")
+                continue
+            configure(connection, mode, args.threads)
+            results[mode] = run_mode(handler, environ, args.threads, args.requests)
+            print(
+                f"{mode}: {results[mode]['requests_per_second']} requests/s, "
+                f"{results[mode]['connections_opened']} connections opened"
+            )
+        configure(connection, "per-request", args.threads)
+    print(f"Results written to {write_results('connections', results)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Query plans and timings of the financial hot-path queries with and without
+the composite indexes and constraints declared on the clubs ledger models.
+
+    python -m benchmarks.indexes --transactions 200000 --members 200
+"""
+
+import argparse
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+from benchmarks.common import (
+    analyze,
+    measure,
+    setup_django,
+    test_database,
+    write_results,
+)
+
+
+def seed(members: int, transactions: int, seed_value: int) -> dict:
+    """
+    Seed one club with a financial year holding a large ledger.
+    """
+    from accounts.models import CustomUser
+    from clubs.models import (
+        Club,
+        ClubMember,
+        FinancialTransaction,
+        FinancialYear,
+        IndividualDue,
+    )
+    from clubs.services.ledger import rebuild_ledger_snapshots
+
+    rng = random.Random(seed_value)
+    users = CustomUser.objects.bulk_create(
+        CustomUser(email=f"member{index}@example.com") for index in range(members)
+    )
+    owner = users[0]
+    club = Club.objects.create(
+        name="Benchmark Club",
+        description="Benchmark",
+        contact_email=owner.email,
+        created_by=owner,
+        updated_by=owner,
+    )
+    club_members = ClubMember.objects.bulk_create(
+        ClubMember(user=user, club=club) for user in users
+    )
+    financial_year = FinancialYear.objects.create(
+        club=club,
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 12, 31),
+        created_by=owner,
+        updated_by=owner,
+    )
+    FinancialTransaction.objects.bulk_create(
+        (
+            FinancialTransaction(
+                financial_year=financial_year,
+                club_member=rng.choice(club_members),
+                credit=Decimal(rng.randrange(1000, 100000)),
+                transaction_date=date(2024, 1, 1) + timedelta(days=rng.randrange(366)),
+                description="Contribution",
+                created_by=owner,
+                updated_by=owner,
+            )
+            for _ in range(transactions)
+        ),
+        batch_size=5000,
+    )
+    IndividualDue.objects.bulk_create(
+        (
+            IndividualDue(
+                financial_year=financial_year,
+                club_member=rng.choice(club_members),
+                amount=Decimal(rng.randrange(1000, 10000)),
+                due_date=date(2024, 1, 1) + timedelta(days=rng.randrange(366)),
+                description="Fine",
+                created_by=owner,
+                updated_by=owner,
+            )
+            for _ in range(transactions // 20)
+        ),
+        batch_size=5000,
+    )
+    # bulk_create skips the ledger signals.
+    rebuild_ledger_snapshots(financial_year)
+    return {"financial_year": financial_year, "club_member": club_members[1]}
+
+
+def hot_path_queries(financial_year, club_member) -> dict:
+    """
+    The queries issued by the report and financial year detail views.
+    """
+    from django.db.models import Q, Sum
+
+    from clubs.models import FinancialTransaction, MonthlyLedgerSnapshot
+
+    cursor = (
+        FinancialTransaction.objects.filter(financial_year=financial_year)
+        .order_by("-transaction_date", "-id")
+        .values("transaction_date", "id")[1000]
+    )
+    return {
+        "month_transactions": FinancialTransaction.objects.filter(
+            financial_year=financial_year,
+            transaction_date__gte=date(2024, 6, 1),
+            transaction_date__lt=date(2024, 7, 1),
+        ).order_by("transaction_date"),
+        "ledger_first_page": FinancialTransaction.objects.filter(
+            financial_year=financial_year
+        ).order_by("-transaction_date", "-id")[:51],
+        "ledger_later_page": FinancialTransaction.objects.filter(
+            Q(transaction_date__lt=cursor["transaction_date"])
+            | Q(transaction_date=cursor["transaction_date"], id__lt=cursor["id"]),
+            financial_year=financial_year,
+        ).order_by("-transaction_date", "-id")[:51],
+        "member_snapshot_totals": MonthlyLedgerSnapshot.objects.filter(
+            financial_year=financial_year,
+            club_member=club_member,
+            month__lt=date(2024, 7, 1),
+        )
+        .values("club_member")
+        .annotate(
+            total_credit=Sum("credit"),
+            total_debit=Sum("debit"),
+            individual_due=Sum("individual_due"),
+        ),
+        "month_cash_flow": MonthlyLedgerSnapshot.objects.filter(
+            financial_year=financial_year,
+            month__gte=date(2024, 6, 1),
+            month__lt=date(2024, 7, 1),
+        )
+        .values("financial_year")
+        .annotate(total_credit=Sum("credit"), total_debit=Sum("debit")),
+    }
+
+
+def run_queries(financial_year, club_member, repeat: int) -> dict:
+    """
+    Explain and time every hot-path query.
+    """
+    return {
+        name: {
+            "plan": queryset.explain(),
+            "timing": measure(lambda: list(queryset.all()), repeat),
+        }
+        for name, queryset in hot_path_queries(financial_year, club_member).items()
+    }
+
+
+def composite_indexes():
+    """
+    Yield (model, index) for every composite index and unique constraint
+    declared on the ledger models.
+    """
+    from clubs.models import FinancialTransaction, MonthlyLedgerSnapshot
+
+    for model in (FinancialTransaction, MonthlyLedgerSnapshot):
+        for index in [*model._meta.indexes, *model._meta.constraints]:
+            yield model, index
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=200)
+    parser.add_argument("--transactions", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db.models import Index
+
+    with test_database() as connection:
+        seeded = seed(args.members, args.transactions, args.seed)
+        results = {"parameters": vars(args), "vendor": connection.vendor}
+
+        with connection.schema_editor() as schema_editor:
+            for model, index in composite_indexes():
+                if isinstance(index, Index):
+                    schema_editor.remove_index(model, index)
+                else:
+                    schema_editor.remove_constraint(model, index)
+        analyze(connection)
+        results["before"] = run_queries(**seeded, repeat=args.repeat)
+
+        with connection.schema_editor() as schema_editor:
+            for model, index in composite_indexes():
+                if isinstance(index, Index):
+                    schema_editor.add_index(model, index)
+                else:
+                    schema_editor.add_constraint(model, index)
+        analyze(connection)
+        results["after"] = run_queries(**seeded, repeat=args.repeat)
+
+    for name, after in results["after"].items():
+        before = results["before"][name]["timing"]["p50_ms"]
+        print(f"{name}: p50 {before} ms -> {after['timing']['p50_ms']} ms")
+    print(f"Results written to {write_results('indexes', results)}")
+
+
+if __name__ == "__main__":
+    main()
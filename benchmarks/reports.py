@@ -0,0 +1,131 @@
+"""
+Tail latency of the financial reports page served by the WSGI view and by
+the async view through the ASGI handler, with the report cache disabled and
+--concurrency requests in flight at a time.
+
+    python -m benchmarks.reports --size medium --concurrency 8
+
+The WSGI view runs each request on a thread like gthread workers do, the
+async view runs all of them on one event loop like a uvicorn worker.
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import analyze, setup_django, test_database, write_results
+from benchmarks.views import SIZES
+
+
+def summarise(timings: list[float]) -> dict:
+    """
+    p50, p95 and p99 of latencies in milliseconds.
+    """
+    timings = sorted(timings)
+
+    def percentile(p: float) -> float:
+        return round(timings[min(len(timings) - 1, int(len(timings) * p))], 3)
+
+    return {
+        "runs": len(timings),
+        "p50_ms": percentile(0.5),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+    }
+
+
+def run_wsgi(url: str, user, requests: int, concurrency: int) -> dict:
+    """
+    Time ``requests`` GETs of the WSGI view from ``concurrency`` threads.
+    """
+    from django.db import connections
+    from django.test import Client
+
+    logged_in = Client()
+    logged_in.force_login(user)
+
+    def get(_):
+        client = Client()
+        client.cookies = logged_in.cookies
+        started = time.perf_counter()
+        response = client.get(url)
+        elapsed = (time.perf_counter() - started) * 1000
+        assert response.status_code == 200, response.status_code
+        connections.close_all()
+        return elapsed
+
+    with ThreadPoolExecutor(concurrency) as executor:
+        return summarise(list(executor.map(get, range(requests))))
+
+
+async def run_asgi(url: str, user, requests: int, concurrency: int) -> dict:
+    """
+    Time ``requests`` GETs of the async view, ``concurrency`` at a time.
+    """
+    from django.test import AsyncClient
+
+    client = AsyncClient()
+    await client.aforce_login(user)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def get():
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.get(url)
+            elapsed = (time.perf_counter() - started) * 1000
+        assert response.status_code == 200, response.status_code
+        return elapsed
+
+    return summarise(await asyncio.gather(*(get() for _ in range(requests))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", choices=SIZES, default="small")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db import connection
+    from django.test.utils import override_settings
+    from django.urls import reverse
+
+    from clubs.services.synthetic_data import SyntheticDataSize, seed_synthetic_data
+
+    dummy_cache = {
+        "default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}
+    }
+    with test_database(), override_settings(CACHES=dummy_cache):
+        club = seed_synthetic_data(SyntheticDataSize(**SIZES[args.size]))[0]
+        analyze(connection)
+        financial_year = club.financial_years.order_by("-start_date").first()
+        query = f"?month=6&year={financial_year.start_date.year}"
+        ids = [club.id, financial_year.id]
+        results = {
+            "wsgi": run_wsgi(
+                reverse("clubs:financial-reports", args=ids) + query,
+                club.created_by,
+                args.requests,
+                args.concurrency,
+            ),
+            "asgi": asyncio.run(
+                run_asgi(
+                    reverse("clubs:financial-reports-async", args=ids) + query,
+                    club.created_by,
+                    args.requests,
+                    args.concurrency,
+                )
+            ),
+        }
+    for name, timing in results.items():
+        print(
+            f"{name}: p50 {timing['p50_ms']} ms, p95 {timing['p95_ms']} ms, "
+            f"p99 {timing['p99_ms']} ms"
+        )
+    print(f"Results written to {write_results('reports', results)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Latency of the dues simulator against the per-month view path: the balance
+of every participant for every month of a financial year, computed by
+requesting the financial reports page once per month, by calling
+participant_balances once per month, and by one simulation over the ledger
+arrays.
+
+    python -m benchmarks.simulator --size medium --repeat 10
+
+The report cache is disabled so the view path recomputes every month like a
+what-if change would force it to.
+"""
+
+import argparse
+
+from benchmarks.common import (
+    analyze,
+    measure,
+    setup_django,
+    test_database,
+    write_results,
+)
+from benchmarks.views import SIZES
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", choices=SIZES, default="small")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db import connection
+    from django.test import Client
+    from django.test.utils import override_settings
+    from django.urls import reverse
+
+    from clubs.services.dues import participant_balances
+    from clubs.services.dues_simulator import Scenario, load_ledger, simulate
+    from clubs.services.synthetic_data import SyntheticDataSize, seed_synthetic_data
+
+    dummy_cache = {
+        "default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}
+    }
+    with test_database(), override_settings(CACHES=dummy_cache):
+        club = seed_synthetic_data(SyntheticDataSize(**SIZES[args.size]))[0]
+        analyze(connection)
+        financial_year = club.financial_years.order_by("-start_date").first()
+        contribution = financial_year.contributions.first()
+        scenario = Scenario(
+            contribution_amounts={contribution.id: contribution.amount * 2}
+        )
+        ledger = load_ledger(financial_year)
+        client = Client()
+        client.force_login(club.created_by)
+        url = reverse("clubs:financial-reports", args=[club.id, financial_year.id])
+        simulator_url = reverse(
+            "clubs:dues-simulator", args=[club.id, financial_year.id]
+        )
+
+        def report_views():
+            for month in ledger.months:
+                response = client.get(url, {"month": month.month, "year": month.year})
+                assert response.status_code == 200, response.status_code
+
+        def balance_queries():
+            for month in ledger.months:
+                participant_balances(financial_year, month)
+
+        results = {
+            "report_view_per_month": measure(report_views, args.repeat),
+            "participant_balances_per_month": measure(balance_queries, args.repeat),
+            "simulator_view": measure(lambda: client.get(simulator_url), args.repeat),
+            "load_ledger": measure(lambda: load_ledger(financial_year), args.repeat),
+            "simulate": measure(lambda: simulate(ledger, scenario), args.repeat),
+        }
+    for name, timing in results.items():
+        print(f"{name}: p50 {timing['p50_ms']} ms, p95 {timing['p95_ms']} ms")
+    print(f"Results written to {write_results('simulator', results)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Throughput and peak memory of the CSV transaction import.
+
+    python -m benchmarks.transaction_import --rows 100000 --members 200
+"""
+
+import argparse
+import csv
+import random
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from benchmarks.common import setup_django, test_database, write_results
+
+
+def seed(members: int) -> dict:
+    """
+    Seed one club with a financial year and its participants.
+    """
+    from accounts.models import CustomUser
+    from clubs.models import Club, ClubMember, FinancialYear, FinancialYearParticipant
+
+    users = CustomUser.objects.bulk_create(
+        CustomUser(email=f"member{index}@example.com") for index in range(members)
+    )
+    owner = users[0]
+    club = Club.objects.create(
+        name="Benchmark Club",
+        description="Benchmark",
+        contact_email=owner.email,
+        created_by=owner,
+        updated_by=owner,
+    )
+    club_members = ClubMember.objects.bulk_create(
+        ClubMember(user=user, club=club) for user in users
+    )
+    financial_year = FinancialYear.objects.create(
+        club=club,
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 12, 31),
+        created_by=owner,
+        updated_by=owner,
+    )
+    FinancialYearParticipant.objects.bulk_create(
+        FinancialYearParticipant(
+            financial_year=financial_year,
+            club_member=club_member,
+            created_by=owner,
+            updated_by=owner,
+        )
+        for club_member in club_members
+    )
+    return {"financial_year": financial_year, "user": owner}
+
+
+def write_csv(path: str, rows: int, members: int, seed_value: int) -> None:
+    """
+    Write a bank statement like CSV of ``rows`` transactions.
+    """
+    rng = random.Random(seed_value)
+    with open(path, "w", newline="") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(
+            ["transaction_date", "description", "credit", "debit", "member_email"]
+        )
+        for _ in range(rows):
+            transaction_date = date(2024, 1, 1) + timedelta(days=rng.randrange(366))
+            amount = rng.randrange(1000, 100000)
+            credit = rng.random() < 0.8
+            writer.writerow(
+                [
+                    transaction_date.isoformat(),
+                    "Contribution" if credit else "Expense",
+                    amount if credit else "",
+                    "" if credit else amount,
+                    f"member{rng.randrange(members)}@example.com" if credit else "",
+                ]
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    setup_django()
+    from clubs.services.transaction_import import import_transactions
+
+    with tempfile.NamedTemporaryFile(suffix=".csv") as csv_path:
+        write_csv(csv_path.name, args.rows, args.members, args.seed)
+        with test_database() as connection:
+            seeded = seed(args.members)
+            with open(csv_path.name, newline="") as csv_file:
+                tracemalloc.start()
+                started = time.perf_counter()
+                result = import_transactions(
+                    **seeded, csv_file=csv_file, chunk_size=args.chunk_size
+                )
+                elapsed = time.perf_counter() - started
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+    results = {
+        "parameters": vars(args),
+        "vendor": connection.vendor,
+        "created": result.created,
+        "errors": result.error_count,
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(result.created / elapsed),
+        "peak_memory_mb": round(peak / 1024 / 1024, 2),
+    }
+    print(
+        f"{result.created} rows in {results['seconds']} s: "
+        f"{results['rows_per_second']} rows/s, peak {results['peak_memory_mb']} MB"
+    )
+    print(f"Results written to {write_results('transaction_import', results)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+End-to-end latency and query counts of the main clubs views at several data
+sizes, compared against a stored baseline.
+
+    python -m benchmarks.views --sizes small medium
+    python -m benchmarks.views --save-baseline
+
+Exits with status 1 when a view makes more queries than in the baseline or
+its p50 latency grew by more than --tolerance.
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks.common import (
+    RESULTS_DIR,
+    analyze,
+    measure,
+    setup_django,
+    test_database,
+    write_results,
+)
+
+SIZES = {
+    "small": {"clubs": 2, "members": 20, "years": 1, "transactions": 1000},
+    "medium": {"clubs": 5, "members": 50, "years": 2, "transactions": 10000},
+    "large": {"clubs": 10, "members": 200, "years": 3, "transactions": 100000},
+}
+BASELINE = RESULTS_DIR / "views.baseline.json"
+
+
+def view_urls(club) -> dict:
+    """
+    URLs of the benchmarked views for the latest financial year of ``club``.
+    """
+    from django.urls import reverse
+
+    financial_year = club.financial_years.order_by("-start_date").first()
+    return {
+        "clubs:index": reverse("clubs:index"),
+        "clubs:detail": reverse("clubs:detail", args=[club.id]),
+        "clubs:financial-year-detail": reverse(
+            "clubs:financial-year-detail", args=[club.id, financial_year.id]
+        ),
+        "clubs:financial-reports": reverse(
+            "clubs:financial-reports", args=[club.id, financial_year.id]
+        )
+        + f"?month=6&year={financial_year.start_date.year}",
+    }
+
+
+def run_size(size: dict, repeat: int, seed: int) -> dict:
+    """
+    Seed a fresh database of ``size`` and time every view as the club admin.
+    """
+    from django.db import connection
+    from django.test import Client
+    from django.test.utils import CaptureQueriesContext
+
+    from clubs.services.synthetic_data import SyntheticDataSize, seed_synthetic_data
+
+    with test_database():
+        club = seed_synthetic_data(SyntheticDataSize(**size), seed=seed)[0]
+        analyze(connection)
+        client = Client()
+        client.force_login(club.created_by)
+        results = {}
+        for name, url in view_urls(club).items():
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(url)
+            assert (
+                response.status_code == 200
+            ), f"{name} returned {response.status_code}"
+            results[name] = {
+                "queries": len(queries),
+                **measure(lambda: client.get(url), repeat),
+            }
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    List the views that regressed against the baseline.
+    """
+    regressions = []
+    for size, views in results.items():
+        for name, current in views.items():
+            previous = baseline.get(size, {}).get(name)
+            if previous is None:
+                continue
+            if current["queries"] > previous["queries"]:
+                regressions.append(
+                    f"{size} {name}: {previous['queries']} -> "
+                    f"{current['queries']} queries"
+                )
+            if current["p50_ms"] > previous["p50_ms"] * (1 + tolerance):
+                regressions.append(
+                    f"{size} {name}: p50 {previous['p50_ms']} -> "
+                    f"{current['p50_ms']} ms"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", nargs="+", choices=SIZES, default=["small"])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+
+    setup_django()
+    results = {
+        size: run_size(SIZES[size], args.repeat, args.seed) for size in args.sizes
+    }
+    for size, views in results.items():
+        for name, timing in views.items():
+            print(
+                f"{size} {name}: {timing['queries']} queries, "
+                f"p50 {timing['p50_ms']} ms, p95 {timing['p95_ms']} ms"
+            )
+    print(f"Results written to {write_results('views', results)}")
+
+    if args.save_baseline:
+        BASELINE.write_text(json.dumps(results, indent=2))
+        print(f"Baseline written to {BASELINE}")
+        return
+    if not BASELINE.exists():
+        print("No baseline yet, run with --save-baseline to store one.")
+        return
+    regressions = compare(results, json.loads(BASELINE.read_text()), args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,10 +10,112 @@ from clubs.models import (
     IndividualDue,
 )
 
-admin.site.register(Club)
-admin.site.register(ClubMember)
-admin.site.register(FinancialYear)
-admin.site.register(FinancialYearParticipant)
-admin.site.register(FinancialTransaction)
-admin.site.register(FinancialYearContribution)
-admin.site.register(IndividualDue)
+# Changelists of the ledger tables can hold millions of rows: pages stay small
+# and the exact COUNT(*) behind "N total" is skipped.
+LIST_PER_PAGE = 50
+
+
+class AuditedModelAdmin(admin.ModelAdmin):
+    """
+    Base admin for models with created_by and updated_by. The audit users are
+    edited by id so the change form does not load every user into a select.
+    """
+
+    list_per_page = LIST_PER_PAGE
+    show_full_result_count = False
+    raw_id_fields = ("created_by", "updated_by")
+
+
+@admin.register(Club)
+class ClubAdmin(AuditedModelAdmin):
+    list_display = ("id", "name", "contact_email", "created_at")
+    search_fields = ("name",)
+    ordering = ("name",)
+
+
+@admin.register(ClubMember)
+class ClubMemberAdmin(admin.ModelAdmin):
+    list_display = ("user", "club", "role", "is_admin")
+    list_filter = ("is_admin",)
+    search_fields = ("user__email", "user__first_name", "club__name")
+    autocomplete_fields = ("user", "club")
+    raw_id_fields = ("invited_by",)
+    ordering = ("id",)
+    list_per_page = LIST_PER_PAGE
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        # __str__ walks to the user and the club, also in autocomplete results.
+        return super().get_queryset(request).select_related("user", "club")
+
+
+@admin.register(FinancialYear)
+class FinancialYearAdmin(AuditedModelAdmin):
+    list_display = ("__str__", "transaction_count", "participant_count", "is_active")
+    list_filter = ("is_active",)
+    search_fields = ("club__name",)
+    autocomplete_fields = ("club",)
+    ordering = ("-start_date", "id")
+    # Maintained by clubs.services.ledger, repaired with
+    # reconcile_financial_year_totals.
+    readonly_fields = (
+        "transaction_count",
+        "participant_count",
+        "total_credit",
+        "total_debit",
+        "total_individual_dues",
+    )
+
+    def get_queryset(self, request):
+        # __str__ walks to the club, also in autocomplete results.
+        return super().get_queryset(request).select_related("club")
+
+
+@admin.register(FinancialYearContribution)
+class FinancialYearContributionAdmin(AuditedModelAdmin):
+    list_display = ("financial_year", "amount", "due_period")
+    list_select_related = ("financial_year__club",)
+    autocomplete_fields = ("financial_year",)
+
+
+class LedgerModelAdmin(AuditedModelAdmin):
+    """
+    Base admin for the source rows of the ledger snapshots and running
+    totals. Saves and deletes, bulk deletes included, reach the ledger
+    through the clubs.signals handlers.
+    """
+
+    list_select_related = (
+        "club_member__user",
+        "club_member__club",
+        "financial_year__club",
+    )
+    autocomplete_fields = ("financial_year", "club_member")
+
+
+@admin.register(FinancialYearParticipant)
+class FinancialYearParticipantAdmin(LedgerModelAdmin):
+    list_display = ("club_member", "financial_year")
+
+
+@admin.register(IndividualDue)
+class IndividualDueAdmin(LedgerModelAdmin):
+    list_display = ("due_date", "amount", "club_member", "financial_year")
+    # Backed by the (due_date, id) index.
+    date_hierarchy = "due_date"
+    ordering = ("-due_date", "-id")
+
+
+@admin.register(FinancialTransaction)
+class FinancialTransactionAdmin(LedgerModelAdmin):
+    list_display = (
+        "transaction_date",
+        "credit",
+        "debit",
+        "description",
+        "club_member",
+        "financial_year",
+    )
+    # Backed by the (transaction_date, id) index.
+    date_hierarchy = "transaction_date"
+    ordering = ("-transaction_date", "-id")
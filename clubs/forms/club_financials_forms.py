@@ -1,6 +1,10 @@
 from django import forms
+from django.db.models import Exists, OuterRef
+from django.forms.models import ModelChoiceIterator
 
 from clubs.models import (
+    Club,
+    ClubMember,
     FinancialTransaction,
     FinancialYear,
     FinancialYearContribution,
@@ -9,6 +13,106 @@ from clubs.models import (
 )
 
 
+def club_member_options(
+    club: Club, financial_year: FinancialYear | None = None
+) -> list[ClubMember]:
+    """
+    Return the members of ``club`` with their user loaded and an
+    ``is_participant`` flag for ``financial_year``, in one query.
+
+    The list is memoized on the club instance, so the club_member fields of
+    every form built for the same club share it.
+    """
+    cache = club.__dict__.setdefault("_club_member_options", {})
+    key = financial_year.pk if financial_year else None
+    if key not in cache:
+        members = (
+            ClubMember.objects.filter(club=club)
+            .select_related("user")
+            .order_by("user__first_name", "user__last_name", "id")
+        )
+        if financial_year is not None:
+            members = members.annotate(
+                is_participant=Exists(
+                    FinancialYearParticipant.objects.filter(
+                        financial_year=financial_year, club_member=OuterRef("pk")
+                    )
+                )
+            )
+        cache[key] = list(members)
+    return cache[key]
+
+
+class ClubMemberChoiceIterator(ModelChoiceIterator):
+    """
+    Iterate the preloaded options of a ClubMemberChoiceField instead of
+    querying its queryset again on every render.
+    """
+
+    def __iter__(self):
+        if self.field.options is None:
+            yield from super().__iter__()
+            return
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for member in self.field.options:
+            yield self.choice(member)
+
+    def __len__(self):
+        if self.field.options is None:
+            return super().__len__()
+        return len(self.field.options) + (self.field.empty_label is not None)
+
+
+class ClubMemberChoiceField(forms.ModelChoiceField):
+    """
+    Choice field for a ClubMember whose options are set by the form from
+    club_member_options.
+    """
+
+    iterator = ClubMemberChoiceIterator
+    options = None
+
+    def label_from_instance(self, obj):
+        """
+        Label a member by name, from the preloaded user.
+        """
+        name = f"{obj.user.first_name} {obj.user.last_name}".strip()
+        return name or obj.user.email
+
+
+class ClubMemberFormMixin:
+    """
+    Restrict the club_member field of a form to the members of ``club``.
+    ``participants`` narrows them to the participants of ``financial_year``
+    when True, or to the members not participating yet when False.
+    """
+
+    participants: bool | None = None
+
+    def __init__(self, *args, club: Club, financial_year: FinancialYear, **kwargs):
+        super().__init__(*args, **kwargs)
+        field = self.fields["club_member"]
+        queryset = ClubMember.objects.filter(club=club)
+        options = club_member_options(club, financial_year)
+        if self.participants is not None:
+            year_members = queryset.filter(
+                financial_years__financial_year=financial_year
+            ).values("pk")
+            queryset = (
+                queryset.filter(pk__in=year_members)
+                if self.participants
+                else queryset.exclude(pk__in=year_members)
+            )
+            options = [
+                member
+                for member in options
+                if member.is_participant == self.participants
+            ]
+        field.queryset = queryset
+        field.options = options
+
+
 class FinancialYearForm(forms.ModelForm):
     """
     Form for creating or updating a Financial Year.
@@ -43,20 +147,23 @@ class FinancialYearContributionForm(forms.ModelForm):
         }
 
 
-class FinancialYearParticipantForm(forms.ModelForm):
+class FinancialYearParticipantForm(ClubMemberFormMixin, forms.ModelForm):
     """
-    Form for adding a participant to a Financial Year.
+    Form for adding a club member as a participant to a Financial Year.
     """
 
+    participants = False
+
     class Meta:
         model = FinancialYearParticipant
         fields = ["club_member"]
+        field_classes = {"club_member": ClubMemberChoiceField}
         widgets = {
             "club_member": forms.Select(attrs={"class": "form-select"}),
         }
 
 
-class FinancialTransactionForm(forms.ModelForm):
+class FinancialTransactionForm(ClubMemberFormMixin, forms.ModelForm):
     """
     Form for recording a financial transaction for a Financial Year.
     """
@@ -64,6 +171,7 @@ class FinancialTransactionForm(forms.ModelForm):
     class Meta:
         model = FinancialTransaction
         fields = ["club_member", "credit", "debit", "transaction_date", "description"]
+        field_classes = {"club_member": ClubMemberChoiceField}
         widgets = {
             "club_member": forms.Select(attrs={"class": "form-select"}),
             "credit": forms.NumberInput(
@@ -83,14 +191,17 @@ class FinancialTransactionForm(forms.ModelForm):
         }
 
 
-class IndividualDueForm(forms.ModelForm):
+class IndividualDueForm(ClubMemberFormMixin, forms.ModelForm):
     """
-    Form for creating an IndividualDue for a Financial Year.
+    Form for creating an IndividualDue for a participant of a Financial Year.
     """
 
+    participants = True
+
     class Meta:
         model = IndividualDue
         fields = ["club_member", "description", "amount", "due_date"]
+        field_classes = {"club_member": ClubMemberChoiceField}
         widgets = {
             "club_member": forms.Select(attrs={"class": "form-select"}),
             "description": forms.Textarea(attrs={"class": "form-control", "rows": 2}),
@@ -101,3 +212,19 @@ class IndividualDueForm(forms.ModelForm):
                 attrs={"type": "date", "class": "form-control"}
             ),
         }
+
+
+class FinancialTransactionImportForm(forms.Form):
+    """
+    Form for uploading a CSV of transactions for a Financial Year.
+    """
+
+    file = forms.FileField(
+        label="CSV file",
+        help_text=(
+            "Columns: transaction_date, description, credit, debit, member_email."
+        ),
+        widget=forms.ClearableFileInput(
+            attrs={"accept": ".csv,text/csv", "class": "form-control"}
+        ),
+    )
@@ -0,0 +1,52 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from clubs.models import FinancialYear
+from clubs.services.transaction_import import IMPORT_CHUNK_SIZE, import_transactions
+
+
+class Command(BaseCommand):
+    """
+    Import financial transactions from a CSV file into a financial year.
+    """
+
+    help = (
+        "Import transactions from a CSV with the columns transaction_date, "
+        "description, credit, debit and member_email."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("financial_year_id", type=int)
+        parser.add_argument("path", help="Path of the CSV file to import.")
+        parser.add_argument(
+            "--user",
+            required=True,
+            dest="email",
+            help="Email of the user recorded as creator of the transactions.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=IMPORT_CHUNK_SIZE,
+            help="Number of rows validated and inserted per batch.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            financial_year = FinancialYear.objects.get(id=options["financial_year_id"])
+            user = get_user_model().objects.get(email=options["email"])
+        except (FinancialYear.DoesNotExist, get_user_model().DoesNotExist) as error:
+            raise CommandError(error)
+        with open(options["path"], encoding="utf-8-sig", newline="") as csv_file:
+            result = import_transactions(
+                financial_year, csv_file, user, chunk_size=options["chunk_size"]
+            )
+        if not result.ok:
+            for line, message in result.errors:
+                self.stderr.write(f"Line {line}: {message}")
+            raise CommandError(
+                f"{result.error_count} rows failed validation, nothing was imported."
+            )
+        self.stdout.write(
+            f"Financial year {financial_year.id}: {result.created} transactions imported."
+        )
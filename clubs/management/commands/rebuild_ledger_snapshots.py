@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from clubs.models import FinancialYear
+from clubs.services.ledger import rebuild_ledger_snapshots
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the monthly ledger snapshots from transactions and individual dues.
+    """
+
+    help = "Rebuild the monthly ledger snapshots of one or all financial years."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--financial-year",
+            type=int,
+            dest="financial_year_id",
+            help="Only rebuild the snapshots of this financial year id.",
+        )
+
+    def handle(self, *args, **options):
+        financial_years = FinancialYear.objects.order_by("id")
+        if options["financial_year_id"]:
+            financial_years = financial_years.filter(id=options["financial_year_id"])
+        for financial_year in financial_years.iterator():
+            rows = rebuild_ledger_snapshots(financial_year)
+            self.stdout.write(
+                f"Financial year {financial_year.id}: {rows} snapshot rows written."
+            )
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+
+from clubs.models import FinancialYear
+from clubs.services.ledger import reconcile_totals
+
+
+class Command(BaseCommand):
+    """
+    Compare the running totals of financial years with their transactions,
+    participants and individual dues.
+    """
+
+    help = (
+        "Report financial years whose running totals drifted from their source "
+        "rows, and repair them with --fix."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--financial-year",
+            type=int,
+            dest="financial_year_id",
+            help="Only reconcile the totals of this financial year id.",
+        )
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Overwrite drifted totals with the recomputed values.",
+        )
+
+    def handle(self, *args, **options):
+        financial_years = FinancialYear.objects.order_by("id")
+        if options["financial_year_id"]:
+            financial_years = financial_years.filter(id=options["financial_year_id"])
+        drifted = 0
+        for financial_year in financial_years.iterator():
+            drift = reconcile_totals(financial_year, repair=options["fix"])
+            if not drift:
+                continue
+            drifted += 1
+            for name, (stored, actual) in drift.items():
+                self.stdout.write(
+                    f"Financial year {financial_year.id}: {name} is {stored}, "
+                    f"expected {actual}."
+                )
+        action = "repaired" if options["fix"] else "found"
+        self.stdout.write(f"{drifted} financial years with drifted totals {action}.")
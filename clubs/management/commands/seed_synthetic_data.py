@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from clubs.services.synthetic_data import SyntheticDataSize, seed_synthetic_data
+
+
+class Command(BaseCommand):
+    """
+    Seed clubs, members, financial years and transactions for load testing.
+    """
+
+    help = (
+        "Seed N clubs x M members x Y financial years x T transactions per "
+        "financial year of deterministic synthetic data."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--clubs", type=int, default=1)
+        parser.add_argument("--members", type=int, default=20)
+        parser.add_argument("--years", type=int, default=1)
+        parser.add_argument(
+            "--transactions",
+            type=int,
+            default=1000,
+            help="Transactions per financial year.",
+        )
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        size = SyntheticDataSize(
+            clubs=options["clubs"],
+            members=options["members"],
+            years=options["years"],
+            transactions=options["transactions"],
+        )
+        with transaction.atomic():
+            clubs = seed_synthetic_data(size, seed=options["seed"])
+        for club in clubs:
+            self.stdout.write(f"Seeded club {club.id}: {club.name}")
@@ -0,0 +1,117 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:59
+
+from collections import defaultdict
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Sum
+from django.db.models.functions import TruncMonth
+
+
+def backfill_snapshots(apps, schema_editor):
+    """
+    Populate the ledger snapshots from the existing transactions and dues.
+    """
+    FinancialTransaction = apps.get_model("clubs", "FinancialTransaction")
+    IndividualDue = apps.get_model("clubs", "IndividualDue")
+    MonthlyLedgerSnapshot = apps.get_model("clubs", "MonthlyLedgerSnapshot")
+    totals = defaultdict(
+        lambda: {
+            "credit": Decimal("0"),
+            "debit": Decimal("0"),
+            "individual_due": Decimal("0"),
+        }
+    )
+    transaction_rows = (
+        FinancialTransaction.objects.annotate(month=TruncMonth("transaction_date"))
+        .values("financial_year_id", "club_member_id", "month")
+        .annotate(credit=Sum("credit"), debit=Sum("debit"))
+        .order_by()
+    )
+    for row in transaction_rows:
+        key = (row["financial_year_id"], row["club_member_id"], row["month"])
+        totals[key]["credit"] += row["credit"] or Decimal("0")
+        totals[key]["debit"] += row["debit"] or Decimal("0")
+    due_rows = (
+        IndividualDue.objects.annotate(month=TruncMonth("due_date"))
+        .values("financial_year_id", "club_member_id", "month")
+        .annotate(amount=Sum("amount"))
+        .order_by()
+    )
+    for row in due_rows:
+        key = (row["financial_year_id"], row["club_member_id"], row["month"])
+        totals[key]["individual_due"] += row["amount"] or Decimal("0")
+    MonthlyLedgerSnapshot.objects.bulk_create(
+        [
+            MonthlyLedgerSnapshot(
+                financial_year_id=financial_year_id,
+                club_member_id=club_member_id,
+                month=month,
+                **amounts,
+            )
+            for (financial_year_id, club_member_id, month), amounts in totals.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("clubs", "0002_individualdue"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MonthlyLedgerSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("month", models.DateField()),
+                (
+                    "credit",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=12),
+                ),
+                (
+                    "debit",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=12),
+                ),
+                (
+                    "individual_due",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=12),
+                ),
+                (
+                    "club_member",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="ledger_snapshots",
+                        to="clubs.clubmember",
+                    ),
+                ),
+                (
+                    "financial_year",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ledger_snapshots",
+                        to="clubs.financialyear",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("financial_year", "club_member", "month")},
+            },
+        ),
+        migrations.RunPython(backfill_snapshots, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-17 16:03
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("clubs", "0003_monthlyledgersnapshot"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="financialtransaction",
+            index=models.Index(
+                fields=["financial_year", "transaction_date"],
+                name="clubs_txn_fy_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="financialtransaction",
+            index=models.Index(
+                fields=[
+                    "financial_year",
+                    "club_member",
+                    "transaction_date",
+                    "credit",
+                    "debit",
+                ],
+                name="clubs_txn_fy_member_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="individualdue",
+            index=models.Index(
+                fields=["financial_year", "club_member", "due_date", "amount"],
+                name="clubs_due_fy_member_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="monthlyledgersnapshot",
+            index=models.Index(
+                fields=["financial_year", "month"], name="clubs_ledger_fy_month_idx"
+            ),
+        ),
+    ]
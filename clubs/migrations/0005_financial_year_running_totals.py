@@ -0,0 +1,64 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:10
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_totals(apps, schema_editor):
+    """
+    Populate the running totals from the existing transactions, participants
+    and dues.
+    """
+    FinancialYear = apps.get_model("clubs", "FinancialYear")
+    for financial_year in FinancialYear.objects.all():
+        transactions = financial_year.transactions.aggregate(
+            count=Count("id"), credit=Sum("credit"), debit=Sum("debit")
+        )
+        FinancialYear.objects.filter(pk=financial_year.pk).update(
+            transaction_count=transactions["count"],
+            participant_count=financial_year.participants.count(),
+            total_credit=transactions["credit"] or Decimal("0"),
+            total_debit=transactions["debit"] or Decimal("0"),
+            total_individual_dues=financial_year.individual_dues.aggregate(
+                total=Sum("amount")
+            )["total"]
+            or Decimal("0"),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("clubs", "0004_financial_hot_path_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="financialyear",
+            name="transaction_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="financialyear",
+            name="participant_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="financialyear",
+            name="total_credit",
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=14),
+        ),
+        migrations.AddField(
+            model_name="financialyear",
+            name="total_debit",
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=14),
+        ),
+        migrations.AddField(
+            model_name="financialyear",
+            name="total_individual_dues",
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=14),
+        ),
+        migrations.RunPython(backfill_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:40
+
+from datetime import date
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+PERIOD_MONTHS = {"monthly": 1, "quarterly": 3, "yearly": 12}
+
+
+def backfill_installments(apps, schema_editor):
+    """
+    Expand the existing contributions into dated installments.
+    """
+    FinancialYearContribution = apps.get_model("clubs", "FinancialYearContribution")
+    DueInstallment = apps.get_model("clubs", "DueInstallment")
+    installments = []
+    for contribution in FinancialYearContribution.objects.select_related(
+        "financial_year"
+    ):
+        financial_year = contribution.financial_year
+        index = (
+            financial_year.start_date.year * 12 + financial_year.start_date.month - 1
+        )
+        due_date = date(index // 12, index % 12 + 1, 1)
+        while due_date <= financial_year.end_date:
+            installments.append(
+                DueInstallment(
+                    financial_year=financial_year,
+                    contribution=contribution,
+                    due_date=due_date,
+                    amount=contribution.amount,
+                )
+            )
+            index += PERIOD_MONTHS[contribution.due_period]
+            due_date = date(index // 12, index % 12 + 1, 1)
+    DueInstallment.objects.bulk_create(installments, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("clubs", "0005_financial_year_running_totals"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DueInstallment",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("due_date", models.DateField()),
+                ("amount", models.DecimalField(decimal_places=2, max_digits=10)),
+                (
+                    "contribution",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="installments",
+                        to="clubs.financialyearcontribution",
+                    ),
+                ),
+                (
+                    "financial_year",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="due_installments",
+                        to="clubs.financialyear",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["financial_year", "due_date"],
+                        name="clubs_installment_fy_date_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_installments, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("clubs", "0006_dueinstallment"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="financialtransaction",
+            index=models.Index(
+                fields=["transaction_date", "id"], name="clubs_txn_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="individualdue",
+            index=models.Index(fields=["due_date", "id"], name="clubs_due_date_idx"),
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def merge_club_level_rows(apps, schema_editor):
+    """
+    Merge duplicate club level snapshot rows, left by deleted members and
+    concurrent inserts, into one row per financial year and month.
+    """
+    MonthlyLedgerSnapshot = apps.get_model("clubs", "MonthlyLedgerSnapshot")
+    duplicates = (
+        MonthlyLedgerSnapshot.objects.filter(club_member__isnull=True)
+        .values("financial_year", "month")
+        .annotate(
+            rows=Count("id"),
+            credit=Sum("credit"),
+            debit=Sum("debit"),
+            individual_due=Sum("individual_due"),
+        )
+        .filter(rows__gt=1)
+        .order_by()
+    )
+    for row in duplicates:
+        snapshots = MonthlyLedgerSnapshot.objects.filter(
+            club_member__isnull=True,
+            financial_year=row["financial_year"],
+            month=row["month"],
+        ).order_by("id")
+        keep = snapshots.first()
+        snapshots.exclude(pk=keep.pk).delete()
+        MonthlyLedgerSnapshot.objects.filter(pk=keep.pk).update(
+            credit=row["credit"],
+            debit=row["debit"],
+            individual_due=row["individual_due"],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("clubs", "0007_admin_date_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_club_level_rows, migrations.RunPython.noop),
+        migrations.AlterUniqueTogether(
+            name="monthlyledgersnapshot",
+            unique_together=set(),
+        ),
+        migrations.AlterField(
+            model_name="monthlyledgersnapshot",
+            name="club_member",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="ledger_snapshots",
+                to="clubs.clubmember",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="monthlyledgersnapshot",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("club_member__isnull", False)),
+                fields=("financial_year", "club_member", "month"),
+                name="clubs_ledger_member_month_uniq",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="monthlyledgersnapshot",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("club_member__isnull", True)),
+                fields=("financial_year", "month"),
+                name="clubs_ledger_club_month_uniq",
+            ),
+        ),
+    ]
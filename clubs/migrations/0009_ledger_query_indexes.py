@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("clubs", "0008_ledger_snapshot_club_level_unique"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="financialtransaction",
+            index=models.Index(
+                fields=["financial_year", "transaction_date", "id"],
+                name="clubs_txn_fy_date_id_idx",
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="financialtransaction",
+            name="clubs_txn_fy_date_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="financialtransaction",
+            name="clubs_txn_fy_member_date_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="individualdue",
+            name="clubs_due_fy_member_date_idx",
+        ),
+    ]
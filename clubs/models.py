@@ -97,6 +97,23 @@ class FinancialYear(BaseTimestampedModel, models.Model):
     start_date = models.DateField()
     end_date = models.DateField()
     is_active = models.BooleanField(default=True)
+    # Running totals kept up to date by clubs.services.ledger, so the summary
+    # cards read this row instead of aggregating the whole year. Only the
+    # ledger writes them, see save().
+    TOTAL_FIELDS = (
+        "transaction_count",
+        "participant_count",
+        "total_credit",
+        "total_debit",
+        "total_individual_dues",
+    )
+    transaction_count = models.PositiveIntegerField(default=0)
+    participant_count = models.PositiveIntegerField(default=0)
+    total_credit = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    total_debit = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    total_individual_dues = models.DecimalField(
+        max_digits=14, decimal_places=2, default=0
+    )
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.PROTECT,
@@ -114,6 +131,27 @@ class FinancialYear(BaseTimestampedModel, models.Model):
     def __str__(self):
         return f"FY {self.start_date}->{self.end_date} for {self.club}"
 
+    def save(self, *args, **kwargs):
+        """
+        Leave the running totals out of updates. The ledger changes them in
+        place with F() expressions, which the values of an instance loaded
+        before would otherwise overwrite.
+        """
+        if (
+            not self._state.adding
+            and not kwargs.get("force_insert")
+            and kwargs.get("update_fields") is None
+        ):
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred
+                and field.name not in self.TOTAL_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
 
 class FinancialYearContribution(BaseTimestampedModel, models.Model):
     """
@@ -143,6 +181,37 @@ class FinancialYearContribution(BaseTimestampedModel, models.Model):
         return f"{self.financial_year} - {self.amount} - {self.due_period}"
 
 
+class DueInstallment(BaseTimestampedModel, models.Model):
+    """
+    One dated installment of a FinancialYearContribution. Every participant of
+    the financial year owes each installment, so the expected due up to a date
+    is a range sum over the installments of the year.
+    """
+
+    financial_year = models.ForeignKey(
+        FinancialYear, on_delete=models.CASCADE, related_name="due_installments"
+    )
+    contribution = models.ForeignKey(
+        FinancialYearContribution,
+        on_delete=models.CASCADE,
+        related_name="installments",
+    )
+    due_date = models.DateField()  # First day of the period
+    amount = models.DecimalField(max_digits=10, decimal_places=2)
+
+    class Meta:
+        indexes = [
+            # Expected due of a financial year up to a date.
+            models.Index(
+                fields=["financial_year", "due_date"],
+                name="clubs_installment_fy_date_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Installment {self.due_date} - {self.amount} - {self.financial_year_id}"
+
+
 class FinancialYearParticipant(BaseTimestampedModel, models.Model):
     """
     Model representing a participant in a financial year.
@@ -199,6 +268,12 @@ class IndividualDue(BaseTimestampedModel, models.Model):
         related_name="updated_individual_dues",
     )
 
+    class Meta:
+        indexes = [
+            # The admin changelist ordered and drilled down by due date.
+            models.Index(fields=["due_date", "id"], name="clubs_due_date_idx"),
+        ]
+
     def __str__(self):
         return f"Due {self.amount} - {self.financial_year} - {self.club_member}"
 
@@ -237,5 +312,68 @@ class FinancialTransaction(BaseTimestampedModel, models.Model):
         related_name="updated_financial_transactions",
     )
 
+    class Meta:
+        indexes = [
+            # The month listing of the report and the (transaction_date, id)
+            # keyset pages of the financial year ledger. Per member totals are
+            # read from MonthlyLedgerSnapshot instead.
+            models.Index(
+                fields=["financial_year", "transaction_date", "id"],
+                name="clubs_txn_fy_date_id_idx",
+            ),
+            # The admin changelist ordered and drilled down by transaction date.
+            models.Index(fields=["transaction_date", "id"], name="clubs_txn_date_idx"),
+        ]
+
     def __str__(self):
         return f"TSN {self.credit} {self.debit} - {self.transaction_date} - {self.financial_year}"
+
+
+class MonthlyLedgerSnapshot(BaseTimestampedModel, models.Model):
+    """
+    Rollup of a club member's credits, debits and individual dues for one month
+    of a financial year. Rows with no club_member hold club level transactions.
+    """
+
+    financial_year = models.ForeignKey(
+        FinancialYear, on_delete=models.CASCADE, related_name="ledger_snapshots"
+    )
+    # A deleted member's credits and debits are folded into the club level
+    # rows first, see clubs.signals.fold_deleted_member_ledger.
+    club_member = models.ForeignKey(
+        ClubMember,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="ledger_snapshots",
+    )
+    month = models.DateField()  # First day of the month
+    credit = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    debit = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    individual_due = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+
+    class Meta:
+        # NULLs never collide in a plain unique constraint, so the club level
+        # rows get one of their own.
+        constraints = [
+            models.UniqueConstraint(
+                fields=["financial_year", "club_member", "month"],
+                condition=models.Q(club_member__isnull=False),
+                name="clubs_ledger_member_month_uniq",
+            ),
+            models.UniqueConstraint(
+                fields=["financial_year", "month"],
+                condition=models.Q(club_member__isnull=True),
+                name="clubs_ledger_club_month_uniq",
+            ),
+        ]
+        indexes = [
+            # Cash-flow totals of one month across all members.
+            models.Index(
+                fields=["financial_year", "month"],
+                name="clubs_ledger_fy_month_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"Ledger {self.month:%Y-%m} - {self.club_member_id} - {self.financial_year_id}"
@@ -0,0 +1,71 @@
+from datetime import date
+
+from django.db import transaction
+
+from clubs.models import (
+    DueInstallment,
+    DuePeriod,
+    FinancialYear,
+    FinancialYearContribution,
+)
+from clubs.services.periods import add_months, month_start
+
+PERIOD_MONTHS = {
+    DuePeriod.MONTHLY: 1,
+    DuePeriod.QUARTERLY: 3,
+    DuePeriod.YEARLY: 12,
+}
+
+
+def installment_dates(financial_year: FinancialYear, due_period: str) -> list[date]:
+    """
+    Return the first day of every ``due_period`` period of a financial year,
+    counted from the month it starts in.
+    """
+    months = PERIOD_MONTHS[DuePeriod(due_period)]
+    dates = []
+    due_date = month_start(financial_year.start_date)
+    while due_date <= financial_year.end_date:
+        dates.append(due_date)
+        due_date = add_months(due_date, months)
+    return dates
+
+
+def schedule_contribution(contribution: FinancialYearContribution) -> int:
+    """
+    Replace the installments of a contribution with one per period of its
+    financial year. Returns the number of installments written.
+    """
+    financial_year = contribution.financial_year
+    with transaction.atomic():
+        DueInstallment.objects.filter(contribution=contribution).delete()
+        installments = DueInstallment.objects.bulk_create(
+            DueInstallment(
+                financial_year=financial_year,
+                contribution=contribution,
+                due_date=due_date,
+                amount=contribution.amount,
+            )
+            for due_date in installment_dates(financial_year, contribution.due_period)
+        )
+    return len(installments)
+
+
+def rebuild_due_schedule(financial_year: FinancialYear) -> int:
+    """
+    Regenerate the installments of every contribution of a financial year.
+    Returns the number of installments written.
+    """
+    with transaction.atomic():
+        DueInstallment.objects.filter(financial_year=financial_year).delete()
+        installments = DueInstallment.objects.bulk_create(
+            DueInstallment(
+                financial_year=financial_year,
+                contribution=contribution,
+                due_date=due_date,
+                amount=contribution.amount,
+            )
+            for contribution in financial_year.contributions.all()
+            for due_date in installment_dates(financial_year, contribution.due_period)
+        )
+    return len(installments)
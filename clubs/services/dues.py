@@ -0,0 +1,120 @@
+from datetime import date
+from decimal import Decimal
+
+from django.db.models import DecimalField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from clubs.models import (
+    DueInstallment,
+    FinancialYear,
+    FinancialYearParticipant,
+    MonthlyLedgerSnapshot,
+)
+from clubs.services.periods import month_range
+
+MONEY_FIELD = DecimalField(max_digits=12, decimal_places=2)
+
+
+def _sum_subquery(queryset, field: str) -> Coalesce:
+    """
+    Wrap a per club_member SUM of ``field`` as a correlated subquery that
+    falls back to 0 when the member has no rows.
+    """
+    total = (
+        queryset.order_by()
+        .values("club_member")
+        .annotate(total=Sum(field))
+        .values("total")
+    )
+    return Coalesce(
+        Subquery(total, output_field=MONEY_FIELD),
+        Value(Decimal("0")),
+        output_field=MONEY_FIELD,
+    )
+
+
+def months_since_start(financial_year: FinancialYear, selected_date: date) -> int:
+    """
+    Return the number of months from the financial year start to the selected
+    date (inclusive).
+    """
+    start = financial_year.start_date
+    return (
+        (selected_date.year - start.year) * 12 + (selected_date.month - start.month) + 1
+    )
+
+
+def participant_balances(financial_year: FinancialYear, month: date) -> list[dict]:
+    """
+    Compute the due, total credit and total debit of every participant of
+    the financial year up to and including the month ``month`` falls in.
+
+    Everything is resolved in a single query: the scheduled due is a range
+    sum over the due installments of every contribution period, and the per
+    member individual due, credit and debit sums are correlated subqueries
+    over the monthly ledger snapshots grouped by club_member, so the query
+    count does not grow with the number of participants and each member
+    costs O(months) snapshot rows instead of their full history.
+    """
+    _, end = month_range(month)
+    scheduled_due = (
+        DueInstallment.objects.filter(financial_year=financial_year, due_date__lt=end)
+        .order_by()
+        .values("financial_year")
+        .annotate(total=Sum("amount"))
+        .values("total")
+    )
+    snapshots = MonthlyLedgerSnapshot.objects.filter(
+        financial_year=financial_year,
+        club_member=OuterRef("club_member"),
+        month__lt=end,
+    )
+    participants = (
+        FinancialYearParticipant.objects.filter(financial_year=financial_year)
+        .annotate(
+            scheduled_due=Coalesce(
+                Subquery(scheduled_due, output_field=MONEY_FIELD),
+                Value(Decimal("0")),
+                output_field=MONEY_FIELD,
+            ),
+            individual_due=_sum_subquery(snapshots, "individual_due"),
+            total_credit=_sum_subquery(snapshots, "credit"),
+            total_debit=_sum_subquery(snapshots, "debit"),
+        )
+        .order_by("id")
+        .values(
+            "club_member_id",
+            "club_member__user__first_name",
+            "club_member__user__last_name",
+            "scheduled_due",
+            "individual_due",
+            "total_credit",
+            "total_debit",
+        )
+    )
+    return [
+        {
+            "club_member_id": row["club_member_id"],
+            "first_name": row["club_member__user__first_name"],
+            "last_name": row["club_member__user__last_name"],
+            "due": row["scheduled_due"] + row["individual_due"],
+            "total_credit": row["total_credit"],
+            "total_debit": row["total_debit"],
+        }
+        for row in participants
+    ]
+
+
+def cash_flow_totals(financial_year: FinancialYear, month: date) -> dict:
+    """
+    Sum the credits and debits of every club member, and of club level
+    transactions, for the month ``month`` falls in.
+    """
+    start, end = month_range(month)
+    totals = MonthlyLedgerSnapshot.objects.filter(
+        financial_year=financial_year, month__gte=start, month__lt=end
+    ).aggregate(total_credit=Sum("credit"), total_debit=Sum("debit"))
+    return {
+        "total_credit": totals["total_credit"] or Decimal("0"),
+        "total_debit": totals["total_debit"] or Decimal("0"),
+    }
@@ -0,0 +1,176 @@
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+from django.db.models import F
+
+from clubs.models import (
+    DueInstallment,
+    FinancialYear,
+    FinancialYearContribution,
+    FinancialYearParticipant,
+    MonthlyLedgerSnapshot,
+)
+from clubs.services.periods import add_months, month_start
+
+
+def _cents(amount: Decimal) -> int:
+    return int(amount * 100)
+
+
+def _month_index(value: date) -> int:
+    return value.year * 12 + value.month - 1
+
+
+@dataclass
+class HypotheticalDue:
+    """
+    An individual due that has not been created yet.
+    """
+
+    club_member_id: int
+    amount: Decimal
+    due_date: date
+
+
+@dataclass
+class Scenario:
+    """
+    Hypothetical changes to simulate: new amounts for existing contributions,
+    keyed by contribution id, and individual dues to add.
+    """
+
+    contribution_amounts: dict[int, Decimal] = field(default_factory=dict)
+    individual_dues: list[HypotheticalDue] = field(default_factory=list)
+
+
+@dataclass
+class LedgerArrays:
+    """
+    The ledger of a financial year as participants x months arrays of cents.
+    ``schedule`` holds the installments of each contribution per month, so a
+    contribution amount can be changed without reloading anything.
+    """
+
+    financial_year: FinancialYear
+    months: list[date]
+    members: list[dict]
+    credit: np.ndarray
+    debit: np.ndarray
+    individual_due: np.ndarray
+    contribution_ids: list[int]
+    contribution_amounts: np.ndarray
+    schedule: np.ndarray
+
+    @property
+    def first_month(self) -> int:
+        return _month_index(self.months[0])
+
+    def month_column(self, value: date) -> int | None:
+        """
+        Column of the month ``value`` falls in, None outside the financial year.
+        """
+        column = _month_index(value) - self.first_month
+        return column if 0 <= column < len(self.months) else None
+
+
+def load_ledger(financial_year: FinancialYear) -> LedgerArrays:
+    """
+    Load the participants, monthly ledger snapshots and due schedule of a
+    financial year into arrays, in four queries.
+    """
+    months = []
+    month = month_start(financial_year.start_date)
+    while month <= financial_year.end_date:
+        months.append(month)
+        month = add_months(month, 1)
+    first_month = _month_index(months[0])
+
+    members = list(
+        FinancialYearParticipant.objects.filter(financial_year=financial_year)
+        .order_by("id")
+        .values(
+            "club_member_id",
+            first_name=F("club_member__user__first_name"),
+            last_name=F("club_member__user__last_name"),
+        )
+    )
+    rows = {member["club_member_id"]: row for row, member in enumerate(members)}
+    shape = (len(members), len(months))
+    credit = np.zeros(shape, dtype=np.int64)
+    debit = np.zeros(shape, dtype=np.int64)
+    individual_due = np.zeros(shape, dtype=np.int64)
+    snapshots = list(
+        MonthlyLedgerSnapshot.objects.filter(
+            financial_year=financial_year, club_member_id__in=list(rows)
+        ).values_list("club_member_id", "month", "credit", "debit", "individual_due")
+    )
+    if snapshots:
+        member_ids, snapshot_months, *amounts = zip(*snapshots)
+        columns = np.array([_month_index(m) for m in snapshot_months]) - first_month
+        inside = (columns >= 0) & (columns < len(months))
+        index = (
+            np.array([rows[pk] for pk in member_ids])[inside],
+            columns[inside],
+        )
+        for target, values in zip((credit, debit, individual_due), amounts):
+            cents = np.array([_cents(value) for value in values], dtype=np.int64)
+            np.add.at(target, index, cents[inside])
+
+    contributions = dict(
+        FinancialYearContribution.objects.filter(financial_year=financial_year)
+        .order_by("id")
+        .values_list("id", "amount")
+    )
+    contribution_rows = {pk: row for row, pk in enumerate(contributions)}
+    schedule = np.zeros((len(contributions), len(months)), dtype=np.int64)
+    installments = DueInstallment.objects.filter(
+        financial_year=financial_year
+    ).values_list("contribution_id", "due_date")
+    for contribution_id, due_date in installments:
+        column = _month_index(due_date) - first_month
+        if 0 <= column < len(months):
+            schedule[contribution_rows[contribution_id], column] += 1
+
+    return LedgerArrays(
+        financial_year=financial_year,
+        months=months,
+        members=members,
+        credit=credit,
+        debit=debit,
+        individual_due=individual_due,
+        contribution_ids=list(contributions),
+        contribution_amounts=np.array(
+            [_cents(amount) for amount in contributions.values()], dtype=np.int64
+        ),
+        schedule=schedule,
+    )
+
+
+def simulate(ledger: LedgerArrays, scenario: Scenario) -> dict:
+    """
+    Apply ``scenario`` to ``ledger`` and return the cumulative due and the
+    balance, credits less debits less due, of every participant at the end of
+    every month, as members x months arrays of cents. Raises ValueError for
+    changes that do not apply to the financial year.
+    """
+    amounts = ledger.contribution_amounts.copy()
+    for contribution_id, amount in scenario.contribution_amounts.items():
+        if contribution_id not in ledger.contribution_ids:
+            raise ValueError(f"Unknown contribution {contribution_id}.")
+        amounts[ledger.contribution_ids.index(contribution_id)] = _cents(amount)
+    individual_due = ledger.individual_due.copy()
+    rows = {member["club_member_id"]: row for row, member in enumerate(ledger.members)}
+    for due in scenario.individual_dues:
+        if due.club_member_id not in rows:
+            raise ValueError(f"Club member {due.club_member_id} is no participant.")
+        column = ledger.month_column(due.due_date)
+        if column is None:
+            raise ValueError(f"{due.due_date} is outside the financial year.")
+        individual_due[rows[due.club_member_id], column] += _cents(due.amount)
+
+    scheduled = np.cumsum(amounts @ ledger.schedule)
+    due = scheduled[np.newaxis, :] + np.cumsum(individual_due, axis=1)
+    paid = np.cumsum(ledger.credit - ledger.debit, axis=1)
+    return {"due": due, "balance": paid - due}
@@ -0,0 +1,282 @@
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncMonth
+
+from clubs.models import (
+    FinancialTransaction,
+    FinancialYear,
+    FinancialYearParticipant,
+    IndividualDue,
+    MonthlyLedgerSnapshot,
+)
+from clubs.services.periods import month_start
+from clubs.services.report_cache import bump_report_version
+
+TOTAL_FIELDS = FinancialYear.TOTAL_FIELDS
+
+
+def apply_to_totals(financial_year_id: int, **amounts) -> None:
+    """
+    Add ``amounts``, keyed by TOTAL_FIELDS name, to the running totals of a
+    financial year in a single UPDATE.
+    """
+    FinancialYear.objects.filter(pk=financial_year_id).update(
+        **{name: F(name) + amount for name, amount in amounts.items() if amount}
+    )
+
+
+def compute_totals(financial_year: FinancialYear) -> dict:
+    """
+    Compute the running totals of a financial year from its source rows.
+    """
+    transactions = FinancialTransaction.objects.filter(
+        financial_year=financial_year
+    ).aggregate(
+        transaction_count=Count("id"),
+        total_credit=Sum("credit"),
+        total_debit=Sum("debit"),
+    )
+    return {
+        "transaction_count": transactions["transaction_count"],
+        "participant_count": FinancialYearParticipant.objects.filter(
+            financial_year=financial_year
+        ).count(),
+        "total_credit": transactions["total_credit"] or Decimal("0"),
+        "total_debit": transactions["total_debit"] or Decimal("0"),
+        "total_individual_dues": IndividualDue.objects.filter(
+            financial_year=financial_year
+        ).aggregate(total=Sum("amount"))["total"]
+        or Decimal("0"),
+    }
+
+
+def reconcile_totals(financial_year: FinancialYear, repair: bool = True) -> dict:
+    """
+    Compare the stored running totals of a financial year with its source
+    rows. Returns {field: (stored, actual)} for every total that drifted and,
+    when ``repair`` is set, overwrites them with the actual values.
+    """
+    with transaction.atomic():
+        stored = (
+            FinancialYear.objects.select_for_update()
+            .filter(pk=financial_year.pk)
+            .values(*TOTAL_FIELDS)
+            .get()
+        )
+        actual = compute_totals(financial_year)
+        drift = {
+            name: (stored[name], actual[name])
+            for name in TOTAL_FIELDS
+            if stored[name] != actual[name]
+        }
+        if drift and repair:
+            FinancialYear.objects.filter(pk=financial_year.pk).update(**actual)
+    if repair:
+        for name in TOTAL_FIELDS:
+            setattr(financial_year, name, actual[name])
+    return drift
+
+
+def apply_to_snapshot(
+    financial_year_id: int,
+    club_member_id: int | None,
+    month: date,
+    credit: Decimal = Decimal("0"),
+    debit: Decimal = Decimal("0"),
+    individual_due: Decimal = Decimal("0"),
+) -> None:
+    """
+    Add the given amounts to the snapshot row of a club member's month,
+    creating the row when it does not exist yet.
+    """
+    with transaction.atomic():
+        snapshot, _ = MonthlyLedgerSnapshot.objects.get_or_create(
+            financial_year_id=financial_year_id,
+            club_member_id=club_member_id,
+            month=month_start(month),
+        )
+        MonthlyLedgerSnapshot.objects.filter(pk=snapshot.pk).update(
+            credit=F("credit") + credit,
+            debit=F("debit") + debit,
+            individual_due=F("individual_due") + individual_due,
+        )
+
+
+def apply_to_snapshots(financial_year_id: int, totals: dict) -> None:
+    """
+    Add many amounts to the snapshot rows of a financial year at once.
+    ``totals`` maps (club_member_id, month) to a dict of credit, debit and
+    individual_due amounts. Existing rows are locked and updated in one batch,
+    missing ones are created in another.
+    """
+    with transaction.atomic():
+        existing = {
+            (snapshot.club_member_id, snapshot.month): snapshot
+            for snapshot in MonthlyLedgerSnapshot.objects.select_for_update().filter(
+                financial_year_id=financial_year_id,
+                month__in={month_start(month) for _, month in totals},
+            )
+        }
+        changed, created = {}, []
+        for (club_member_id, month), amounts in totals.items():
+            key = (club_member_id, month_start(month))
+            snapshot = existing.get(key)
+            if snapshot is None:
+                snapshot = existing[key] = MonthlyLedgerSnapshot(
+                    financial_year_id=financial_year_id,
+                    club_member_id=club_member_id,
+                    month=key[1],
+                )
+                created.append(snapshot)
+            elif snapshot.pk:
+                changed[snapshot.pk] = snapshot
+            for name, amount in amounts.items():
+                setattr(snapshot, name, getattr(snapshot, name) + amount)
+        MonthlyLedgerSnapshot.objects.bulk_update(
+            changed.values(), ["credit", "debit", "individual_due"], batch_size=1000
+        )
+        MonthlyLedgerSnapshot.objects.bulk_create(created, batch_size=1000)
+
+
+def remove_from_snapshot(
+    financial_year_id: int,
+    club_member_id: int | None,
+    month: date,
+    credit: Decimal = Decimal("0"),
+    debit: Decimal = Decimal("0"),
+    individual_due: Decimal = Decimal("0"),
+) -> None:
+    """
+    Subtract the given amounts from the snapshot row of a club member's month.
+    A missing row is left missing, so a snapshot deleted by the same cascade
+    is not recreated.
+    """
+    MonthlyLedgerSnapshot.objects.filter(
+        financial_year_id=financial_year_id,
+        club_member_id=club_member_id,
+        month=month_start(month),
+    ).update(
+        credit=F("credit") - credit,
+        debit=F("debit") - debit,
+        individual_due=F("individual_due") - individual_due,
+    )
+
+
+def fold_member_snapshots(club_member_id: int) -> None:
+    """
+    Add the credits and debits of a club member's snapshot rows to the club
+    level rows of the same months, where their transactions end up once the
+    member is deleted. Individual dues are deleted with the member.
+    """
+    totals = defaultdict(dict)
+    rows = MonthlyLedgerSnapshot.objects.filter(
+        club_member_id=club_member_id
+    ).values_list("financial_year_id", "month", "credit", "debit")
+    for financial_year_id, month, credit, debit in rows:
+        totals[financial_year_id][(None, month)] = {"credit": credit, "debit": debit}
+    for financial_year_id, amounts in totals.items():
+        apply_to_snapshots(financial_year_id, amounts)
+
+
+def ledger_entry(instance) -> tuple[int, tuple | None, dict, dict]:
+    """
+    Return what a FinancialTransaction, IndividualDue or
+    FinancialYearParticipant contributes to the ledger: its financial year
+    id, its snapshot row as (club_member_id, month) or None, the amounts it
+    adds to that row and the amounts it adds to the running totals. Two
+    versions of a row with equal entries need no ledger update.
+    """
+    if isinstance(instance, FinancialTransaction):
+        credit = instance.credit or Decimal("0")
+        debit = instance.debit or Decimal("0")
+        return (
+            instance.financial_year_id,
+            (instance.club_member_id, month_start(instance.transaction_date)),
+            {"credit": credit, "debit": debit},
+            {"transaction_count": 1, "total_credit": credit, "total_debit": debit},
+        )
+    if isinstance(instance, IndividualDue):
+        return (
+            instance.financial_year_id,
+            (instance.club_member_id, month_start(instance.due_date)),
+            {"individual_due": instance.amount},
+            {"total_individual_dues": instance.amount},
+        )
+    return instance.financial_year_id, None, {}, {"participant_count": 1}
+
+
+def record_ledger_row(instance, sign: int = 1) -> None:
+    """
+    Add (``sign`` 1) or remove (``sign`` -1) a FinancialTransaction,
+    IndividualDue or FinancialYearParticipant to or from the ledger snapshot
+    and the running totals of its financial year. Called by the post_save and
+    post_delete signals.
+    """
+    financial_year_id, row, amounts, totals = ledger_entry(instance)
+    with transaction.atomic(savepoint=False):
+        if row is not None and sign > 0:
+            apply_to_snapshot(financial_year_id, *row, **amounts)
+        elif row is not None:
+            remove_from_snapshot(financial_year_id, *row, **amounts)
+        apply_to_totals(
+            financial_year_id,
+            **{name: sign * amount for name, amount in totals.items()},
+        )
+
+
+def rebuild_ledger_snapshots(financial_year: FinancialYear) -> int:
+    """
+    Recompute every snapshot row and the running totals of a financial year
+    from its transactions and individual dues. Returns the number of snapshot
+    rows written.
+    """
+    totals = defaultdict(
+        lambda: {
+            "credit": Decimal("0"),
+            "debit": Decimal("0"),
+            "individual_due": Decimal("0"),
+        }
+    )
+    transaction_rows = (
+        FinancialTransaction.objects.filter(financial_year=financial_year)
+        .annotate(month=TruncMonth("transaction_date"))
+        .values("club_member_id", "month")
+        .annotate(credit=Sum("credit"), debit=Sum("debit"))
+        .order_by()
+    )
+    for row in transaction_rows:
+        key = (row["club_member_id"], row["month"])
+        totals[key]["credit"] += row["credit"] or Decimal("0")
+        totals[key]["debit"] += row["debit"] or Decimal("0")
+    due_rows = (
+        IndividualDue.objects.filter(financial_year=financial_year)
+        .annotate(month=TruncMonth("due_date"))
+        .values("club_member_id", "month")
+        .annotate(amount=Sum("amount"))
+        .order_by()
+    )
+    for row in due_rows:
+        key = (row["club_member_id"], row["month"])
+        totals[key]["individual_due"] += row["amount"] or Decimal("0")
+
+    with transaction.atomic():
+        MonthlyLedgerSnapshot.objects.filter(financial_year=financial_year).delete()
+        MonthlyLedgerSnapshot.objects.bulk_create(
+            [
+                MonthlyLedgerSnapshot(
+                    financial_year=financial_year,
+                    club_member_id=club_member_id,
+                    month=month,
+                    **amounts,
+                )
+                for (club_member_id, month), amounts in totals.items()
+            ],
+            batch_size=1000,
+        )
+        reconcile_totals(financial_year)
+        transaction.on_commit(lambda: bump_report_version(financial_year.id))
+    return len(totals)
@@ -0,0 +1,66 @@
+from datetime import date, datetime
+
+from clubs.models import FinancialYear
+
+
+def month_start(value: date) -> date:
+    """
+    Return the first day of the month ``value`` falls in.
+    """
+    return value.replace(day=1)
+
+
+def month_range(value: date) -> tuple[date, date]:
+    """
+    Return the half-open ``[start, end)`` bounds of the month ``value`` falls
+    in. Filter with ``__gte=start`` and ``__lt=end`` so that the database can
+    use an index range scan on the date column, which ``__month`` and
+    ``__year`` lookups prevent.
+    """
+    start = month_start(value)
+    if start.month == 12:
+        return start, date(start.year + 1, 1, 1)
+    return start, date(start.year, start.month + 1, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    """
+    Return the first day of the month ``months`` months after the month
+    ``value`` falls in.
+    """
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def calendar_years(financial_year: FinancialYear) -> list[int]:
+    """
+    Return the calendar years a financial year spans.
+    """
+    return list(range(financial_year.start_date.year, financial_year.end_date.year + 1))
+
+
+def resolve_month_and_year(
+    selected_month: str | None,
+    selected_year: str | None,
+    financial_year: FinancialYear,
+) -> tuple[int, int]:
+    """
+    Resolve and validate the month and year of a report from request params.
+    Falls back to the current month, in the current year when the financial
+    year spans it and in its last year otherwise.
+    """
+    fy_years = calendar_years(financial_year)
+    current_datetime = datetime.now()
+    default_year = (
+        current_datetime.year
+        if current_datetime.year in fy_years
+        else financial_year.end_date.year
+    )
+    if not selected_month or selected_month not in [str(i) for i in range(1, 13)]:
+        return current_datetime.month, current_datetime.year
+    try:
+        if not selected_year or int(selected_year) not in fy_years:
+            return int(selected_month), default_year
+    except (ValueError, TypeError):
+        return int(selected_month), default_year
+    return int(selected_month), int(selected_year)
@@ -0,0 +1,80 @@
+import time
+from collections.abc import Awaitable, Callable
+from datetime import date
+
+from django.conf import settings
+from django.core.cache import cache
+
+from common.db_router import primary_reads
+
+
+def _version_key(financial_year_id: int) -> str:
+    return f"clubs:report-version:{financial_year_id}"
+
+
+def _report_key(financial_year_id: int, month: date, version: int) -> str:
+    return f"clubs:report:{financial_year_id}:{month:%Y-%m}:{version}"
+
+
+def _new_version() -> int:
+    # Time based so that a version counter evicted from the cache never comes
+    # back with a value that older report entries were stored under.
+    return time.time_ns()
+
+
+def get_report_version(financial_year_id: int) -> int:
+    """
+    Return the current report version of a financial year.
+    """
+    return cache.get_or_set(_version_key(financial_year_id), _new_version, timeout=None)
+
+
+def bump_report_version(financial_year_id: int) -> None:
+    """
+    Invalidate every cached report of a financial year.
+    """
+    try:
+        cache.incr(_version_key(financial_year_id))
+    except ValueError:
+        cache.set(_version_key(financial_year_id), _new_version(), timeout=None)
+
+
+def get_cached_report(financial_year_id: int, month: date, build: Callable) -> dict:
+    """
+    Return the report of a financial year for the month ``month`` falls in,
+    calling ``build`` to compute and store it on a cache miss. Nothing is
+    cached when REPORT_CACHE_TIMEOUT is 0.
+
+    Misses are built from the primary: the next reader after a write is
+    usually not pinned to it, and a report built from a lagging replica would
+    be stored under the new version for the whole timeout.
+    """
+    if not settings.REPORT_CACHE_TIMEOUT:
+        return build()
+    key = _report_key(financial_year_id, month, get_report_version(financial_year_id))
+    report = cache.get(key)
+    if report is None:
+        with primary_reads():
+            report = build()
+        cache.set(key, report, timeout=settings.REPORT_CACHE_TIMEOUT)
+    return report
+
+
+async def aget_cached_report(
+    financial_year_id: int, month: date, build: Callable[[], Awaitable[dict]]
+) -> dict:
+    """
+    Async get_cached_report, ``build`` is a coroutine function.
+    """
+    if not settings.REPORT_CACHE_TIMEOUT:
+        return await build()
+    version = await cache.aget_or_set(
+        _version_key(financial_year_id), _new_version, timeout=None
+    )
+    key = _report_key(financial_year_id, month, version)
+    report = await cache.aget(key)
+    if report is None:
+        with primary_reads():
+            report = await build()
+        await cache.aset(key, report, timeout=settings.REPORT_CACHE_TIMEOUT)
+    return report
@@ -0,0 +1,171 @@
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+
+from clubs.models import (
+    Club,
+    ClubMember,
+    DuePeriod,
+    FinancialTransaction,
+    FinancialYear,
+    FinancialYearContribution,
+    FinancialYearParticipant,
+    IndividualDue,
+)
+from clubs.services.ledger import rebuild_ledger_snapshots
+
+BATCH_SIZE = 5000
+FIRST_YEAR = 2020
+
+
+@dataclass(frozen=True)
+class SyntheticDataSize:
+    """
+    How much data seed_synthetic_data creates. Transactions are per financial
+    year, individual dues are a twentieth of them.
+    """
+
+    clubs: int
+    members: int
+    years: int
+    transactions: int
+
+
+def _chunks(objects, size: int = BATCH_SIZE):
+    """
+    Split an iterable into lists of at most ``size`` items.
+    """
+    chunk = []
+    for obj in objects:
+        chunk.append(obj)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _bulk_create(model, objects) -> None:
+    """
+    bulk_create a generator one batch at a time so it is never held in memory.
+    """
+    for chunk in _chunks(objects):
+        model.objects.bulk_create(chunk)
+
+
+def _seed_financial_year(
+    rng: random.Random,
+    club: Club,
+    start: date,
+    club_members: list[ClubMember],
+    transactions: int,
+) -> FinancialYear:
+    """
+    Create a calendar financial year starting at ``start`` with a monthly
+    contribution, every member as participant, its transactions, individual
+    dues and ledger snapshots.
+    """
+    owner_id = club.created_by_id
+    financial_year = FinancialYear.objects.create(
+        club=club,
+        start_date=start,
+        end_date=date(start.year, 12, 31),
+        created_by_id=owner_id,
+        updated_by_id=owner_id,
+    )
+    FinancialYearContribution.objects.create(
+        financial_year=financial_year,
+        amount=Decimal("50000"),
+        due_period=DuePeriod.MONTHLY,
+        created_by_id=owner_id,
+        updated_by_id=owner_id,
+    )
+    FinancialYearParticipant.objects.bulk_create(
+        FinancialYearParticipant(
+            financial_year=financial_year,
+            club_member=club_member,
+            created_by_id=owner_id,
+            updated_by_id=owner_id,
+        )
+        for club_member in club_members
+    )
+    days = (financial_year.end_date - start).days + 1
+    _bulk_create(
+        FinancialTransaction,
+        (
+            FinancialTransaction(
+                financial_year=financial_year,
+                club_member=rng.choice(club_members) if credit else None,
+                credit=Decimal(rng.randrange(1000, 100000)) if credit else None,
+                debit=None if credit else Decimal(rng.randrange(1000, 100000)),
+                transaction_date=start + timedelta(days=rng.randrange(days)),
+                description="Contribution" if credit else "Expense",
+                created_by_id=owner_id,
+                updated_by_id=owner_id,
+            )
+            for credit in (rng.random() < 0.9 for _ in range(transactions))
+        ),
+    )
+    _bulk_create(
+        IndividualDue,
+        (
+            IndividualDue(
+                financial_year=financial_year,
+                club_member=rng.choice(club_members),
+                amount=Decimal(rng.randrange(1000, 10000)),
+                due_date=start + timedelta(days=rng.randrange(days)),
+                description="Fine",
+                created_by_id=owner_id,
+                updated_by_id=owner_id,
+            )
+            for _ in range(transactions // 20)
+        ),
+    )
+    rebuild_ledger_snapshots(financial_year)
+    return financial_year
+
+
+def seed_synthetic_data(size: SyntheticDataSize, seed: int = 42) -> list[Club]:
+    """
+    Create ``size.clubs`` clubs with ``size.members`` members each and
+    ``size.years`` financial years of ``size.transactions`` transactions, with
+    bulk_create and a deterministic random seed. The first member of each club
+    is its creator and admin. Returns the clubs.
+    """
+    rng = random.Random(seed)
+    User = get_user_model()
+    suffix = User.objects.count()
+    clubs = []
+    for club_index in range(size.clubs):
+        users = User.objects.bulk_create(
+            User(
+                email=f"member{member_index}.club{club_index}.{suffix}@example.com",
+                first_name=f"Member{member_index}",
+                last_name=f"Club{club_index}",
+            )
+            for member_index in range(size.members)
+        )
+        owner = users[0]
+        club = Club.objects.create(
+            name=f"Synthetic Club {club_index} ({suffix})",
+            description="Synthetic data",
+            contact_email=owner.email,
+            created_by=owner,
+            updated_by=owner,
+        )
+        club_members = ClubMember.objects.bulk_create(
+            ClubMember(user=user, club=club, is_admin=user == owner) for user in users
+        )
+        for year in range(size.years):
+            _seed_financial_year(
+                rng,
+                club,
+                date(FIRST_YEAR + year, 1, 1),
+                club_members,
+                size.transactions,
+            )
+        clubs.append(club)
+    return clubs
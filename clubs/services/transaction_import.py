@@ -0,0 +1,163 @@
+import csv
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal
+from itertools import islice
+from typing import TextIO
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from clubs.models import FinancialTransaction, FinancialYear, FinancialYearParticipant
+from clubs.services.ledger import apply_to_snapshots, apply_to_totals
+from clubs.services.periods import month_start
+from clubs.services.report_cache import bump_report_version
+
+IMPORT_COLUMNS = ("transaction_date", "description", "credit", "debit", "member_email")
+IMPORT_CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+
+
+@dataclass
+class ImportResult:
+    """
+    Outcome of a transaction import. Only the first MAX_REPORTED_ERRORS errors
+    are kept, error_count holds the total.
+    """
+
+    created: int = 0
+    error_count: int = 0
+    errors: list[tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """
+        True when no row failed validation.
+        """
+        return self.error_count == 0
+
+    def add_error(self, line: int, message: str) -> None:
+        """
+        Record the error of a CSV line.
+        """
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((line, message))
+
+
+def _clean(name: str, value):
+    """
+    Convert a CSV cell with the validation of the FinancialTransaction field.
+    """
+    model_field = FinancialTransaction._meta.get_field(name)
+    if value == "" and model_field.null:
+        value = None
+    return model_field.clean(value, None)
+
+
+def _build_transaction(
+    row: dict, financial_year: FinancialYear, members: dict, user
+) -> FinancialTransaction:
+    """
+    Validate one CSV row and return the unsaved FinancialTransaction for it.
+    Raises ValidationError with every problem found on the row.
+    """
+    values = {}
+    errors = []
+    for name in ("transaction_date", "description", "credit", "debit"):
+        try:
+            values[name] = _clean(name, (row.get(name) or "").strip())
+        except ValidationError as error:
+            errors.append(f"{name}: {' '.join(error.messages)}")
+    if "credit" in values and "debit" in values:
+        if values["credit"] is None and values["debit"] is None:
+            errors.append("Either credit or debit is required.")
+    transaction_date = values.get("transaction_date")
+    if transaction_date and not (
+        financial_year.start_date <= transaction_date <= financial_year.end_date
+    ):
+        errors.append("transaction_date: Outside the financial year.")
+    email = (row.get("member_email") or "").strip().lower()
+    club_member_id = None
+    if email:
+        club_member_id = members.get(email)
+        if club_member_id is None:
+            errors.append(
+                f"member_email: {email} is not a participant of this financial year."
+            )
+    if errors:
+        raise ValidationError(errors)
+    return FinancialTransaction(
+        financial_year=financial_year,
+        club_member_id=club_member_id,
+        created_by=user,
+        updated_by=user,
+        **values,
+    )
+
+
+def import_transactions(
+    financial_year: FinancialYear,
+    csv_file: TextIO,
+    user,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+) -> ImportResult:
+    """
+    Stream FinancialTransactions from a CSV with the IMPORT_COLUMNS header into
+    a financial year. Rows are validated and inserted with bulk_create one
+    chunk at a time, so memory use does not grow with the file.
+
+    The import is all or nothing: when any row is invalid the whole file is
+    still validated to report its errors, and nothing is saved.
+    """
+    result = ImportResult()
+    reader = csv.DictReader(csv_file)
+    members = {
+        email.lower(): club_member_id
+        for email, club_member_id in FinancialYearParticipant.objects.filter(
+            financial_year=financial_year
+        ).values_list("club_member__user__email", "club_member_id")
+    }
+    totals = defaultdict(lambda: {"credit": Decimal("0"), "debit": Decimal("0")})
+
+    with transaction.atomic():
+        try:
+            missing = set(IMPORT_COLUMNS) - set(reader.fieldnames or ())
+            if missing:
+                result.add_error(1, f"Missing columns: {', '.join(sorted(missing))}.")
+                return result
+            rows = ((reader.line_num, row) for row in reader)
+            while chunk := list(islice(rows, chunk_size)):
+                objects = []
+                for line, row in chunk:
+                    try:
+                        objects.append(
+                            _build_transaction(row, financial_year, members, user)
+                        )
+                    except ValidationError as error:
+                        result.add_error(line, " ".join(error.messages))
+                if not result.ok:
+                    continue
+                FinancialTransaction.objects.bulk_create(objects)
+                result.created += len(objects)
+                for obj in objects:
+                    key = (obj.club_member_id, month_start(obj.transaction_date))
+                    totals[key]["credit"] += obj.credit or Decimal("0")
+                    totals[key]["debit"] += obj.debit or Decimal("0")
+        except (csv.Error, UnicodeDecodeError) as error:
+            result.add_error(reader.line_num, f"Unreadable file: {error}")
+
+        if not result.ok:
+            transaction.set_rollback(True)
+            result.created = 0
+            return result
+        # bulk_create sends no post_save signals to update the ledger.
+        apply_to_snapshots(financial_year.id, totals)
+        apply_to_totals(
+            financial_year.id,
+            transaction_count=result.created,
+            total_credit=sum(amounts["credit"] for amounts in totals.values()),
+            total_debit=sum(amounts["debit"] for amounts in totals.values()),
+        )
+        transaction.on_commit(lambda: bump_report_version(financial_year.id))
+    return result
@@ -0,0 +1,129 @@
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+
+from clubs.models import (
+    Club,
+    ClubMember,
+    FinancialTransaction,
+    FinancialYear,
+    FinancialYearContribution,
+    FinancialYearParticipant,
+    IndividualDue,
+)
+from clubs.services.due_schedule import rebuild_due_schedule, schedule_contribution
+from clubs.services.ledger import (
+    fold_member_snapshots,
+    ledger_entry,
+    record_ledger_row,
+)
+from clubs.services.report_cache import bump_report_version
+
+# Source rows of the ledger snapshots and the FinancialYear running totals.
+# QuerySet.update() and bulk_create() send no signals: their callers update
+# the ledger themselves, and reconcile_financial_year_totals and
+# rebuild_ledger_snapshots repair anything that slipped through.
+LEDGER_MODELS = (FinancialTransaction, IndividualDue, FinancialYearParticipant)
+
+
+def invalidate_financial_year_reports(sender, instance, **kwargs):
+    """
+    Bump the report version of the financial year a report source row belongs
+    to, once the write has been committed.
+    """
+    financial_year_id = instance.financial_year_id
+    transaction.on_commit(lambda: bump_report_version(financial_year_id))
+
+
+def remember_ledger_row(sender, instance, **kwargs):
+    """
+    Load the stored version of a ledger row about to be updated, so its old
+    amounts can be taken out of the ledger once the new ones are saved.
+    """
+    if not instance._state.adding and instance.pk is not None:
+        instance._ledger_previous = sender.objects.filter(pk=instance.pk).first()
+
+
+def record_saved_ledger_row(sender, instance, created, **kwargs):
+    """
+    Move a saved ledger row from its old to its new snapshot month, member
+    and amounts, in the transaction of the save.
+    """
+    previous = instance.__dict__.pop("_ledger_previous", None)
+    if previous is not None and ledger_entry(previous) == ledger_entry(instance):
+        return
+    with transaction.atomic(savepoint=False):
+        if previous is not None:
+            record_ledger_row(previous, -1)
+        record_ledger_row(instance)
+    if (
+        previous is not None
+        and previous.financial_year_id != instance.financial_year_id
+    ):
+        invalidate_financial_year_reports(sender, previous)
+
+
+def _deleting_ledger(origin) -> bool:
+    """
+    Whether a delete started from a club or financial year, whose snapshots
+    and totals are deleted with it.
+    """
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return origin_model in (Club, FinancialYear)
+
+
+def record_deleted_ledger_row(sender, instance, origin=None, **kwargs):
+    """
+    Take a deleted ledger row out of the ledger, unless its whole ledger is
+    being deleted.
+    """
+    if not _deleting_ledger(origin):
+        record_ledger_row(instance, -1)
+
+
+def fold_deleted_member_ledger(sender, instance, origin=None, **kwargs):
+    """
+    Move the credits and debits of a club member about to be deleted to the
+    club level snapshot rows, as their transactions become club level ones.
+    Their own snapshot rows are then deleted by the cascade.
+    """
+    if not _deleting_ledger(origin):
+        fold_member_snapshots(instance.pk)
+
+
+def schedule_saved_contribution(sender, instance, **kwargs):
+    """
+    Regenerate the installments of a contribution when it is saved. Deleting
+    a contribution cascades to its installments.
+    """
+    schedule_contribution(instance)
+
+
+def reschedule_financial_year(sender, instance, created, **kwargs):
+    """
+    Regenerate the installments of a financial year when its dates may have
+    changed.
+    """
+    if not created:
+        rebuild_due_schedule(instance)
+        transaction.on_commit(lambda: bump_report_version(instance.id))
+
+
+for model in LEDGER_MODELS:
+    pre_save.connect(remember_ledger_row, sender=model)
+    post_save.connect(record_saved_ledger_row, sender=model)
+    post_delete.connect(record_deleted_ledger_row, sender=model)
+
+pre_delete.connect(fold_deleted_member_ledger, sender=ClubMember)
+
+post_save.connect(schedule_saved_contribution, sender=FinancialYearContribution)
+post_save.connect(reschedule_financial_year, sender=FinancialYear)
+
+for model in (
+    FinancialTransaction,
+    IndividualDue,
+    FinancialYearContribution,
+    FinancialYearParticipant,
+):
+    post_save.connect(invalidate_financial_year_reports, sender=model)
+    post_delete.connect(invalidate_financial_year_reports, sender=model)
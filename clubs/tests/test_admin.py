@@ -0,0 +1,193 @@
+from datetime import date
+from decimal import Decimal
+from http import HTTPStatus
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.models import CustomUser as User
+from clubs.models import (
+    Club,
+    ClubMember,
+    FinancialTransaction,
+    FinancialYear,
+    FinancialYearParticipant,
+    IndividualDue,
+)
+from clubs.services.dues import cash_flow_totals
+from clubs.services.ledger import reconcile_totals
+
+CHANGELISTS = (
+    "clubmember",
+    "financialyear",
+    "financialyearparticipant",
+    "individualdue",
+    "financialtransaction",
+)
+
+
+class TestClubsAdmin(TestCase):
+    """
+    Test case for the admin changelists of the clubs models.
+    """
+
+    def setUp(self):
+        """
+        Set up a superuser and a financial year.
+        """
+        self.user = User.objects.create_superuser(
+            email="admin@example.com", password="testPass123"
+        )
+        self.club = Club.objects.create(
+            name="Investment Club",
+            description="A club for investment enthusiasts.",
+            contact_email=self.user.email,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.financial_year = FinancialYear.objects.create(
+            club=self.club,
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 12, 31),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.client.force_login(self.user)
+        self.members = 0
+
+    def add_member_rows(self):
+        """
+        Add a club member with a participation, a transaction and a due.
+        """
+        self.members += 1
+        club_member = ClubMember.objects.create(
+            user=User.objects.create(email=f"member{self.members}@example.com"),
+            club=self.club,
+        )
+        FinancialYearParticipant.objects.create(
+            financial_year=self.financial_year,
+            club_member=club_member,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        FinancialTransaction.objects.create(
+            financial_year=self.financial_year,
+            club_member=club_member,
+            credit=Decimal("100"),
+            transaction_date=date(2023, 2, self.members),
+            description="Contribution",
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        IndividualDue.objects.create(
+            financial_year=self.financial_year,
+            club_member=club_member,
+            description="Late fine",
+            amount=Decimal("20"),
+            due_date=date(2023, 3, self.members),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+
+    def count_changelist_queries(self, model: str) -> int:
+        """
+        Render the changelist of ``model`` and return its query count.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse(f"admin:clubs_{model}_changelist"))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        return len(queries)
+
+    def test_changelist_queries_do_not_grow_with_rows(self):
+        """
+        Every changelist makes the same number of queries for one and for
+        many rows.
+        """
+        self.add_member_rows()
+        single = {model: self.count_changelist_queries(model) for model in CHANGELISTS}
+        for _ in range(10):
+            self.add_member_rows()
+        many = {model: self.count_changelist_queries(model) for model in CHANGELISTS}
+        self.assertEqual(single, many)
+
+    def test_changelist_skips_full_count(self):
+        """
+        Filtered changelists do not count the unfiltered table.
+        """
+        self.add_member_rows()
+        response = self.client.get(
+            reverse("admin:clubs_financialtransaction_changelist"),
+            {"transaction_date__year": "2023"},
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertIsNone(response.context["cl"].full_result_count)
+
+    def test_autocomplete_club_members(self):
+        """
+        Club members can be picked with the autocomplete widget.
+        """
+        self.add_member_rows()
+        response = self.client.get(
+            reverse("admin:autocomplete"),
+            {
+                "term": "member1",
+                "app_label": "clubs",
+                "model_name": "financialtransaction",
+                "field_name": "club_member",
+            },
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(len(response.json()["results"]), 1)
+
+    def test_change_and_delete_keep_ledger_in_sync(self):
+        """
+        Editing a transaction and bulk deleting rows in the admin update the
+        reports and the running totals.
+        """
+        self.add_member_rows()
+        financial_transaction = FinancialTransaction.objects.get()
+        response = self.client.post(
+            reverse(
+                "admin:clubs_financialtransaction_change",
+                args=[financial_transaction.id],
+            ),
+            {
+                "financial_year": self.financial_year.id,
+                "club_member": financial_transaction.club_member_id,
+                "credit": "5000.00",
+                "debit": "",
+                "transaction_date": "2023-02-01",
+                "description": "Contribution",
+                "created_by": self.user.id,
+                "updated_by": self.user.id,
+            },
+        )
+        self.assertEqual(response.status_code, HTTPStatus.FOUND)
+        self.assertEqual(
+            cash_flow_totals(self.financial_year, date(2023, 2, 1))["total_credit"],
+            Decimal("5000"),
+        )
+        self.assertEqual(reconcile_totals(self.financial_year, repair=False), {})
+
+        for model in (FinancialTransaction, IndividualDue):
+            response = self.client.post(
+                reverse(f"admin:clubs_{model._meta.model_name}_changelist"),
+                {
+                    "action": "delete_selected",
+                    "_selected_action": list(
+                        model.objects.values_list("pk", flat=True)
+                    ),
+                    "post": "yes",
+                },
+            )
+            self.assertEqual(response.status_code, HTTPStatus.FOUND)
+        self.assertEqual(
+            cash_flow_totals(self.financial_year, date(2023, 2, 1))["total_credit"],
+            Decimal("0"),
+        )
+        self.assertEqual(reconcile_totals(self.financial_year, repair=False), {})
+        self.financial_year.refresh_from_db()
+        self.assertEqual(self.financial_year.transaction_count, 0)
+        self.assertEqual(self.financial_year.total_individual_dues, Decimal("0"))
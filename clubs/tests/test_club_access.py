@@ -0,0 +1,80 @@
+from datetime import date
+
+from django.test import RequestFactory, TestCase
+
+from accounts.models import CustomUser as User
+from clubs.models import Club, ClubMember, FinancialYear
+from clubs.views.utils import get_club_access
+
+
+class TestGetClubAccess(TestCase):
+    """
+    Test case for the request scoped club access resolver.
+    """
+
+    def setUp(self):
+        """
+        Set up a club with an admin member and a financial year.
+        """
+        self.user = User.objects.create_user(
+            email="jane.doe@example.com", password="testPass123"
+        )
+        self.club = Club.objects.create(
+            name="Investment Club",
+            description="A club for investment enthusiasts.",
+            contact_email=self.user.email,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.club_member = ClubMember.objects.create(
+            user=self.user, club=self.club, is_admin=True
+        )
+        self.financial_year = FinancialYear.objects.create(
+            club=self.club,
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 12, 31),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+
+    def make_request(self, user):
+        """
+        Build a GET request made by ``user``.
+        """
+        request = RequestFactory().get("/")
+        request.user = user
+        return request
+
+    def test_loads_everything_in_one_memoized_query(self):
+        """
+        Club, membership and financial year come from one query per request.
+        """
+        request = self.make_request(self.user)
+        with self.assertNumQueries(1):
+            access = get_club_access(request, self.club.id, self.financial_year.id)
+            again = get_club_access(request, self.club.id, self.financial_year.id)
+        self.assertIs(access, again)
+        self.assertEqual(access.club, self.club)
+        self.assertEqual(access.member, self.club_member)
+        self.assertEqual(access.financial_year, self.financial_year)
+        self.assertEqual(access.financial_year.end_date, date(2023, 12, 31))
+        self.assertTrue(access.is_admin)
+
+    def test_non_member(self):
+        """
+        Users outside the club get an access object without a member row.
+        """
+        outsider = User.objects.create_user(email="outsider@example.com")
+        access = get_club_access(self.make_request(outsider), self.club.id)
+        self.assertIsNone(access.member)
+        self.assertFalse(access.can_view)
+        self.assertFalse(access.is_admin)
+
+    def test_financial_year_of_another_club(self):
+        """
+        A financial year outside the club is reported as missing.
+        """
+        with self.assertRaises(FinancialYear.DoesNotExist):
+            get_club_access(
+                self.make_request(self.user), self.club.id, self.financial_year.id + 1
+            )
@@ -0,0 +1,166 @@
+import csv
+from datetime import date
+from decimal import Decimal
+from http import HTTPStatus
+
+from django.test import TestCase
+from django.urls import reverse
+
+from accounts.models import CustomUser as User
+from clubs.models import (
+    Club,
+    ClubMember,
+    FinancialTransaction,
+    FinancialYear,
+    FinancialYearContribution,
+    FinancialYearParticipant,
+    IndividualDue,
+)
+
+
+class TestFinancialYearExportViews(TestCase):
+    """
+    Test case for the streaming CSV exports of a financial year.
+    """
+
+    def setUp(self):
+        """
+        Set up a financial year with one participant, a transaction and a due.
+        """
+        self.user = User.objects.create_user(
+            email="jane.doe@example.com",
+            password="testPass123",
+            first_name="Jane",
+            last_name="Doe",
+        )
+        self.club = Club.objects.create(
+            name="Investment Club",
+            description="A club for investment enthusiasts.",
+            contact_email=self.user.email,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.financial_year = FinancialYear.objects.create(
+            club=self.club,
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 12, 31),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        club_member = ClubMember.objects.create(user=self.user, club=self.club)
+        FinancialYearParticipant.objects.create(
+            financial_year=self.financial_year,
+            club_member=club_member,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        FinancialYearContribution.objects.create(
+            financial_year=self.financial_year,
+            amount=Decimal("1000"),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        FinancialTransaction.objects.create(
+            financial_year=self.financial_year,
+            club_member=club_member,
+            credit=Decimal("1500"),
+            transaction_date=date(2023, 1, 10),
+            description="Contribution",
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        IndividualDue.objects.create(
+            financial_year=self.financial_year,
+            club_member=club_member,
+            description="Late fine",
+            amount=Decimal("200"),
+            due_date=date(2023, 1, 20),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+
+    def download(self, name: str, data=None) -> list[list[str]]:
+        """
+        Log in, download an export and parse its rows.
+        """
+        self.client.login(email=self.user.email, password="testPass123")
+        response = self.client.get(
+            reverse(name, args=[self.club.id, self.financial_year.id]), data
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertTrue(response.streaming)
+        self.assertIn("attachment", response["Content-Disposition"])
+        content = b"".join(response.streaming_content).decode()
+        return list(csv.reader(content.splitlines()))
+
+    def test_export_transactions(self):
+        """
+        Transactions are exported in the transaction import format.
+        """
+        rows = self.download("clubs:export-transactions")
+        self.assertEqual(
+            rows,
+            [
+                [
+                    "transaction_date",
+                    "description",
+                    "credit",
+                    "debit",
+                    "member_email",
+                    "member_name",
+                ],
+                [
+                    "2023-01-10",
+                    "Contribution",
+                    "1500.00",
+                    "",
+                    "jane.doe@example.com",
+                    "Jane Doe",
+                ],
+            ],
+        )
+
+    def test_export_individual_dues(self):
+        """
+        Individual dues are exported with their member.
+        """
+        rows = self.download("clubs:export-individual-dues")
+        self.assertEqual(
+            rows[1],
+            ["2023-01-20", "Late fine", "200.00", "jane.doe@example.com", "Jane Doe"],
+        )
+
+    def test_export_participant_balances(self):
+        """
+        Participant balances are exported up to the selected month.
+        """
+        rows = self.download(
+            "clubs:export-participant-balances", {"month": "1", "year": "2023"}
+        )
+        self.assertEqual(rows[0], ["member_name", "due", "total_credit", "total_debit"])
+        self.assertEqual([row[0] for row in rows[1:]], ["Jane Doe"])
+        self.assertEqual(Decimal(rows[1][1]), Decimal("1200"))
+        self.assertEqual(Decimal(rows[1][2]), Decimal("1500"))
+
+    def test_export_escapes_formulas(self):
+        """
+        Text that a spreadsheet would evaluate as a formula is quoted.
+        """
+        FinancialTransaction.objects.update(description="=HYPERLINK(1)")
+        rows = self.download("clubs:export-transactions")
+        self.assertEqual(rows[1][1], "'=HYPERLINK(1)")
+        self.assertEqual(rows[1][2], "1500.00")
+
+    def test_export_forbidden_for_non_members(self):
+        """
+        Users outside the club cannot download exports.
+        """
+        User.objects.create_user(email="outsider@example.com", password="testPass123")
+        self.client.login(email="outsider@example.com", password="testPass123")
+        response = self.client.get(
+            reverse(
+                "clubs:export-transactions",
+                args=[self.club.id, self.financial_year.id],
+            )
+        )
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
@@ -0,0 +1,99 @@
+from datetime import date
+
+from django.test import TestCase
+
+from accounts.models import CustomUser as User
+from clubs.forms.club_financials_forms import (
+    FinancialTransactionForm,
+    FinancialYearParticipantForm,
+    IndividualDueForm,
+)
+from clubs.models import Club, ClubMember, FinancialYear, FinancialYearParticipant
+
+
+class TestClubMemberFormFields(TestCase):
+    """
+    Test case for the club scoped club_member fields of the financial forms.
+    """
+
+    def setUp(self):
+        """
+        Set up two clubs; only one of the club's two members participates.
+        """
+        self.user = User.objects.create_user(
+            email="jane.doe@example.com", first_name="Jane", last_name="Doe"
+        )
+        other_user = User.objects.create_user(
+            email="cindy@example.com", first_name="Cindy"
+        )
+        self.club = Club.objects.create(
+            name="Investment Club",
+            description="A club for investment enthusiasts.",
+            contact_email=self.user.email,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        other_club = Club.objects.create(
+            name="Other Club",
+            description="Another club.",
+            contact_email=self.user.email,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.financial_year = FinancialYear.objects.create(
+            club=self.club,
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 12, 31),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.participant = ClubMember.objects.create(user=self.user, club=self.club)
+        self.member = ClubMember.objects.create(user=other_user, club=self.club)
+        self.outsider = ClubMember.objects.create(user=self.user, club=other_club)
+        FinancialYearParticipant.objects.create(
+            financial_year=self.financial_year,
+            club_member=self.participant,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+
+    def choices(self, form) -> list[str]:
+        """
+        Return the labels of the club_member options of a form.
+        """
+        return [label for _, label in form.fields["club_member"].choices][1:]
+
+    def test_forms_share_one_query(self):
+        """
+        The options of all three forms come from a single query.
+        """
+        with self.assertNumQueries(1):
+            forms = [
+                form_class(club=self.club, financial_year=self.financial_year)
+                for form_class in (
+                    FinancialTransactionForm,
+                    FinancialYearParticipantForm,
+                    IndividualDueForm,
+                )
+            ]
+            choices = [self.choices(form) for form in forms]
+            for form in forms:
+                form.as_p()
+        self.assertEqual(choices, [["Cindy", "Jane Doe"], ["Cindy"], ["Jane Doe"]])
+
+    def test_rejects_members_outside_the_choices(self):
+        """
+        Posted members are validated against the restricted querysets.
+        """
+        data = {"description": "Fine", "amount": "100", "due_date": "2023-02-01"}
+        for club_member, valid in (
+            (self.participant, True),
+            (self.member, False),
+            (self.outsider, False),
+        ):
+            form = IndividualDueForm(
+                {**data, "club_member": club_member.id},
+                club=self.club,
+                financial_year=self.financial_year,
+            )
+            self.assertEqual(form.is_valid(), valid)
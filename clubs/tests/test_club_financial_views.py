@@ -1,6 +1,10 @@
+from datetime import date
 from http import HTTPStatus
+from unittest import mock
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from accounts.models import CustomUser as User
@@ -8,6 +12,7 @@ from clubs.models import (
     Club,
     ClubMember,
     DuePeriod,
+    FinancialTransaction,
     FinancialYear,
     FinancialYearContribution,
     FinancialYearParticipant,
@@ -251,6 +256,33 @@ class TestClubFinancialYearDetailView(TestCase):
         self.assertIn("club", response.context)
         self.assertIn("financial_year", response.context)
 
+    def test_financial_year_detail_view_paginates_transactions(self):
+        """
+        The transaction table is paginated while the stat card counts every row.
+        """
+        for day in range(1, 4):
+            FinancialTransaction.objects.create(
+                financial_year=self.financial_year,
+                credit=1000,
+                transaction_date=date(2023, 5, day),
+                description="Contribution",
+                created_by=self.user,
+                updated_by=self.user,
+            )
+        self.client.login(email=self.user.email, password="testPass123")
+        url = reverse(
+            "clubs:financial-year-detail",
+            args=[self.club.id, self.financial_year.id],
+        )
+        with mock.patch("clubs.views.club_financial_view.TRANSACTIONS_PAGE_SIZE", 2):
+            response = self.client.get(url)
+            self.assertEqual(len(response.context["transactions"]), 2)
+            self.assertEqual(response.context["transaction_count"], 3)
+            next_cursor = response.context["transaction_page"].next_cursor
+            response = self.client.get(url, {"after": next_cursor})
+        self.assertEqual(len(response.context["transactions"]), 1)
+        self.assertIsNone(response.context["transaction_page"].next_cursor)
+
     def test_financial_year_detail_view_not_found(self):
         """
         Test accessing a non-existent financial year detail view.
@@ -656,3 +688,130 @@ class TestFinancialYearParticipantCreateView(TestCase):
         response = self.client.post(url, {"club_member": member_to_add.id})
         self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
         self.assertTemplateUsed(response, "clubs/403.html")
+
+
+class TestFinancialYearCreateFragments(TestCase):
+    """
+    Test case for the X-Fragment responses of the financial year create views.
+    """
+
+    def setUp(self):
+        """
+        Set up a financial year administered by the logged in user.
+        """
+        self.user = User.objects.create_user(
+            email="jane.doe@example.com",
+            password="testPass123",
+            first_name="Jane",
+            last_name="Doe",
+        )
+        self.club = Club.objects.create(
+            name="Investment Club",
+            description="A club for investment enthusiasts.",
+            contact_email=self.user.email,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.financial_year = FinancialYear.objects.create(
+            club=self.club,
+            start_date="2023-01-01",
+            end_date="2023-12-31",
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.club_member = ClubMember.objects.create(
+            user=self.user, club=self.club, is_admin=True
+        )
+        self.client.login(email=self.user.email, password="testPass123")
+
+    def post_fragment(self, url_name: str, data: dict):
+        return self.client.post(
+            reverse(url_name, args=[self.club.id, self.financial_year.id]),
+            data,
+            headers={"X-Fragment": "true"},
+        )
+
+    def test_transaction_fragment(self):
+        """
+        A new transaction returns its row and the updated stat cards only.
+        """
+        response = self.post_fragment(
+            "clubs:financial-transaction",
+            {
+                "club_member": self.club_member.id,
+                "credit": "10000.00",
+                "transaction_date": "2023-06-15",
+                "description": "Membership fee",
+            },
+        )
+        self.assertEqual(response.status_code, HTTPStatus.CREATED)
+        self.assertTemplateNotUsed(response, "clubs/financial_year_detail.html")
+        self.assertContains(response, "Membership fee", status_code=HTTPStatus.CREATED)
+        self.assertContains(
+            response, 'data-si-rows="transactions"', status_code=HTTPStatus.CREATED
+        )
+        self.assertEqual(response.context["transaction_count"], 1)
+        self.assertEqual(response.context["total_credit"], 10000)
+
+    def test_participant_fragment(self):
+        """
+        A new participant returns its row and the new participant count.
+        """
+        response = self.post_fragment(
+            "clubs:financial-year-participant", {"club_member": self.club_member.id}
+        )
+        self.assertContains(response, self.user.email, status_code=HTTPStatus.CREATED)
+        self.assertEqual(response.context["participant_count"], 1)
+
+    def test_due_fragment(self):
+        """
+        A new due returns its row without the stat cards.
+        """
+        response = self.post_fragment(
+            "clubs:financial-year-due",
+            {"amount": "50000", "due_period": DuePeriod.MONTHLY.value},
+        )
+        self.assertContains(response, "Ugx 50000", status_code=HTTPStatus.CREATED)
+        self.assertNotContains(
+            response, "data-si-stats", status_code=HTTPStatus.CREATED
+        )
+
+    def test_individual_due_fragment_skips_page_rebuild(self):
+        """
+        The fragment makes fewer queries than re-rendering the page.
+        """
+        FinancialYearParticipant.objects.create(
+            financial_year=self.financial_year,
+            club_member=self.club_member,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        data = {
+            "club_member": self.club_member.id,
+            "amount": "2000",
+            "due_date": "2023-03-01",
+            "description": "Late fee",
+        }
+        url = reverse(
+            "clubs:financial-year-individual-due",
+            args=[self.club.id, self.financial_year.id],
+        )
+        with CaptureQueriesContext(connection) as page_queries:
+            self.client.post(url, data)
+        with CaptureQueriesContext(connection) as fragment_queries:
+            response = self.post_fragment("clubs:financial-year-individual-due", data)
+        self.assertContains(response, "Late fee", status_code=HTTPStatus.CREATED)
+        self.assertLess(len(fragment_queries), len(page_queries))
+
+    def test_invalid_form_returns_errors(self):
+        """
+        An invalid form returns its errors with a 400.
+        """
+        response = self.post_fragment(
+            "clubs:financial-transaction",
+            {"credit": "invalid-credit", "transaction_date": "2023-06-15"},
+        )
+        self.assertContains(
+            response, "data-si-form-errors", status_code=HTTPStatus.BAD_REQUEST
+        )
+        self.assertFalse(FinancialTransaction.objects.exists())
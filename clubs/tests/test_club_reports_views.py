@@ -1,9 +1,26 @@
 from datetime import date
+from decimal import Decimal
+from http import HTTPStatus
 
-from django.test import TestCase
+from django.conf import settings
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 
 from accounts.models import CustomUser as User
-from clubs.models import Club, FinancialYear
+from clubs.models import (
+    Club,
+    ClubMember,
+    DuePeriod,
+    FinancialTransaction,
+    FinancialYear,
+    FinancialYearContribution,
+    FinancialYearParticipant,
+    IndividualDue,
+)
+from clubs.services.dues import participant_balances
+from clubs.services.ledger import rebuild_ledger_snapshots
 from clubs.views.club_reports_view import FinancialReportView
 
 
@@ -126,3 +143,313 @@ class TestGetNoOfMonths(TestCase):
         self.assertEqual(
             self.view.get_no_of_months(date(2024, 6, 1), financial_year), 12
         )
+
+
+class TestParticipantBalances(TestCase):
+    """
+    Test case for the set-based participant_balances dues engine.
+    """
+
+    def setUp(self):
+        """
+        Set up a financial year with a monthly contribution.
+        """
+        self.user = User.objects.create_user(
+            email="john.doe@example.com", password="testPass123"
+        )
+        self.club = Club.objects.create(
+            name="Finance Club",
+            description="A club for financial enthusiasts.",
+            contact_email="jane@example.com",
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.financial_year = FinancialYear.objects.create(
+            club=self.club,
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 12, 31),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        FinancialYearContribution.objects.create(
+            financial_year=self.financial_year,
+            amount=Decimal("10000"),
+            due_period=DuePeriod.MONTHLY,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+
+    def add_participant(self, index: int) -> ClubMember:
+        """
+        Create a club member and enrol them in the financial year.
+        """
+        user = User.objects.create(
+            email=f"member{index}@example.com", first_name=f"Member{index}"
+        )
+        club_member = ClubMember.objects.create(user=user, club=self.club)
+        FinancialYearParticipant.objects.create(
+            financial_year=self.financial_year,
+            club_member=club_member,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        FinancialTransaction.objects.create(
+            financial_year=self.financial_year,
+            club_member=club_member,
+            credit=Decimal("5000"),
+            transaction_date=date(2023, 2, 10),
+            description="Contribution",
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        return club_member
+
+    def test_balances_include_dues_credits_and_debits(self):
+        """
+        Due, credit and debit are summed up to the end of the selected period.
+        """
+        club_member = self.add_participant(1)
+        IndividualDue.objects.create(
+            financial_year=self.financial_year,
+            club_member=club_member,
+            description="Late fine",
+            amount=Decimal("2000"),
+            due_date=date(2023, 3, 5),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        FinancialTransaction.objects.create(
+            financial_year=self.financial_year,
+            club_member=club_member,
+            debit=Decimal("1000"),
+            transaction_date=date(2023, 4, 1),
+            description="Refund",
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        rebuild_ledger_snapshots(self.financial_year)
+        balances = participant_balances(self.financial_year, date(2023, 3, 1))
+        self.assertEqual(len(balances), 1)
+        self.assertEqual(balances[0]["first_name"], "Member1")
+        self.assertEqual(balances[0]["due"], Decimal("32000"))
+        self.assertEqual(balances[0]["total_credit"], Decimal("5000"))
+        self.assertEqual(balances[0]["total_debit"], Decimal("0"))
+
+    def test_financial_year_spanning_calendar_years(self):
+        """
+        Dues from the previous calendar year count towards later months.
+        """
+        financial_year = FinancialYear.objects.create(
+            club=self.club,
+            start_date=date(2023, 7, 1),
+            end_date=date(2024, 6, 30),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        club_member = ClubMember.objects.create(
+            user=User.objects.create(email="member@example.com"), club=self.club
+        )
+        FinancialYearParticipant.objects.create(
+            financial_year=financial_year,
+            club_member=club_member,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        IndividualDue.objects.create(
+            financial_year=financial_year,
+            club_member=club_member,
+            description="Late fine",
+            amount=Decimal("2000"),
+            due_date=date(2023, 11, 20),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        rebuild_ledger_snapshots(financial_year)
+        balances = participant_balances(financial_year, date(2024, 1, 1))
+        self.assertEqual(balances[0]["due"], Decimal("2000"))
+
+    def test_query_count_does_not_grow_with_participants(self):
+        """
+        The number of queries is the same for one and for many participants.
+        """
+        self.add_participant(1)
+        rebuild_ledger_snapshots(self.financial_year)
+        with CaptureQueriesContext(connection) as single:
+            participant_balances(self.financial_year, date(2023, 6, 1))
+        for index in range(2, 12):
+            self.add_participant(index)
+        rebuild_ledger_snapshots(self.financial_year)
+        with CaptureQueriesContext(connection) as many:
+            balances = participant_balances(self.financial_year, date(2023, 6, 1))
+        self.assertEqual(len(balances), 11)
+        self.assertEqual(len(single), len(many))
+
+
+class TestFinancialReportView(TestCase):
+    """
+    Test case for the FinancialReportView.
+    """
+
+    url_name = "clubs:financial-reports"
+
+    def setUp(self):
+        """
+        Set up a financial year with one participant who paid in March.
+        """
+        self.user = User.objects.create_user(
+            email="john.doe@example.com", password="testPass123"
+        )
+        self.club = Club.objects.create(
+            name="Finance Club",
+            description="A club for financial enthusiasts.",
+            contact_email="jane@example.com",
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.financial_year = FinancialYear.objects.create(
+            club=self.club,
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 12, 31),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.club_member = ClubMember.objects.create(
+            user=self.user, club=self.club, is_admin=True
+        )
+        FinancialYearParticipant.objects.create(
+            financial_year=self.financial_year,
+            club_member=self.club_member,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        FinancialTransaction.objects.create(
+            financial_year=self.financial_year,
+            club_member=self.club_member,
+            credit=Decimal("5000"),
+            transaction_date=date(2023, 3, 10),
+            description="Contribution",
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        rebuild_ledger_snapshots(self.financial_year)
+
+    def test_report_for_selected_month(self):
+        """
+        The report lists the month's transactions, totals and participant dues.
+        """
+        self.client.login(email=self.user.email, password="testPass123")
+        url = reverse(self.url_name, args=[self.club.id, self.financial_year.id])
+        response = self.client.get(url, {"month": "3", "year": "2023"})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertTemplateUsed(response, "clubs/financial_reports.html")
+        self.assertEqual(len(response.context["financial_transactions"]), 1)
+        self.assertEqual(response.context["sum_credit"], Decimal("5000"))
+        self.assertEqual(
+            response.context["participant_dues"][0]["total_credit"], Decimal("5000")
+        )
+
+    def test_non_member_gets_403(self):
+        """
+        A user who is neither the creator nor a member gets 403.
+        """
+        User.objects.create_user(email="outsider@example.com", password="testPass123")
+        self.client.login(email="outsider@example.com", password="testPass123")
+        url = reverse(self.url_name, args=[self.club.id, self.financial_year.id])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+
+class TestAsyncFinancialReportView(TestFinancialReportView):
+    """
+    Test case for the AsyncFinancialReportView, on top of the checks shared
+    with the FinancialReportView.
+    """
+
+    url_name = "clubs:financial-reports-async"
+
+    async def test_report_over_asgi(self):
+        """
+        The report is served through the ASGI handler.
+        """
+        await self.async_client.alogin(email=self.user.email, password="testPass123")
+        response = await self.async_client.get(
+            reverse(self.url_name, args=[self.club.id, self.financial_year.id]),
+            {"month": "3", "year": "2023"},
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.context["sum_credit"], Decimal("5000"))
+        self.assertEqual(len(response.context["financial_transactions"]), 1)
+
+    def test_anonymous_user_redirected_to_login(self):
+        """
+        Anonymous users are sent to the login page.
+        """
+        response = self.client.get(
+            reverse(self.url_name, args=[self.club.id, self.financial_year.id])
+        )
+        self.assertEqual(response.status_code, HTTPStatus.FOUND)
+        self.assertTrue(response["Location"].startswith(settings.LOGIN_URL))
+
+    def test_post_not_allowed(self):
+        """
+        Only GET is served.
+        """
+        self.client.login(email=self.user.email, password="testPass123")
+        response = self.client.post(
+            reverse(self.url_name, args=[self.club.id, self.financial_year.id])
+        )
+        self.assertEqual(response.status_code, HTTPStatus.METHOD_NOT_ALLOWED)
+
+
+class TestAsyncFinancialReportConcurrency(TransactionTestCase):
+    """
+    Outside a transaction the report queries run on threads of their own.
+    """
+
+    def test_report_built_on_worker_threads(self):
+        """
+        The cash-flow and participant queries see committed rows from their
+        own connections.
+        """
+        user = User.objects.create_user(
+            email="john.doe@example.com", password="testPass123"
+        )
+        club = Club.objects.create(
+            name="Finance Club",
+            description="A club for financial enthusiasts.",
+            contact_email="jane@example.com",
+            created_by=user,
+            updated_by=user,
+        )
+        financial_year = FinancialYear.objects.create(
+            club=club,
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 12, 31),
+            created_by=user,
+            updated_by=user,
+        )
+        club_member = ClubMember.objects.create(user=user, club=club, is_admin=True)
+        FinancialYearParticipant.objects.create(
+            financial_year=financial_year,
+            club_member=club_member,
+            created_by=user,
+            updated_by=user,
+        )
+        FinancialTransaction.objects.create(
+            financial_year=financial_year,
+            club_member=club_member,
+            debit=Decimal("700"),
+            transaction_date=date(2023, 5, 2),
+            description="Bank charges",
+            created_by=user,
+            updated_by=user,
+        )
+        rebuild_ledger_snapshots(financial_year)
+        self.client.login(email=user.email, password="testPass123")
+        response = self.client.get(
+            reverse("clubs:financial-reports-async", args=[club.id, financial_year.id]),
+            {"month": "5", "year": "2023"},
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.context["sum_debit"], Decimal("700"))
+        self.assertEqual(len(response.context["participant_dues"]), 1)
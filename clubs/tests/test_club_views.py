@@ -1,10 +1,16 @@
+from datetime import date
 from http import HTTPStatus
+from unittest import mock
 
+from django.db import connection
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from accounts.models import CustomUser as User
-from clubs.models import Club
+from clubs.models import Club, ClubMember, FinancialTransaction, FinancialYear
+from clubs.views.club_views import user_clubs
+from clubs.views.pagination import encode_cursor
 
 
 class ClubListViewTestCase(TestCase):
@@ -85,3 +91,118 @@ class ClubListViewTestCase(TestCase):
         self.assertTemplateUsed(response, "clubs/index.html")
         self.assertIn("create_club_form", response.context)
         self.assertEqual(Club.objects.count(), 1)  # No new club created
+
+
+class UserClubsTestCase(TestCase):
+    """
+    Test case for the annotated, paginated club list.
+    """
+
+    test_email = "testuser@example.com"
+    test_password = "testPass123"
+
+    def setUp(self):
+        """
+        Set up a user who created one club and is a member of another.
+        """
+        self.user = User.objects.create_user(
+            email=self.test_email, password=self.test_password
+        )
+        self.other = User.objects.create_user(email="other@example.com")
+        self.own_club = self.create_club("Own Club", self.user)
+        ClubMember.objects.create(club=self.own_club, user=self.user, is_admin=True)
+        self.joined_club = self.create_club("Joined Club", self.other)
+        ClubMember.objects.create(club=self.joined_club, user=self.other, is_admin=True)
+        ClubMember.objects.create(
+            club=self.joined_club, user=self.user, role="treasurer"
+        )
+        self.create_club("Unrelated Club", self.other)
+        self.client.login(email=self.test_email, password=self.test_password)
+
+    def create_club(self, name: str, user) -> Club:
+        """
+        Create a club owned by ``user``.
+        """
+        return Club.objects.create(
+            name=name,
+            description="A club for testing.",
+            contact_email=user.email,
+            created_by=user,
+            updated_by=user,
+        )
+
+    def test_annotations(self):
+        """
+        Each club carries the user's role, the member count, the active
+        financial year and the last transaction date.
+        """
+        financial_year = FinancialYear.objects.create(
+            club=self.joined_club,
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 12, 31),
+            created_by=self.other,
+            updated_by=self.other,
+        )
+        for day in (3, 9):
+            FinancialTransaction.objects.create(
+                financial_year=financial_year,
+                credit=100,
+                transaction_date=date(2023, 5, day),
+                description="Contribution",
+                created_by=self.other,
+                updated_by=self.other,
+            )
+        own, joined = user_clubs(self.user).order_by("created_at", "id")
+        self.assertTrue(own.is_creator)
+        self.assertEqual(own.member_count, 1)
+        self.assertIsNone(own.active_year_id)
+        self.assertIsNone(own.last_transaction_date)
+        self.assertFalse(joined.is_creator)
+        self.assertEqual(joined.role, "treasurer")
+        self.assertFalse(joined.is_admin)
+        self.assertEqual(joined.member_count, 2)
+        self.assertEqual(joined.active_year_id, financial_year.id)
+        self.assertEqual(joined.last_transaction_date, date(2023, 5, 9))
+
+    def test_index_is_one_query_per_page(self):
+        """
+        The club list costs the same number of queries for any number of clubs.
+        """
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(reverse("clubs:index"))
+        for index in range(30):
+            ClubMember.objects.create(
+                club=self.create_club(f"Club {index}", self.other), user=self.user
+            )
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(reverse("clubs:index"))
+        self.assertEqual(len(few), len(many))
+        self.assertEqual(response.context["club_total"], 32)
+        self.assertEqual(response.context["created_total"], 1)
+        self.assertEqual(response.context["member_total"], 31)
+
+    def test_pagination(self):
+        """
+        Clubs beyond the first page are reached with the next cursor and the
+        stat cards keep counting every club.
+        """
+        with mock.patch("clubs.views.club_views.CLUBS_PAGE_SIZE", 1):
+            response = self.client.get(reverse("clubs:index"))
+            self.assertEqual(response.context["clubs"][0], self.own_club)
+            next_cursor = response.context["club_page"].next_cursor
+            response = self.client.get(reverse("clubs:index"), {"after": next_cursor})
+        self.assertEqual(response.context["clubs"], [self.joined_club])
+        self.assertIsNone(response.context["club_page"].next_cursor)
+        self.assertEqual(response.context["club_total"], 2)
+        self.assertContains(response, "Treasurer")
+
+    def test_totals_on_empty_page(self):
+        """
+        A page past the last club still shows the totals of every club.
+        """
+        last_cursor = encode_cursor(self.joined_club, ("created_at", "id"))
+        response = self.client.get(reverse("clubs:index"), {"after": last_cursor})
+        self.assertEqual(response.context["clubs"], [])
+        self.assertEqual(response.context["club_total"], 2)
+        self.assertEqual(response.context["created_total"], 1)
+        self.assertEqual(response.context["member_total"], 1)
@@ -0,0 +1,157 @@
+from datetime import date
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import CustomUser as User
+from clubs.models import (
+    Club,
+    ClubMember,
+    DueInstallment,
+    DuePeriod,
+    FinancialYear,
+    FinancialYearContribution,
+    FinancialYearParticipant,
+)
+from clubs.services.due_schedule import installment_dates
+from clubs.services.dues import participant_balances
+
+
+class DueScheduleTestCase(TestCase):
+    """
+    Base test case with a club and a financial year running July to June.
+    """
+
+    def setUp(self):
+        """
+        Set up test data for clubs and financial years.
+        """
+        self.user = User.objects.create_user(
+            email="jane.doe@example.com", password="testPass123"
+        )
+        self.club = Club.objects.create(
+            name="Investment Club",
+            description="A club for investment enthusiasts.",
+            contact_email=self.user.email,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.financial_year = FinancialYear.objects.create(
+            club=self.club,
+            start_date=date(2023, 7, 15),
+            end_date=date(2024, 6, 30),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+
+    def add_contribution(self, amount: str, due_period: str):
+        """
+        Create a contribution of the financial year.
+        """
+        return FinancialYearContribution.objects.create(
+            financial_year=self.financial_year,
+            amount=Decimal(amount),
+            due_period=due_period,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+
+    def add_participant(self):
+        """
+        Make the club creator a participant of the financial year.
+        """
+        club_member = ClubMember.objects.create(user=self.user, club=self.club)
+        return FinancialYearParticipant.objects.create(
+            financial_year=self.financial_year,
+            club_member=club_member,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+
+    def due(self, month: date) -> Decimal:
+        """
+        Return the due of the only participant up to the end of ``month``.
+        """
+        return participant_balances(self.financial_year, month)[0]["due"]
+
+
+class TestInstallmentDates(DueScheduleTestCase):
+    """
+    Test case for expanding due periods into installment dates.
+    """
+
+    def test_periods(self):
+        """
+        Installments fall on the first day of each period from the start month.
+        """
+        self.assertEqual(
+            len(installment_dates(self.financial_year, DuePeriod.MONTHLY)), 12
+        )
+        self.assertEqual(
+            installment_dates(self.financial_year, DuePeriod.QUARTERLY),
+            [date(2023, 7, 1), date(2023, 10, 1), date(2024, 1, 1), date(2024, 4, 1)],
+        )
+        self.assertEqual(
+            installment_dates(self.financial_year, DuePeriod.YEARLY),
+            [date(2023, 7, 1)],
+        )
+
+
+class TestScheduledDue(DueScheduleTestCase):
+    """
+    Test case for the stored due schedule.
+    """
+
+    def test_every_period_counts_towards_the_due(self):
+        """
+        Monthly, quarterly and yearly installments are summed up to the end of
+        the month.
+        """
+        self.add_contribution("1000", DuePeriod.MONTHLY)
+        self.add_contribution("5000", DuePeriod.QUARTERLY)
+        self.add_contribution("20000", DuePeriod.YEARLY)
+        self.add_participant()
+        # July to October: 4 monthly, 2 quarterly and 1 yearly installment.
+        self.assertEqual(self.due(date(2023, 10, 1)), Decimal("34000"))
+        self.assertEqual(self.due(date(2023, 10, 31)), Decimal("34000"))
+        # The quarterly installment of October 1st is not due in September.
+        self.assertEqual(self.due(date(2023, 9, 30)), Decimal("28000"))
+        self.assertEqual(self.due(date(2023, 6, 30)), Decimal("0"))
+
+    def test_schedule_follows_contribution_changes(self):
+        """
+        Editing or deleting a contribution regenerates its installments.
+        """
+        contribution = self.add_contribution("1000", DuePeriod.MONTHLY)
+        contribution.amount = Decimal("3000")
+        contribution.due_period = DuePeriod.QUARTERLY
+        contribution.save()
+        self.assertEqual(
+            list(DueInstallment.objects.values_list("amount", flat=True)),
+            [Decimal("3000")] * 4,
+        )
+        contribution.delete()
+        self.assertFalse(DueInstallment.objects.exists())
+
+    def test_schedule_follows_financial_year_dates(self):
+        """
+        Changing the dates of a financial year regenerates its installments.
+        """
+        self.add_contribution("1000", DuePeriod.MONTHLY)
+        self.financial_year.end_date = date(2023, 12, 31)
+        self.financial_year.save()
+        self.assertEqual(DueInstallment.objects.count(), 6)
+
+    def test_participant_balances_use_the_schedule(self):
+        """
+        Participant dues include quarterly contributions in a single query.
+        """
+        self.add_contribution("1000", DuePeriod.MONTHLY)
+        self.add_contribution("5000", DuePeriod.QUARTERLY)
+        self.add_participant()
+        with CaptureQueriesContext(connection) as queries:
+            balances = participant_balances(self.financial_year, date(2023, 8, 1))
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(balances[0]["due"], Decimal("7000"))
@@ -0,0 +1,262 @@
+import json
+from datetime import date
+from decimal import Decimal
+from http import HTTPStatus
+
+from django.test import TestCase
+from django.urls import reverse
+
+from accounts.models import CustomUser as User
+from clubs.models import (
+    Club,
+    ClubMember,
+    DuePeriod,
+    FinancialTransaction,
+    FinancialYear,
+    FinancialYearContribution,
+    FinancialYearParticipant,
+    IndividualDue,
+)
+from clubs.services.dues import participant_balances
+from clubs.services.dues_simulator import (
+    HypotheticalDue,
+    Scenario,
+    load_ledger,
+    simulate,
+)
+from clubs.services.ledger import rebuild_ledger_snapshots
+
+
+class DuesSimulatorTestCase(TestCase):
+    """
+    Base test case with a financial year, a monthly contribution and two
+    participants with some history.
+    """
+
+    def setUp(self):
+        """
+        Set up test data for clubs, financial years and participants.
+        """
+        self.user = User.objects.create_user(
+            email="jane.doe@example.com", password="testPass123"
+        )
+        self.club = Club.objects.create(
+            name="Investment Club",
+            description="A club for investment enthusiasts.",
+            contact_email=self.user.email,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.admin = ClubMember.objects.create(
+            user=self.user, club=self.club, is_admin=True
+        )
+        self.financial_year = FinancialYear.objects.create(
+            club=self.club,
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 12, 31),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.contribution = FinancialYearContribution.objects.create(
+            financial_year=self.financial_year,
+            amount=Decimal("10000"),
+            due_period=DuePeriod.MONTHLY,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.member = ClubMember.objects.create(
+            user=User.objects.create(email="member@example.com", first_name="Ann"),
+            club=self.club,
+        )
+        for club_member in (self.admin, self.member):
+            FinancialYearParticipant.objects.create(
+                financial_year=self.financial_year,
+                club_member=club_member,
+                created_by=self.user,
+                updated_by=self.user,
+            )
+        FinancialTransaction.objects.create(
+            financial_year=self.financial_year,
+            club_member=self.member,
+            credit=Decimal("25000"),
+            transaction_date=date(2023, 2, 10),
+            description="Contribution",
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        IndividualDue.objects.create(
+            financial_year=self.financial_year,
+            club_member=self.member,
+            description="Late fine",
+            amount=Decimal("2000"),
+            due_date=date(2023, 3, 5),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        rebuild_ledger_snapshots(self.financial_year)
+
+
+class TestSimulate(DuesSimulatorTestCase):
+    """
+    Test case for the array based dues simulation.
+    """
+
+    def test_matches_participant_balances_every_month(self):
+        """
+        Without changes the simulated dues match the report of every month.
+        """
+        ledger = load_ledger(self.financial_year)
+        result = simulate(ledger, Scenario())
+        for column, month in enumerate(ledger.months):
+            balances = participant_balances(self.financial_year, month)
+            self.assertEqual(
+                [int(row["due"] * 100) for row in balances],
+                result["due"][:, column].tolist(),
+            )
+            self.assertEqual(
+                [
+                    int((row["total_credit"] - row["total_debit"] - row["due"]) * 100)
+                    for row in balances
+                ],
+                result["balance"][:, column].tolist(),
+            )
+
+    def test_applies_hypothetical_changes(self):
+        """
+        A new contribution amount and an extra fine change every later month.
+        """
+        ledger = load_ledger(self.financial_year)
+        result = simulate(
+            ledger,
+            Scenario(
+                contribution_amounts={self.contribution.id: Decimal("12000")},
+                individual_dues=[
+                    HypotheticalDue(self.member.id, Decimal("500"), date(2023, 6, 1))
+                ],
+            ),
+        )
+        # Ann in March: 3 x 12000 + 2000 due, 25000 paid.
+        self.assertEqual(result["due"][1, 2], 3800000)
+        self.assertEqual(result["balance"][1, 2], -1300000)
+        # Ann in December: 12 x 12000 + 2000 + 500 due.
+        self.assertEqual(result["due"][1, 11], 14650000)
+        self.assertEqual(result["due"][0, 11], 14400000)
+
+    def test_rejects_changes_outside_the_financial_year(self):
+        """
+        Unknown contributions, non participants and dates outside the
+        financial year raise ValueError.
+        """
+        ledger = load_ledger(self.financial_year)
+        for scenario in (
+            Scenario(contribution_amounts={0: Decimal("1")}),
+            Scenario(
+                individual_dues=[HypotheticalDue(0, Decimal("1"), date(2023, 1, 1))]
+            ),
+            Scenario(
+                individual_dues=[
+                    HypotheticalDue(self.member.id, Decimal("1"), date(2024, 1, 1))
+                ]
+            ),
+        ):
+            with self.assertRaises(ValueError):
+                simulate(ledger, scenario)
+
+
+class TestDuesSimulatorView(DuesSimulatorTestCase):
+    """
+    Test case for the DuesSimulatorView.
+    """
+
+    def setUp(self):
+        """
+        Log in as the club admin.
+        """
+        super().setUp()
+        self.client.login(email=self.user.email, password="testPass123")
+        self.url = reverse(
+            "clubs:dues-simulator", args=[self.club.id, self.financial_year.id]
+        )
+
+    def test_get_returns_current_balances(self):
+        """
+        GET returns the month by month dues and balances without changes.
+        """
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        data = response.json()
+        self.assertEqual(data["months"][0], "2023-01")
+        self.assertEqual(len(data["months"]), 12)
+        ann = data["participants"][1]
+        self.assertEqual(ann["first_name"], "Ann")
+        self.assertEqual(ann["due"][2], 32000)
+        self.assertEqual(ann["balance"][2], -7000)
+
+    def test_post_applies_scenario(self):
+        """
+        POST applies the JSON scenario without writing anything.
+        """
+        response = self.client.post(
+            self.url,
+            json.dumps(
+                {
+                    "contributions": {str(self.contribution.id): "12000"},
+                    "individual_dues": [
+                        {
+                            "club_member": self.member.id,
+                            "amount": "500",
+                            "due_date": "2023-03-01",
+                        }
+                    ],
+                }
+            ),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json()["participants"][1]["due"][2], 38500)
+        self.contribution.refresh_from_db()
+        self.assertEqual(self.contribution.amount, Decimal("10000"))
+        self.assertEqual(IndividualDue.objects.count(), 1)
+
+    def test_post_rejects_malformed_scenario(self):
+        """
+        Malformed scenarios and unknown contributions are a bad request.
+        """
+        for body in ("not json", '{"contributions": {"0": "1"}}'):
+            response = self.client.post(self.url, body, content_type="application/json")
+            self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+            self.assertIn("error", response.json())
+
+    def test_post_rejects_out_of_range_amounts(self):
+        """
+        Amounts that are not finite or do not fit the amount fields are a bad
+        request.
+        """
+        for amount in ("Infinity", "NaN", "1e30", "-1e30", 1e30, "100000000"):
+            for scenario in (
+                {"contributions": {str(self.contribution.id): amount}},
+                {
+                    "individual_dues": [
+                        {
+                            "club_member": self.member.id,
+                            "amount": amount,
+                            "due_date": "2023-03-01",
+                        }
+                    ]
+                },
+            ):
+                with self.subTest(amount=amount, scenario=scenario):
+                    response = self.client.post(
+                        self.url, json.dumps(scenario), content_type="application/json"
+                    )
+                    self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+    def test_requires_club_admin(self):
+        """
+        Members who are not club admins cannot run the simulator.
+        """
+        self.member.user.set_password("testPass123")
+        self.member.user.save()
+        self.client.login(email=self.member.user.email, password="testPass123")
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
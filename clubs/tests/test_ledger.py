@@ -0,0 +1,526 @@
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import IntegrityError
+from django.test import TestCase
+from django.urls import reverse
+
+from accounts.models import CustomUser as User
+from clubs.models import (
+    Club,
+    ClubMember,
+    FinancialTransaction,
+    FinancialYear,
+    FinancialYearParticipant,
+    IndividualDue,
+    MonthlyLedgerSnapshot,
+)
+from clubs.services.dues import cash_flow_totals, participant_balances
+from clubs.services.ledger import (
+    apply_to_snapshots,
+    rebuild_ledger_snapshots,
+    reconcile_totals,
+)
+
+
+class LedgerSnapshotTestCase(TestCase):
+    """
+    Base test case with a club, a financial year and an admin member.
+    """
+
+    def setUp(self):
+        """
+        Set up test data for clubs, financial years and members.
+        """
+        self.user = User.objects.create_user(
+            email="jane.doe@example.com", password="testPass123"
+        )
+        self.club = Club.objects.create(
+            name="Investment Club",
+            description="A club for investment enthusiasts.",
+            contact_email=self.user.email,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.financial_year = FinancialYear.objects.create(
+            club=self.club,
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 12, 31),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.club_member = ClubMember.objects.create(
+            user=self.user, club=self.club, is_admin=True, role="treasurer"
+        )
+
+    def create_transaction(self, transaction_date: date, credit=None, debit=None):
+        """
+        Create a FinancialTransaction for the admin member.
+        """
+        return FinancialTransaction.objects.create(
+            financial_year=self.financial_year,
+            club_member=self.club_member,
+            credit=credit,
+            debit=debit,
+            transaction_date=transaction_date,
+            description="Contribution",
+            created_by=self.user,
+            updated_by=self.user,
+        )
+
+
+class TestRecordTransaction(LedgerSnapshotTestCase):
+    """
+    Test case for incremental snapshot updates.
+    """
+
+    def test_transactions_in_same_month_share_a_row(self):
+        """
+        Transactions of the same member and month accumulate in one snapshot row.
+        """
+        self.create_transaction(date(2023, 3, 2), credit=100)
+        self.create_transaction(date(2023, 3, 28), debit=40)
+        snapshot = MonthlyLedgerSnapshot.objects.get()
+        self.assertEqual(snapshot.month, date(2023, 3, 1))
+        self.assertEqual(snapshot.credit, Decimal("100"))
+        self.assertEqual(snapshot.debit, Decimal("40"))
+
+    def test_transaction_view_updates_snapshot(self):
+        """
+        Creating a transaction through the view rolls it into the snapshot.
+        """
+        self.client.login(email=self.user.email, password="testPass123")
+        url = reverse(
+            "clubs:financial-transaction",
+            args=[self.club.id, self.financial_year.id],
+        )
+        self.client.post(
+            url,
+            {
+                "club_member": self.club_member.id,
+                "credit": "10000.00",
+                "transaction_date": "2023-06-15",
+                "description": "Membership fee",
+            },
+        )
+        snapshot = MonthlyLedgerSnapshot.objects.get(club_member=self.club_member)
+        self.assertEqual(snapshot.month, date(2023, 6, 1))
+        self.assertEqual(snapshot.credit, Decimal("10000"))
+
+    def test_individual_due_view_updates_snapshot(self):
+        """
+        Creating an individual due through the view rolls it into the snapshot.
+        """
+        FinancialYearParticipant.objects.create(
+            financial_year=self.financial_year,
+            club_member=self.club_member,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.client.login(email=self.user.email, password="testPass123")
+        url = reverse(
+            "clubs:financial-year-individual-due",
+            args=[self.club.id, self.financial_year.id],
+        )
+        self.client.post(
+            url,
+            {
+                "club_member": self.club_member.id,
+                "description": "Late fine",
+                "amount": "2000.00",
+                "due_date": "2023-07-04",
+            },
+        )
+        snapshot = MonthlyLedgerSnapshot.objects.get(club_member=self.club_member)
+        self.assertEqual(snapshot.month, date(2023, 7, 1))
+        self.assertEqual(snapshot.individual_due, Decimal("2000"))
+
+
+class TestLedgerSignals(LedgerSnapshotTestCase):
+    """
+    Test case for keeping the ledger in sync with saves and deletes made
+    outside the views, like the admin's.
+    """
+
+    def setUp(self):
+        super().setUp()
+        FinancialYearParticipant.objects.create(
+            financial_year=self.financial_year,
+            club_member=self.club_member,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+
+    def assertLedger(self, month: date, credit, debit, transaction_count):
+        """
+        Assert the cash flow of ``month``, the yearly balance of the member
+        and the running totals match the transactions.
+        """
+        self.assertEqual(
+            cash_flow_totals(self.financial_year, month),
+            {"total_credit": Decimal(credit), "total_debit": Decimal(debit)},
+        )
+        (balance,) = participant_balances(self.financial_year, date(2023, 12, 1))
+        self.assertEqual(balance["total_credit"], Decimal(credit))
+        self.assertEqual(balance["total_debit"], Decimal(debit))
+        self.financial_year.refresh_from_db()
+        self.assertEqual(self.financial_year.transaction_count, transaction_count)
+        self.assertEqual(self.financial_year.total_credit, Decimal(credit))
+        self.assertEqual(self.financial_year.total_debit, Decimal(debit))
+        self.assertEqual(reconcile_totals(self.financial_year, repair=False), {})
+
+    def test_stale_financial_year_save_keeps_totals(self):
+        """
+        Saving a financial year loaded before a ledger change leaves the
+        running totals alone and only the ledger writes them.
+        """
+        stale = FinancialYear.objects.get(pk=self.financial_year.pk)
+        FinancialTransaction.objects.create(
+            financial_year=self.financial_year,
+            club_member=self.club_member,
+            credit=Decimal("5000"),
+            transaction_date=date(2023, 3, 10),
+            description="Contribution",
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        stale.is_active = False
+        stale.transaction_count = 42
+        stale.save()
+        self.financial_year.refresh_from_db()
+        self.assertFalse(self.financial_year.is_active)
+        self.assertLedger(date(2023, 3, 1), "5000", "0", 1)
+        self.assertEqual(self.financial_year.participant_count, 1)
+
+    def test_saved_transaction_is_recorded(self):
+        """
+        A transaction saved through the ORM shows up in the reports.
+        """
+        FinancialTransaction(
+            financial_year=self.financial_year,
+            club_member=self.club_member,
+            credit=Decimal("5000"),
+            transaction_date=date(2023, 3, 2),
+            description="Contribution",
+            created_by=self.user,
+            updated_by=self.user,
+        ).save()
+        self.assertLedger(date(2023, 3, 1), "5000", "0", 1)
+
+    def test_edited_transaction_moves_amounts(self):
+        """
+        Editing the amounts and date of a transaction moves it in the reports.
+        """
+        financial_transaction = self.create_transaction(date(2023, 3, 2), credit=100)
+        financial_transaction.credit = None
+        financial_transaction.debit = Decimal("40")
+        financial_transaction.transaction_date = date(2023, 4, 10)
+        financial_transaction.save()
+        self.assertEqual(
+            cash_flow_totals(self.financial_year, date(2023, 3, 1)),
+            {"total_credit": Decimal("0"), "total_debit": Decimal("0")},
+        )
+        self.assertLedger(date(2023, 4, 1), "0", "40", 1)
+
+    def test_edited_transaction_moves_member(self):
+        """
+        Moving a transaction to the club level takes it off the member.
+        """
+        financial_transaction = self.create_transaction(date(2023, 3, 2), credit=100)
+        financial_transaction.club_member = None
+        financial_transaction.save()
+        (balance,) = participant_balances(self.financial_year, date(2023, 12, 1))
+        self.assertEqual(balance["total_credit"], Decimal("0"))
+        self.assertEqual(
+            cash_flow_totals(self.financial_year, date(2023, 3, 1))["total_credit"],
+            Decimal("100"),
+        )
+
+    def test_deleted_transactions_are_removed(self):
+        """
+        Deleting a transaction, or a queryset of them, takes them out of the
+        reports.
+        """
+        financial_transaction = self.create_transaction(date(2023, 3, 2), credit=100)
+        self.create_transaction(date(2023, 3, 5), debit=30)
+        self.create_transaction(date(2023, 3, 9), debit=20)
+        financial_transaction.delete()
+        self.assertLedger(date(2023, 3, 1), "0", "50", 2)
+        FinancialTransaction.objects.all().delete()
+        self.assertLedger(date(2023, 3, 1), "0", "0", 0)
+
+    def test_individual_due_edit_and_delete(self):
+        """
+        Editing and deleting an individual due updates the member's due.
+        """
+        individual_due = IndividualDue.objects.create(
+            financial_year=self.financial_year,
+            club_member=self.club_member,
+            description="Late fine",
+            amount=Decimal("20"),
+            due_date=date(2023, 2, 10),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        individual_due.amount = Decimal("35")
+        individual_due.save()
+        (balance,) = participant_balances(self.financial_year, date(2023, 12, 1))
+        self.assertEqual(balance["due"], Decimal("35"))
+        individual_due.delete()
+        (balance,) = participant_balances(self.financial_year, date(2023, 12, 1))
+        self.assertEqual(balance["due"], Decimal("0"))
+        self.assertEqual(reconcile_totals(self.financial_year, repair=False), {})
+
+    def test_deleted_participant_is_uncounted(self):
+        """
+        Deleting a participant decrements the participant count.
+        """
+        FinancialYearParticipant.objects.get().delete()
+        self.financial_year.refresh_from_db()
+        self.assertEqual(self.financial_year.participant_count, 0)
+
+    def test_deleted_member_folds_into_club_level_row(self):
+        """
+        Deleting a member moves their credits and debits to the club level
+        row, and later club level transactions of that month still record.
+        """
+        self.create_transaction(date(2023, 3, 2), credit=100)
+        self.create_transaction(date(2023, 3, 4), debit=30)
+        FinancialTransaction.objects.create(
+            financial_year=self.financial_year,
+            credit=Decimal("5"),
+            transaction_date=date(2023, 3, 8),
+            description="Interest",
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.club_member.delete()
+        FinancialTransaction.objects.create(
+            financial_year=self.financial_year,
+            credit=Decimal("7"),
+            transaction_date=date(2023, 3, 20),
+            description="Interest",
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        snapshot = MonthlyLedgerSnapshot.objects.get()
+        self.assertIsNone(snapshot.club_member_id)
+        self.assertEqual(
+            (snapshot.credit, snapshot.debit), (Decimal("112"), Decimal("30"))
+        )
+        self.assertEqual(reconcile_totals(self.financial_year, repair=False), {})
+
+    def test_one_club_level_row_per_month(self):
+        """
+        The database refuses a second club level row for the same month.
+        """
+        MonthlyLedgerSnapshot.objects.create(
+            financial_year=self.financial_year, month=date(2023, 3, 1)
+        )
+        with self.assertRaises(IntegrityError):
+            MonthlyLedgerSnapshot.objects.create(
+                financial_year=self.financial_year, month=date(2023, 3, 1)
+            )
+
+    def test_moved_participant_is_recounted(self):
+        """
+        Moving a participant to another financial year moves its count and
+        invalidates the reports of both years.
+        """
+        other_year = FinancialYear.objects.create(
+            club=self.club,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 12, 31),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        participant = FinancialYearParticipant.objects.get()
+        participant.financial_year = other_year
+        with mock.patch("clubs.signals.bump_report_version") as bump:
+            with self.captureOnCommitCallbacks(execute=True):
+                participant.save()
+        self.assertEqual(
+            {call.args[0] for call in bump.call_args_list},
+            {self.financial_year.id, other_year.id},
+        )
+        for financial_year, count in ((self.financial_year, 0), (other_year, 1)):
+            financial_year.refresh_from_db()
+            self.assertEqual(financial_year.participant_count, count)
+            self.assertEqual(reconcile_totals(financial_year, repair=False), {})
+
+    def test_deleting_financial_year_skips_ledger(self):
+        """
+        Rows deleted with their financial year leave no snapshots behind.
+        """
+        self.create_transaction(date(2023, 3, 2), credit=100)
+        self.financial_year.delete()
+        self.assertFalse(MonthlyLedgerSnapshot.objects.exists())
+
+
+class TestApplyToSnapshots(LedgerSnapshotTestCase):
+    """
+    Test case for batched snapshot updates.
+    """
+
+    def test_adds_to_existing_rows_and_creates_missing_ones(self):
+        """
+        Amounts are added to existing rows and new rows are created for the rest.
+        """
+        self.create_transaction(date(2023, 3, 2), credit=100)
+        apply_to_snapshots(
+            self.financial_year.id,
+            {
+                (self.club_member.id, date(2023, 3, 1)): {"credit": Decimal("50")},
+                (None, date(2023, 4, 1)): {"debit": Decimal("30")},
+            },
+        )
+        snapshots = MonthlyLedgerSnapshot.objects.order_by("month")
+        self.assertEqual(
+            [(s.club_member_id, s.month, s.credit, s.debit) for s in snapshots],
+            [
+                (self.club_member.id, date(2023, 3, 1), Decimal("150"), Decimal("0")),
+                (None, date(2023, 4, 1), Decimal("0"), Decimal("30")),
+            ],
+        )
+
+
+class TestRebuildLedgerSnapshots(LedgerSnapshotTestCase):
+    """
+    Test case for rebuilding the snapshots from the transaction history.
+    """
+
+    def test_rebuild_replaces_drifted_rows(self):
+        """
+        Rebuilding discards stale rows and recomputes the monthly totals.
+        """
+        self.create_transaction(date(2023, 1, 5), credit=100)
+        self.create_transaction(date(2023, 1, 20), credit=50)
+        self.create_transaction(date(2023, 2, 1), debit=30)
+        IndividualDue.objects.create(
+            financial_year=self.financial_year,
+            club_member=self.club_member,
+            description="Late fine",
+            amount=Decimal("20"),
+            due_date=date(2023, 2, 10),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        MonthlyLedgerSnapshot.objects.create(
+            financial_year=self.financial_year,
+            club_member=self.club_member,
+            month=date(2023, 5, 1),
+            credit=Decimal("999"),
+        )
+        self.assertEqual(rebuild_ledger_snapshots(self.financial_year), 2)
+        snapshots = MonthlyLedgerSnapshot.objects.order_by("month")
+        self.assertEqual(
+            [(s.month, s.credit, s.debit, s.individual_due) for s in snapshots],
+            [
+                (date(2023, 1, 1), Decimal("150"), Decimal("0"), Decimal("0")),
+                (date(2023, 2, 1), Decimal("0"), Decimal("30"), Decimal("20")),
+            ],
+        )
+
+    def test_management_command(self):
+        """
+        The rebuild_ledger_snapshots command rebuilds every financial year.
+        """
+        self.create_transaction(date(2023, 4, 5), credit=100)
+        out = StringIO()
+        call_command("rebuild_ledger_snapshots", stdout=out)
+        self.assertIn(f"Financial year {self.financial_year.id}: 1", out.getvalue())
+        self.assertEqual(MonthlyLedgerSnapshot.objects.get().credit, Decimal("100"))
+
+
+class TestFinancialYearTotals(LedgerSnapshotTestCase):
+    """
+    Test case for the running totals kept on FinancialYear.
+    """
+
+    def drift_totals(self):
+        """
+        Zero the transaction totals behind the signals' back.
+        """
+        FinancialYear.objects.filter(pk=self.financial_year.pk).update(
+            transaction_count=0, total_credit=0
+        )
+
+    def test_recorded_rows_update_totals(self):
+        """
+        Creating transactions and individual dues adds them to the totals.
+        """
+        self.create_transaction(date(2023, 3, 2), credit=100)
+        self.create_transaction(date(2023, 4, 2), debit=40)
+        IndividualDue.objects.create(
+            financial_year=self.financial_year,
+            club_member=self.club_member,
+            description="Late fine",
+            amount=Decimal("20"),
+            due_date=date(2023, 2, 10),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.financial_year.refresh_from_db()
+        self.assertEqual(self.financial_year.transaction_count, 2)
+        self.assertEqual(self.financial_year.total_credit, Decimal("100"))
+        self.assertEqual(self.financial_year.total_debit, Decimal("40"))
+        self.assertEqual(self.financial_year.total_individual_dues, Decimal("20"))
+
+    def test_participant_view_updates_count(self):
+        """
+        Adding a participant through the view increments the participant count.
+        """
+        self.client.login(email=self.user.email, password="testPass123")
+        self.client.post(
+            reverse(
+                "clubs:financial-year-participant",
+                args=[self.club.id, self.financial_year.id],
+            ),
+            {"club_member": self.club_member.id},
+        )
+        self.financial_year.refresh_from_db()
+        self.assertEqual(self.financial_year.participant_count, 1)
+
+    def test_reconcile_reports_and_repairs_drift(self):
+        """
+        Reconciling reports drifted totals and repairs them only when asked.
+        """
+        self.create_transaction(date(2023, 3, 2), credit=100)
+        self.drift_totals()
+        drift = reconcile_totals(self.financial_year, repair=False)
+        self.assertEqual(
+            drift,
+            {
+                "transaction_count": (0, 1),
+                "total_credit": (Decimal("0"), Decimal("100")),
+            },
+        )
+        self.financial_year.refresh_from_db()
+        self.assertEqual(self.financial_year.transaction_count, 0)
+
+        reconcile_totals(self.financial_year)
+        self.financial_year.refresh_from_db()
+        self.assertEqual(self.financial_year.transaction_count, 1)
+        self.assertEqual(self.financial_year.total_credit, Decimal("100"))
+        self.assertEqual(reconcile_totals(self.financial_year), {})
+
+    def test_management_command(self):
+        """
+        The reconcile_financial_year_totals command repairs drift with --fix.
+        """
+        self.create_transaction(date(2023, 4, 5), credit=100)
+        self.drift_totals()
+        out = StringIO()
+        call_command("reconcile_financial_year_totals", stdout=out)
+        self.assertIn("transaction_count is 0, expected 1", out.getvalue())
+        self.financial_year.refresh_from_db()
+        self.assertEqual(self.financial_year.transaction_count, 0)
+
+        out = StringIO()
+        call_command("reconcile_financial_year_totals", "--fix", stdout=out)
+        self.assertIn("1 financial years with drifted totals repaired", out.getvalue())
+        self.financial_year.refresh_from_db()
+        self.assertEqual(self.financial_year.total_credit, Decimal("100"))
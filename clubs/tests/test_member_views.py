@@ -78,6 +78,18 @@ class MemberLookUpViewTestCase(TestCase):
             reverse("clubs:detail", args=[self.investment_club.id]), response.url
         )
 
+    def test_post_method_admin_email_ignores_case(self):
+        """
+        Test POST request to the member lookup view with differently cased email.
+        """
+        self.client.login(email=self.test_email, password=self.test_password)
+        response = self.client.post(
+            reverse("clubs:member-lookup", args=[self.investment_club.id]),
+            {"email": "Cindy@Example.com"},
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.context["member"], self.second_user)
+
     def test_post_method_admin_valid_email(self):
         """
         Test POST request to the member lookup view when user is an admin of the club
@@ -185,3 +197,103 @@ class AddMemberToClubViewTestCase(TestCase):
                 club=self.investment_club, user=self.second_user
             ).exists()
         )
+
+
+class MemberSearchViewTestCase(TestCase):
+    """
+    Test case for the MemberSearchView typeahead.
+    """
+
+    test_email = "testuser@example.com"
+    test_password = "testPass123"
+
+    def setUp(self):
+        """
+        Set up a club admin, some users and a client.
+        """
+        self.user = User.objects.create_user(
+            email=self.test_email, password=self.test_password
+        )
+        self.club = Club.objects.create(
+            name="Test Club",
+            description="A club for testing.",
+            contact_email="jack.doe@example.com",
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        ClubMember.objects.create(club=self.club, user=self.user, is_admin=True)
+        self.cindy = User.objects.create_user(
+            email="cindy@example.com", first_name="Cindy", last_name="Doe"
+        )
+        self.john = User.objects.create_user(
+            email="jdoe@example.com", first_name="John", last_name="Doerr"
+        )
+        self.other_club = Club.objects.create(
+            name="Other Club",
+            description="Another club of the admin.",
+            contact_email=self.test_email,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        for user in (self.user, self.cindy, self.john):
+            ClubMember.objects.create(club=self.other_club, user=user)
+        self.url = reverse("clubs:member-search", args=[self.club.id])
+        self.client.login(email=self.test_email, password=self.test_password)
+
+    def search(self, term: str) -> list[str]:
+        """
+        Return the emails the typeahead suggests for ``term``.
+        """
+        response = self.client.get(self.url, {"q": term})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        return [user["email"] for user in response.json()["results"]]
+
+    def test_matches_email_and_name_prefixes_ignoring_case(self):
+        """
+        The term matches the start of the email, first name or last name.
+        """
+        self.assertEqual(self.search("CIN"), ["cindy@example.com"])
+        self.assertEqual(self.search("joh"), ["jdoe@example.com"])
+        self.assertEqual(self.search("Doe"), ["cindy@example.com", "jdoe@example.com"])
+        self.assertEqual(self.search("example"), [])
+
+    def test_excludes_members_and_short_terms(self):
+        """
+        Existing members of the club and terms below two characters are skipped.
+        """
+        ClubMember.objects.create(club=self.club, user=self.cindy)
+        self.assertEqual(self.search("doe"), ["jdoe@example.com"])
+        self.assertEqual(self.search("j"), [])
+
+    def test_results_are_limited(self):
+        """
+        At most ten users are suggested.
+        """
+        for index in range(12):
+            user = User.objects.create_user(email=f"doe{index:02}@example.com")
+            ClubMember.objects.create(club=self.other_club, user=user)
+        self.assertEqual(len(self.search("doe")), 10)
+
+    def test_unrelated_users_need_the_full_email(self):
+        """
+        Users who share no club with the admin are only found by their full
+        email, so the directory cannot be listed by prefix.
+        """
+        User.objects.create_user(
+            email="dora@example.com", first_name="Dora", last_name="Doe"
+        )
+        self.assertEqual(self.search("Doe"), ["cindy@example.com", "jdoe@example.com"])
+        self.assertEqual(self.search("dora"), [])
+        self.assertEqual(self.search("dora@example"), [])
+        self.assertEqual(self.search("DORA@example.com"), ["dora@example.com"])
+
+    def test_non_admin_is_redirected(self):
+        """
+        Members who are not club admins are sent back to the club page.
+        """
+        self.cindy.set_password(self.test_password)
+        self.cindy.save()
+        ClubMember.objects.create(club=self.club, user=self.cindy)
+        self.client.login(email="cindy@example.com", password=self.test_password)
+        response = self.client.get(self.url, {"q": "jo"})
+        self.assertEqual(response.status_code, HTTPStatus.FOUND)
@@ -0,0 +1,109 @@
+import base64
+import json
+from datetime import date
+from decimal import Decimal
+
+from django.test import TestCase
+
+from accounts.models import CustomUser as User
+from clubs.models import Club, FinancialTransaction, FinancialYear
+from clubs.views.pagination import keyset_paginate
+
+
+class TestKeysetPaginate(TestCase):
+    """
+    Test case for keyset pagination on (transaction_date, id).
+    """
+
+    def setUp(self):
+        """
+        Create five transactions, two of them on the same date.
+        """
+        user = User.objects.create(email="jane.doe@example.com")
+        club = Club.objects.create(
+            name="Investment Club",
+            description="A club for investment enthusiasts.",
+            contact_email=user.email,
+            created_by=user,
+            updated_by=user,
+        )
+        financial_year = FinancialYear.objects.create(
+            club=club,
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 12, 31),
+            created_by=user,
+            updated_by=user,
+        )
+        self.transactions = [
+            FinancialTransaction.objects.create(
+                financial_year=financial_year,
+                credit=Decimal("100"),
+                transaction_date=transaction_date,
+                description="Contribution",
+                created_by=user,
+                updated_by=user,
+            )
+            for transaction_date in (
+                date(2023, 1, 1),
+                date(2023, 2, 1),
+                date(2023, 2, 1),
+                date(2023, 3, 1),
+                date(2023, 4, 1),
+            )
+        ]
+        self.queryset = FinancialTransaction.objects.all()
+        self.fields = ("transaction_date", "id")
+
+    def test_walks_forward_and_back_through_all_rows(self):
+        """
+        Following next cursors visits every row once, newest first, and the
+        previous cursor leads back to the first page.
+        """
+        first = keyset_paginate(self.queryset, self.fields, page_size=2)
+        second = keyset_paginate(
+            self.queryset, self.fields, after=first.next_cursor, page_size=2
+        )
+        third = keyset_paginate(
+            self.queryset, self.fields, after=second.next_cursor, page_size=2
+        )
+        expected = list(reversed(self.transactions))
+        self.assertEqual(first.items + second.items + third.items, expected)
+        self.assertIsNone(first.previous_cursor)
+        self.assertIsNone(third.next_cursor)
+        back = keyset_paginate(
+            self.queryset, self.fields, before=second.previous_cursor, page_size=2
+        )
+        self.assertEqual(back.items, first.items)
+        self.assertIsNone(back.previous_cursor)
+
+    def test_invalid_cursor_returns_first_page(self):
+        """
+        A tampered cursor falls back to the first page.
+        """
+        page = keyset_paginate(self.queryset, self.fields, after="bogus", page_size=2)
+        self.assertEqual(page.items, list(reversed(self.transactions))[:2])
+
+    def test_malformed_cursor_payloads_return_first_page(self):
+        """
+        Cursors with values of the wrong type, length or range fall back to
+        the first page.
+        """
+        first_page = list(reversed(self.transactions))[:2]
+        for values in (
+            [[1], 1],
+            [{"a": 1}, 1],
+            [1.5, 2],
+            ["2023-02-01", None],
+            ["2023-02-01"],
+            {"transaction_date": "2023-02-01"},
+            ["2023-02-01", str(2**63)],
+            ["2023-02-01", "99999999999999999999999999"],
+            ["99999-01-01", "1"],
+        ):
+            cursor = base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+            for direction in ("after", "before"):
+                with self.subTest(values=values, direction=direction):
+                    page = keyset_paginate(
+                        self.queryset, self.fields, page_size=2, **{direction: cursor}
+                    )
+                    self.assertEqual(page.items, first_page)
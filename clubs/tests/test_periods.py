@@ -0,0 +1,83 @@
+from datetime import date
+
+from django.test import SimpleTestCase
+
+from clubs.models import FinancialYear
+from clubs.services.periods import (
+    add_months,
+    month_range,
+    month_start,
+    resolve_month_and_year,
+)
+
+
+class TestMonthRange(SimpleTestCase):
+    """
+    Test case for the half-open month period helpers.
+    """
+
+    def test_month_start(self):
+        """
+        Any day of a month maps to the first day of that month.
+        """
+        self.assertEqual(month_start(date(2024, 2, 29)), date(2024, 2, 1))
+
+    def test_mid_year_month(self):
+        """
+        The range ends on the first day of the following month.
+        """
+        self.assertEqual(
+            month_range(date(2024, 2, 14)), (date(2024, 2, 1), date(2024, 3, 1))
+        )
+
+    def test_december_rolls_over_to_next_year(self):
+        """
+        December ends on the first of January of the next year.
+        """
+        self.assertEqual(
+            month_range(date(2023, 12, 31)), (date(2023, 12, 1), date(2024, 1, 1))
+        )
+
+
+class TestAddMonths(SimpleTestCase):
+    """
+    Test case for stepping over months.
+    """
+
+    def test_steps_across_year_end(self):
+        """
+        Adding months rolls over into the next year on the first of the month.
+        """
+        self.assertEqual(add_months(date(2023, 11, 15), 3), date(2024, 2, 1))
+
+
+class TestResolveMonthAndYear(SimpleTestCase):
+    """
+    Test case for resolving the report month from request params.
+    """
+
+    def setUp(self):
+        """
+        Set up a financial year spanning two calendar years.
+        """
+        self.financial_year = FinancialYear(
+            start_date=date(2022, 7, 1), end_date=date(2023, 6, 30)
+        )
+
+    def test_valid_month_and_year(self):
+        """
+        A month and a year of the financial year are used as given.
+        """
+        self.assertEqual(
+            resolve_month_and_year("3", "2023", self.financial_year), (3, 2023)
+        )
+
+    def test_year_outside_financial_year_falls_back(self):
+        """
+        A year the financial year does not span falls back to its last year.
+        """
+        for year in ("2031", "abc", None):
+            with self.subTest(year=year):
+                self.assertEqual(
+                    resolve_month_and_year("3", year, self.financial_year), (3, 2023)
+                )
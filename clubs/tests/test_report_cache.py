@@ -0,0 +1,123 @@
+import tempfile
+from datetime import date
+from decimal import Decimal
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from accounts.models import CustomUser as User
+from clubs.models import Club, ClubMember, FinancialTransaction, FinancialYear
+from clubs.services.report_cache import (
+    bump_report_version,
+    get_cached_report,
+    get_report_version,
+)
+
+LOCMEM_CACHE = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "report-cache-tests",
+    }
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHE, REPORT_CACHE_TIMEOUT=3600)
+class TestReportCache(TestCase):
+    """
+    Test case for the versioned per financial year report cache.
+    """
+
+    def setUp(self):
+        """
+        Set up a club with a financial year and start from an empty cache.
+        """
+        cache.clear()
+        self.user = User.objects.create(email="jane.doe@example.com")
+        self.club = Club.objects.create(
+            name="Investment Club",
+            description="A club for investment enthusiasts.",
+            contact_email=self.user.email,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.financial_year = FinancialYear.objects.create(
+            club=self.club,
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 12, 31),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.build = mock.Mock(return_value={"sum_credit": Decimal("10")})
+
+    def test_report_is_built_once_per_version(self):
+        """
+        A cached report is reused until the financial year version changes.
+        """
+        month = date(2023, 5, 1)
+        get_cached_report(self.financial_year.id, month, self.build)
+        report = get_cached_report(self.financial_year.id, month, self.build)
+        self.assertEqual(report, {"sum_credit": Decimal("10")})
+        self.assertEqual(self.build.call_count, 1)
+        bump_report_version(self.financial_year.id)
+        get_cached_report(self.financial_year.id, month, self.build)
+        self.assertEqual(self.build.call_count, 2)
+
+    @override_settings(REPORT_CACHE_TIMEOUT=0)
+    def test_zero_timeout_builds_every_time(self):
+        """
+        A REPORT_CACHE_TIMEOUT of 0, the default for a per-process cache,
+        builds the report on every call.
+        """
+        month = date(2023, 5, 1)
+        get_cached_report(self.financial_year.id, month, self.build)
+        get_cached_report(self.financial_year.id, month, self.build)
+        self.assertEqual(self.build.call_count, 2)
+
+    def test_saving_a_transaction_bumps_the_version(self):
+        """
+        Committing a FinancialTransaction invalidates the financial year reports.
+        """
+        version = get_report_version(self.financial_year.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            FinancialTransaction.objects.create(
+                financial_year=self.financial_year,
+                club_member=ClubMember.objects.create(user=self.user, club=self.club),
+                credit=Decimal("100"),
+                transaction_date=date(2023, 5, 3),
+                description="Contribution",
+                created_by=self.user,
+                updated_by=self.user,
+            )
+        self.assertNotEqual(get_report_version(self.financial_year.id), version)
+
+    def test_bump_without_a_stored_version(self):
+        """
+        Bumping a version that was evicted stores a fresh one.
+        """
+        bump_report_version(self.financial_year.id)
+        self.assertIsNotNone(
+            cache.get(f"clubs:report-version:{self.financial_year.id}")
+        )
+
+
+class TestReportCacheFileBackend(TestCase):
+    """
+    Test case for the report cache on the file based backend.
+    """
+
+    def test_version_bump_on_file_backend(self):
+        """
+        Versions are stored and incremented on the file based backend.
+        """
+        with tempfile.TemporaryDirectory() as location:
+            caches = {
+                "default": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": location,
+                }
+            }
+            with override_settings(CACHES=caches):
+                version = get_report_version(1)
+                bump_report_version(1)
+                self.assertEqual(get_report_version(1), version + 1)
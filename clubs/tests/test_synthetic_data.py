@@ -0,0 +1,59 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from clubs.models import (
+    Club,
+    ClubMember,
+    FinancialTransaction,
+    FinancialYearParticipant,
+    IndividualDue,
+    MonthlyLedgerSnapshot,
+)
+
+
+class TestSeedSyntheticData(TestCase):
+    """
+    Test case for the seed_synthetic_data management command.
+    """
+
+    def seed(self) -> list[tuple]:
+        """
+        Seed a small data set and return its transactions.
+        """
+        call_command(
+            "seed_synthetic_data",
+            clubs=2,
+            members=3,
+            years=2,
+            transactions=40,
+            seed=7,
+            stdout=StringIO(),
+        )
+        return list(
+            FinancialTransaction.objects.order_by("id").values_list(
+                "transaction_date", "credit", "debit"
+            )
+        )
+
+    def test_seeds_the_requested_volumes(self):
+        """
+        Every club gets its members, financial years, transactions and ledger.
+        """
+        self.seed()
+        self.assertEqual(Club.objects.count(), 2)
+        self.assertEqual(ClubMember.objects.filter(is_admin=True).count(), 2)
+        self.assertEqual(ClubMember.objects.count(), 6)
+        self.assertEqual(FinancialYearParticipant.objects.count(), 12)
+        self.assertEqual(FinancialTransaction.objects.count(), 160)
+        self.assertEqual(IndividualDue.objects.count(), 8)
+        self.assertTrue(MonthlyLedgerSnapshot.objects.exists())
+
+    def test_same_seed_gives_the_same_data(self):
+        """
+        Seeding twice with the same seed produces the same transactions.
+        """
+        first = self.seed()
+        FinancialTransaction.objects.all().delete()
+        self.assertEqual(self.seed(), first)
@@ -0,0 +1,176 @@
+import tempfile
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.urls import reverse
+
+from accounts.models import CustomUser as User
+from clubs.models import (
+    Club,
+    ClubMember,
+    FinancialTransaction,
+    FinancialYear,
+    FinancialYearParticipant,
+    MonthlyLedgerSnapshot,
+)
+from clubs.services.transaction_import import import_transactions
+
+HEADER = "transaction_date,description,credit,debit,member_email\n"
+
+
+class TestImportTransactions(TestCase):
+    """
+    Test case for the CSV transaction import.
+    """
+
+    def setUp(self):
+        """
+        Set up a financial year with the admin member as its only participant.
+        """
+        self.user = User.objects.create_user(
+            email="jane.doe@example.com", password="testPass123"
+        )
+        self.club = Club.objects.create(
+            name="Investment Club",
+            description="A club for investment enthusiasts.",
+            contact_email=self.user.email,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.financial_year = FinancialYear.objects.create(
+            club=self.club,
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 12, 31),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.club_member = ClubMember.objects.create(
+            user=self.user, club=self.club, is_admin=True
+        )
+        FinancialYearParticipant.objects.create(
+            financial_year=self.financial_year,
+            club_member=self.club_member,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+
+    def test_import_in_chunks_updates_snapshots(self):
+        """
+        Valid rows are inserted across chunks and rolled into the snapshots.
+        """
+        csv_file = StringIO(
+            HEADER
+            + "2023-03-02,Contribution,100,,Jane.Doe@example.com\n"
+            + "2023-03-20,Contribution,50,,jane.doe@example.com\n"
+            + "2023-04-01,Bank charges,,30,\n"
+        )
+        result = import_transactions(
+            self.financial_year, csv_file, self.user, chunk_size=2
+        )
+        self.assertTrue(result.ok)
+        self.assertEqual(result.created, 3)
+        self.assertEqual(
+            FinancialTransaction.objects.filter(club_member=self.club_member).count(),
+            2,
+        )
+        snapshot = MonthlyLedgerSnapshot.objects.get(club_member=self.club_member)
+        self.assertEqual(snapshot.month, date(2023, 3, 1))
+        self.assertEqual(snapshot.credit, Decimal("150"))
+        club_level = MonthlyLedgerSnapshot.objects.get(club_member=None)
+        self.assertEqual(club_level.debit, Decimal("30"))
+
+    def test_invalid_rows_are_reported_and_nothing_is_saved(self):
+        """
+        Every invalid row is reported with its line and the import rolls back.
+        """
+        csv_file = StringIO(
+            HEADER
+            + "2023-03-02,Contribution,100,,jane.doe@example.com\n"
+            + "not-a-date,Contribution,100,,\n"
+            + "2023-03-02,Contribution,,,\n"
+            + "2024-01-02,Contribution,100,,stranger@example.com\n"
+        )
+        result = import_transactions(
+            self.financial_year, csv_file, self.user, chunk_size=1
+        )
+        self.assertFalse(result.ok)
+        self.assertEqual(result.created, 0)
+        self.assertEqual([line for line, _ in result.errors], [3, 4, 5])
+        self.assertIn("Outside the financial year", result.errors[2][1])
+        self.assertIn("stranger@example.com", result.errors[2][1])
+        self.assertFalse(FinancialTransaction.objects.exists())
+        self.assertFalse(MonthlyLedgerSnapshot.objects.exists())
+
+    def test_missing_columns(self):
+        """
+        A file without the expected header is rejected.
+        """
+        result = import_transactions(
+            self.financial_year, StringIO("date,amount\n"), self.user
+        )
+        self.assertEqual(result.error_count, 1)
+        self.assertIn("Missing columns", result.errors[0][1])
+
+    def test_import_view(self):
+        """
+        An admin can upload a CSV through the import view.
+        """
+        self.client.login(email=self.user.email, password="testPass123")
+        url = reverse(
+            "clubs:financial-transaction-import",
+            args=[self.club.id, self.financial_year.id],
+        )
+        upload = SimpleUploadedFile(
+            "statement.csv",
+            (HEADER + "2023-05-01,Contribution,1000,,jane.doe@example.com\n").encode(),
+            content_type="text/csv",
+        )
+        response = self.client.post(url, {"file": upload})
+        self.assertEqual(response.context["import_result"].created, 1)
+        self.assertContains(response, "Imported 1 transaction.")
+
+    def test_import_view_shows_new_totals(self):
+        """
+        The page rendered after an import counts the imported transactions.
+        """
+        self.client.login(email=self.user.email, password="testPass123")
+        url = reverse(
+            "clubs:financial-transaction-import",
+            args=[self.club.id, self.financial_year.id],
+        )
+        upload = SimpleUploadedFile(
+            "statement.csv",
+            (
+                HEADER
+                + "2023-05-01,Contribution,1000,,jane.doe@example.com\n"
+                + "2023-05-02,Bank charges,,250,\n"
+            ).encode(),
+            content_type="text/csv",
+        )
+        response = self.client.post(url, {"file": upload})
+        self.assertEqual(response.context["transaction_count"], 2)
+        self.assertEqual(response.context["total_credit"], Decimal("1000"))
+        self.assertEqual(response.context["total_debit"], Decimal("250"))
+        self.assertEqual(response.context["participant_count"], 1)
+        self.assertContains(response, '<div class="si-stat-value">2</div>', html=True)
+
+    def test_management_command(self):
+        """
+        The import_transactions command fails loudly on invalid rows.
+        """
+        with tempfile.NamedTemporaryFile("w", suffix=".csv") as csv_file:
+            csv_file.write(HEADER + "2023-05-01,Contribution,abc,,\n")
+            csv_file.flush()
+            with self.assertRaises(CommandError):
+                call_command(
+                    "import_transactions",
+                    self.financial_year.id,
+                    csv_file.name,
+                    user=self.user.email,
+                    stderr=StringIO(),
+                )
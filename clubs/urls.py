@@ -1,16 +1,30 @@
 from django.urls import path
 
+from clubs.views.club_export_view import (
+    IndividualDuesExportView,
+    ParticipantBalancesExportView,
+    TransactionsExportView,
+)
 from clubs.views.club_financial_view import (
     ClubFinancialYearCreateView,
     ClubFinancialYearDetailView,
     FinancialTransactionCreateView,
+    FinancialTransactionImportView,
     FinancialYearDueCreateView,
     FinancialYearIndividualDueCreateView,
     FinancialYearParticipantCreateView,
 )
-from clubs.views.club_reports_view import FinancialReportView
+from clubs.views.club_reports_view import (
+    AsyncFinancialReportView,
+    DuesSimulatorView,
+    FinancialReportView,
+)
 from clubs.views.club_views import ClubDetailView, ClubsListView
-from clubs.views.member_views import ClubMemberView, MemberLookUpView
+from clubs.views.member_views import (
+    ClubMemberView,
+    MemberLookUpView,
+    MemberSearchView,
+)
 
 app_name = "clubs"
 
@@ -20,6 +34,9 @@ urlpatterns = [
     path(
         "<int:club_id>/member-lookup/", MemberLookUpView.as_view(), name="member-lookup"
     ),
+    path(
+        "<int:club_id>/member-search/", MemberSearchView.as_view(), name="member-search"
+    ),
     path("<int:club_id>/club-member/", ClubMemberView.as_view(), name="club-member"),
     path(
         "<int:club_id>/financial-year/",
@@ -46,6 +63,11 @@ urlpatterns = [
         FinancialTransactionCreateView.as_view(),
         name="financial-transaction",
     ),
+    path(
+        "<int:club_id>/financial-year/<int:financial_year_id>/transaction/import/",
+        FinancialTransactionImportView.as_view(),
+        name="financial-transaction-import",
+    ),
     path(
         "<int:club_id>/financial-year/<int:financial_year_id>/participant/",
         FinancialYearParticipantCreateView.as_view(),
@@ -56,4 +78,29 @@ urlpatterns = [
         FinancialReportView.as_view(),
         name="financial-reports",
     ),
+    path(
+        "<int:club_id>/financial-year/<int:financial_year_id>/reports/async/",
+        AsyncFinancialReportView.as_view(),
+        name="financial-reports-async",
+    ),
+    path(
+        "<int:club_id>/financial-year/<int:financial_year_id>/dues-simulator/",
+        DuesSimulatorView.as_view(),
+        name="dues-simulator",
+    ),
+    path(
+        "<int:club_id>/financial-year/<int:financial_year_id>/export/transactions/",
+        TransactionsExportView.as_view(),
+        name="export-transactions",
+    ),
+    path(
+        "<int:club_id>/financial-year/<int:financial_year_id>/export/individual-dues/",
+        IndividualDuesExportView.as_view(),
+        name="export-individual-dues",
+    ),
+    path(
+        "<int:club_id>/financial-year/<int:financial_year_id>/export/balances/",
+        ParticipantBalancesExportView.as_view(),
+        name="export-participant-balances",
+    ),
 ]
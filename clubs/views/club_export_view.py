@@ -0,0 +1,179 @@
+import csv
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from datetime import date
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import StreamingHttpResponse
+from django.views import View
+
+from clubs.models import FinancialTransaction, FinancialYear, IndividualDue
+from clubs.services.dues import participant_balances
+from clubs.services.periods import resolve_month_and_year
+from clubs.views.utils import ClubAccessMixin
+from common.db_router import iterate_in_request_context
+
+EXPORT_CHUNK_SIZE = 2000
+
+# Spreadsheets evaluate cells starting with these as formulas.
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class Echo:
+    """
+    File-like object that hands back what csv.writer writes to it, so rows can
+    be streamed without buffering the file.
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def escape_formula(value):
+    """
+    Prefix text cells that a spreadsheet would evaluate as a formula with a
+    quote, so that user entered text cannot inject formulas into an export.
+    """
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def stream_csv(
+    filename: str, header: list[str], rows: Iterable
+) -> StreamingHttpResponse:
+    """
+    Return a response that streams ``header`` and ``rows`` as a CSV download.
+    """
+    writer = csv.writer(Echo())
+    response = StreamingHttpResponse(
+        (
+            writer.writerow([escape_formula(value) for value in row])
+            for row in _with_header(header, rows)
+        ),
+        content_type="text/csv",
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+def _with_header(header: list[str], rows: Iterable):
+    yield header
+    yield from rows
+
+
+class FinancialYearExportView(LoginRequiredMixin, ClubAccessMixin, View, ABC):
+    """
+    Base view for the CSV exports of a financial year. Subclasses set ``name``
+    and ``header`` and implement ``get_rows``.
+    """
+
+    read_replica = True
+
+    name = ""
+    header: list[str] = []
+
+    @abstractmethod
+    def get_rows(self, request, financial_year: FinancialYear) -> Iterable:
+        """
+        Return the rows of the export, lazily so they are streamed.
+        """
+
+    def get(self, request, club_id: int, financial_year_id: int):
+        """
+        Handle GET requests to download the export.
+        """
+        financial_year = self.access.financial_year
+        filename = (
+            f"{self.name}-{financial_year.start_date}-{financial_year.end_date}.csv"
+        )
+        return stream_csv(
+            filename,
+            self.header,
+            iterate_in_request_context(self.get_rows(request, financial_year)),
+        )
+
+
+class TransactionsExportView(FinancialYearExportView):
+    """
+    Stream every transaction of a financial year as CSV. The columns match the
+    transaction import so an export can be imported again.
+    """
+
+    name = "transactions"
+    header = [
+        "transaction_date",
+        "description",
+        "credit",
+        "debit",
+        "member_email",
+        "member_name",
+    ]
+
+    def get_rows(self, request, financial_year: FinancialYear) -> Iterable:
+        rows = (
+            FinancialTransaction.objects.filter(financial_year=financial_year)
+            .order_by("transaction_date", "id")
+            .values_list(
+                "transaction_date",
+                "description",
+                "credit",
+                "debit",
+                "club_member__user__email",
+                "club_member__user__first_name",
+                "club_member__user__last_name",
+            )
+        )
+        for *values, first_name, last_name in rows.iterator(
+            chunk_size=EXPORT_CHUNK_SIZE
+        ):
+            yield [*values, f"{first_name or ''} {last_name or ''}".strip()]
+
+
+class IndividualDuesExportView(FinancialYearExportView):
+    """
+    Stream every individual due of a financial year as CSV.
+    """
+
+    name = "individual-dues"
+    header = ["due_date", "description", "amount", "member_email", "member_name"]
+
+    def get_rows(self, request, financial_year: FinancialYear) -> Iterable:
+        rows = (
+            IndividualDue.objects.filter(financial_year=financial_year)
+            .order_by("due_date", "id")
+            .values_list(
+                "due_date",
+                "description",
+                "amount",
+                "club_member__user__email",
+                "club_member__user__first_name",
+                "club_member__user__last_name",
+            )
+        )
+        for *values, first_name, last_name in rows.iterator(
+            chunk_size=EXPORT_CHUNK_SIZE
+        ):
+            yield [*values, f"{first_name} {last_name}".strip()]
+
+
+class ParticipantBalancesExportView(FinancialYearExportView):
+    """
+    Stream the participant balances of the financial reports as CSV, up to the
+    month and year given in the query string.
+    """
+
+    name = "participant-balances"
+    header = ["member_name", "due", "total_credit", "total_debit"]
+
+    def get_rows(self, request, financial_year: FinancialYear) -> Iterable:
+        month, year = resolve_month_and_year(
+            request.GET.get("month"), request.GET.get("year"), financial_year
+        )
+        for row in participant_balances(financial_year, date(year, month, 1)):
+            yield [
+                f"{row['first_name']} {row['last_name']}".strip(),
+                row["due"],
+                row["total_credit"],
+                row["total_debit"],
+            ]
@@ -1,11 +1,15 @@
+import io
 from http import HTTPStatus
 
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db import transaction
+from django.http import HttpResponse
 from django.shortcuts import redirect, render
 from django.views import View
 
 from clubs.forms.club_financials_forms import (
     FinancialTransactionForm,
+    FinancialTransactionImportForm,
     FinancialYearContributionForm,
     FinancialYearForm,
     FinancialYearParticipantForm,
@@ -15,18 +19,89 @@ from clubs.forms.club_membership_form import MemberLookupForm
 from clubs.models import (
     Club,
     FinancialTransaction,
-    FinancialYear,
     FinancialYearContribution,
     FinancialYearParticipant,
 )
-from clubs.views.utils import is_club_admin_or_creator
+from clubs.services.ledger import TOTAL_FIELDS
+from clubs.services.transaction_import import import_transactions
+from clubs.views.pagination import keyset_paginate
+from clubs.views.utils import ClubAccessMixin, wants_fragment
+
+TRANSACTIONS_PAGE_SIZE = 50
+
+
+FRAGMENT_ROW_TEMPLATES = {
+    "transactions": "clubs/partials/transaction_row.html",
+    "dues": "clubs/partials/due_row.html",
+    "participants": "clubs/partials/participant_row.html",
+    "individual-dues": "clubs/partials/individual_due_row.html",
+}
+
+
+def transaction_stats(financial_year) -> dict:
+    """
+    Read the transaction count and totals of a financial year for the stat
+    cards from its running totals.
+    """
+    return {
+        "transaction_count": financial_year.transaction_count,
+        "total_credit": financial_year.total_credit,
+        "total_debit": financial_year.total_debit,
+    }
+
+
+def render_created_fragment(
+    request, rows: str, obj, financial_year=None
+) -> HttpResponse:
+    """
+    Render the table row of a newly created object for the ``rows`` table of
+    the financial year page. When ``financial_year`` is given, the stat cards
+    are rendered as well.
+    """
+    context = {
+        "rows": rows,
+        "row_template": FRAGMENT_ROW_TEMPLATES[rows],
+        "object": obj,
+    }
+    if financial_year is not None:
+        # The running totals were just updated in the database.
+        financial_year.refresh_from_db(fields=TOTAL_FIELDS)
+        context.update(
+            financial_year=financial_year,
+            participant_count=financial_year.participant_count,
+            **transaction_stats(financial_year),
+        )
+    return render(
+        request,
+        "clubs/partials/financial_year_fragment.html",
+        context,
+        status=HTTPStatus.CREATED,
+    )
+
+
+def render_form_errors(request, form) -> HttpResponse:
+    """
+    Render the errors of an invalid form for a fragment request.
+    """
+    return render(
+        request,
+        "clubs/partials/form_errors.html",
+        {"form": form},
+        status=HTTPStatus.BAD_REQUEST,
+    )
 
 
 def prepare_financial_year_context(
-    club: Club, financial_year, is_club_admin: bool = True
+    club: Club,
+    financial_year,
+    is_club_admin: bool = True,
+    after: str | None = None,
+    before: str | None = None,
 ) -> dict:
     """
     Prepare context data for a financial year detail view.
+    Transactions are keyset paginated on (transaction_date, id), newest first,
+    starting after or before the given cursors.
     """
     participants = FinancialYearParticipant.objects.filter(
         financial_year=financial_year
@@ -34,10 +109,14 @@ def prepare_financial_year_context(
     dues = FinancialYearContribution.objects.filter(
         financial_year=financial_year
     ).order_by("due_period")
-    transactions = (
-        FinancialTransaction.objects.filter(financial_year=financial_year)
-        .order_by("-transaction_date")
-        .select_related("club_member__user")
+    transaction_page = keyset_paginate(
+        FinancialTransaction.objects.filter(
+            financial_year=financial_year
+        ).select_related("club_member__user"),
+        ("transaction_date", "id"),
+        after=after,
+        before=before,
+        page_size=TRANSACTIONS_PAGE_SIZE,
     )
     individual_dues = financial_year.individual_dues.select_related("club_member__user")
     context = {
@@ -45,33 +124,39 @@ def prepare_financial_year_context(
         "financial_year": financial_year,
         "participants": participants,
         "dues": dues,
-        "transactions": transactions,
+        "transactions": transaction_page.items,
+        "transaction_page": transaction_page,
+        **transaction_stats(financial_year),
+        "participant_count": financial_year.participant_count,
         "financial_contribution_form": FinancialYearContributionForm(),
-        "financial_transaction_form": FinancialTransactionForm(),
-        "participant_form": FinancialYearParticipantForm(),
-        "individual_due_form": IndividualDueForm(),
+        "financial_transaction_form": FinancialTransactionForm(
+            club=club, financial_year=financial_year
+        ),
+        "transaction_import_form": FinancialTransactionImportForm(),
+        "participant_form": FinancialYearParticipantForm(
+            club=club, financial_year=financial_year
+        ),
+        "individual_due_form": IndividualDueForm(
+            club=club, financial_year=financial_year
+        ),
         "individual_dues": individual_dues,
         "is_club_admin": is_club_admin,
     }
     return context
 
 
-class ClubFinancialYearCreateView(LoginRequiredMixin, View):
+class ClubFinancialYearCreateView(LoginRequiredMixin, ClubAccessMixin, View):
     """
     View to handle the creation of a new financial year for a club.
     """
 
+    club_admin_required = True
+
     def post(self, request, club_id):
         """
         Handle POST requests to create a new financial year.
         """
-        try:
-            club = Club.objects.get(id=club_id)
-            allowed = is_club_admin_or_creator(request, club)
-            if not allowed:
-                return render(request, "clubs/403.html", status=HTTPStatus.FORBIDDEN)
-        except Club.DoesNotExist:
-            return redirect("clubs:index")
+        club = self.access.club
         form = FinancialYearForm(request.POST)
         if not form.is_valid():
             members = club.members.select_related("user").all()[:25]
@@ -91,50 +176,47 @@ class ClubFinancialYearCreateView(LoginRequiredMixin, View):
         return redirect("clubs:detail", club_id=club.id)
 
 
-class ClubFinancialYearDetailView(LoginRequiredMixin, View):
+class ClubFinancialYearDetailView(LoginRequiredMixin, ClubAccessMixin, View):
     """
     View to display details of a specific financial year for a club.
     """
 
+    read_replica = True
+
     def get(self, request, club_id, financial_year_id):
         """
         Handle GET requests to display the financial year details.
         """
-        try:
-            club = Club.objects.get(id=club_id)
-            is_club_admin = is_club_admin_or_creator(request, club)
-            is_member = club.members.filter(user=request.user).exists()
-            if not is_club_admin and not is_member:
-                return render(request, "clubs/403.html", status=HTTPStatus.FORBIDDEN)
-            financial_year = club.financial_years.get(id=financial_year_id)
-        except (Club.DoesNotExist, FinancialYear.DoesNotExist):
-            return redirect("clubs:index")
         return render(
             request,
             "clubs/financial_year_detail.html",
-            prepare_financial_year_context(club, financial_year, is_club_admin),
+            prepare_financial_year_context(
+                self.access.club,
+                self.access.financial_year,
+                self.access.is_admin,
+                after=request.GET.get("after"),
+                before=request.GET.get("before"),
+            ),
         )
 
 
-class FinancialYearDueCreateView(LoginRequiredMixin, View):
+class FinancialYearDueCreateView(LoginRequiredMixin, ClubAccessMixin, View):
     """
     View to handle the creation of a new due/contribution for a financial year.
     """
 
+    club_admin_required = True
+
     def post(self, request, club_id: int, financial_year_id: int):
         """
         Handle POST requests to create a new due/contribution.
         """
-        try:
-            club = Club.objects.get(id=club_id)
-            financial_year = club.financial_years.get(id=financial_year_id)
-            allowed = is_club_admin_or_creator(request, club)
-            if not allowed:
-                return render(request, "clubs/403.html", status=HTTPStatus.FORBIDDEN)
-        except (Club.DoesNotExist, FinancialYear.DoesNotExist):
-            return redirect("clubs:index")
+        club = self.access.club
+        financial_year = self.access.financial_year
         form = FinancialYearContributionForm(request.POST)
         if not form.is_valid():
+            if wants_fragment(request):
+                return render_form_errors(request, form)
             return render(
                 request,
                 "clubs/financial_year_detail.html",
@@ -145,42 +227,50 @@ class FinancialYearDueCreateView(LoginRequiredMixin, View):
         new_due.created_by = request.user
         new_due.updated_by = request.user
         new_due.save()
+        if wants_fragment(request):
+            return render_created_fragment(request, "dues", new_due)
         return render(
             request,
             "clubs/financial_year_detail.html",
-            prepare_financial_year_context(club, financial_year, allowed),
+            prepare_financial_year_context(club, financial_year),
         )
 
 
-class FinancialTransactionCreateView(LoginRequiredMixin, View):
+class FinancialTransactionCreateView(LoginRequiredMixin, ClubAccessMixin, View):
     """
     View to handle the creation of a new financial transaction for a financial year.
     """
 
+    club_admin_required = True
+
     def post(self, request, club_id: int, financial_year_id: int):
         """
         Handle POST requests to create a new financial transaction.
         """
-        try:
-            club = Club.objects.get(id=club_id)
-            financial_year = club.financial_years.get(id=financial_year_id)
-            allowed = is_club_admin_or_creator(request, club)
-            if not allowed:
-                return render(request, "clubs/403.html", status=HTTPStatus.FORBIDDEN)
-        except (Club.DoesNotExist, FinancialYear.DoesNotExist):
-            return redirect("clubs:index")
-        form = FinancialTransactionForm(request.POST)
+        club = self.access.club
+        financial_year = self.access.financial_year
+        form = FinancialTransactionForm(
+            request.POST, club=club, financial_year=financial_year
+        )
         if not form.is_valid():
+            if wants_fragment(request):
+                return render_form_errors(request, form)
             return render(
                 request,
                 "clubs/financial_year_detail.html",
-                prepare_financial_year_context(club, financial_year, allowed),
+                prepare_financial_year_context(club, financial_year),
             )
         new_transaction = form.save(commit=False)
         new_transaction.financial_year = financial_year
         new_transaction.created_by = request.user
         new_transaction.updated_by = request.user
-        new_transaction.save()
+        # post_save rolls the row into the ledger in the same transaction.
+        with transaction.atomic():
+            new_transaction.save()
+        if wants_fragment(request):
+            return render_created_fragment(
+                request, "transactions", new_transaction, financial_year
+            )
         return redirect(
             "clubs:financial-year-detail",
             club_id=club.id,
@@ -188,35 +278,69 @@ class FinancialTransactionCreateView(LoginRequiredMixin, View):
         )
 
 
-class FinancialYearParticipantCreateView(LoginRequiredMixin, View):
+class FinancialTransactionImportView(LoginRequiredMixin, ClubAccessMixin, View):
+    """
+    View to import a CSV of financial transactions into a financial year.
+    """
+
+    club_admin_required = True
+
+    def post(self, request, club_id: int, financial_year_id: int):
+        """
+        Handle POST requests to import an uploaded CSV of transactions.
+        """
+        club = self.access.club
+        financial_year = self.access.financial_year
+        form = FinancialTransactionImportForm(request.POST, request.FILES)
+        if not form.is_valid():
+            context = prepare_financial_year_context(club, financial_year)
+            context["transaction_import_form"] = form
+            return render(request, "clubs/financial_year_detail.html", context)
+        csv_file = io.TextIOWrapper(
+            form.cleaned_data["file"].file, encoding="utf-8-sig", newline=""
+        )
+        result = import_transactions(financial_year, csv_file, request.user)
+        # The import moved the running totals in the database.
+        financial_year.refresh_from_db(fields=TOTAL_FIELDS)
+        context = prepare_financial_year_context(club, financial_year)
+        context["import_result"] = result
+        return render(request, "clubs/financial_year_detail.html", context)
+
+
+class FinancialYearParticipantCreateView(LoginRequiredMixin, ClubAccessMixin, View):
     """
     View to handle the creation of a new participant for a financial year.
     """
 
+    club_admin_required = True
+
     def post(self, request, club_id: int, financial_year_id: int):
         """
         Handle POST requests to create a new financial year participant.
         """
-        try:
-            club = Club.objects.get(id=club_id)
-            financial_year = club.financial_years.get(id=financial_year_id)
-            allowed = is_club_admin_or_creator(request, club)
-            if not allowed:
-                return render(request, "clubs/403.html", status=HTTPStatus.FORBIDDEN)
-        except (Club.DoesNotExist, FinancialYear.DoesNotExist):
-            return redirect("clubs:index")
-        form = FinancialYearParticipantForm(request.POST)
+        club = self.access.club
+        financial_year = self.access.financial_year
+        form = FinancialYearParticipantForm(
+            request.POST, club=club, financial_year=financial_year
+        )
         if not form.is_valid():
+            if wants_fragment(request):
+                return render_form_errors(request, form)
             return render(
                 request,
                 "clubs/financial_year_detail.html",
-                prepare_financial_year_context(club, financial_year, allowed),
+                prepare_financial_year_context(club, financial_year),
             )
         new_participant = form.save(commit=False)
         new_participant.financial_year = financial_year
         new_participant.created_by = request.user
         new_participant.updated_by = request.user
-        new_participant.save()
+        with transaction.atomic():
+            new_participant.save()
+        if wants_fragment(request):
+            return render_created_fragment(
+                request, "participants", new_participant, financial_year
+            )
         return redirect(
             "clubs:financial-year-detail",
             club_id=club.id,
@@ -224,36 +348,36 @@ class FinancialYearParticipantCreateView(LoginRequiredMixin, View):
         )
 
 
-class FinancialYearIndividualDueCreateView(LoginRequiredMixin, View):
+class FinancialYearIndividualDueCreateView(LoginRequiredMixin, ClubAccessMixin, View):
     """
     View to handle the creation of an IndividualDue for a financial year.
     """
 
-    # Todo: check if the participant is part of the financial year
-    # before allowing the creation of an individual due for that participant.
+    club_admin_required = True
+
     def post(self, request, club_id: int, financial_year_id: int):
-        try:
-            club = Club.objects.get(id=club_id)
-            financial_year = club.financial_years.get(id=financial_year_id)
-            allowed = is_club_admin_or_creator(request, club)
-            if not allowed:
-                return render(request, "clubs/403.html", status=HTTPStatus.FORBIDDEN)
-        except (Club.DoesNotExist, FinancialYear.DoesNotExist):
-            return redirect("clubs:index")
-        form = IndividualDueForm(request.POST)
+        club = self.access.club
+        financial_year = self.access.financial_year
+        form = IndividualDueForm(request.POST, club=club, financial_year=financial_year)
         if not form.is_valid():
+            if wants_fragment(request):
+                return render_form_errors(request, form)
             return render(
                 request,
                 "clubs/financial_year_detail.html",
-                prepare_financial_year_context(club, financial_year, allowed),
+                prepare_financial_year_context(club, financial_year),
             )
         new_due = form.save(commit=False)
         new_due.financial_year = financial_year
         new_due.created_by = request.user
         new_due.updated_by = request.user
-        new_due.save()
+        with transaction.atomic():
+            new_due.save()
+        if wants_fragment(request):
+            return render_created_fragment(request, "individual-dues", new_due)
+        financial_year.refresh_from_db(fields=TOTAL_FIELDS)
         return render(
             request,
             "clubs/financial_year_detail.html",
-            prepare_financial_year_context(club, financial_year, allowed),
+            prepare_financial_year_context(club, financial_year),
         )
@@ -1,22 +1,36 @@
-from calendar import monthrange
+import asyncio
+import json
 from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
 from http import HTTPStatus
 
+from asgiref.sync import sync_to_async
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Sum
-from django.shortcuts import redirect, render
+from django.db.models import QuerySet
+from django.http import HttpResponse, JsonResponse
+from django.shortcuts import render
 from django.views import View
 
-from clubs.models import (
-    Club,
-    ClubMember,
-    DuePeriod,
-    FinancialTransaction,
-    FinancialYear,
-    FinancialYearContribution,
-    FinancialYearParticipant,
-    IndividualDue,
+from clubs.models import FinancialTransaction, FinancialYear, IndividualDue
+from clubs.services.dues import (
+    cash_flow_totals,
+    months_since_start,
+    participant_balances,
 )
+from clubs.services.dues_simulator import (
+    HypotheticalDue,
+    Scenario,
+    load_ledger,
+    simulate,
+)
+from clubs.services.periods import (
+    calendar_years,
+    month_range,
+    resolve_month_and_year,
+)
+from clubs.services.report_cache import aget_cached_report, get_cached_report
+from clubs.views.utils import ClubAccessMixin
+from common.concurrency import run_query
 
 MONTH_CHOICES = [
     (1, "January"),
@@ -34,39 +48,13 @@ MONTH_CHOICES = [
 ]
 
 
-def compute_monthly_due(dues, no_of_months: int) -> float:
-    """
-    Compute the total monthly due for a given financial year and no of months
-    since the financial year started.
-    """
-    dues = dues.aggregate(total_due=Sum("amount"))
-    total_due = dues["total_due"] or 0
-    return total_due * no_of_months
-
-
-def calculate_monthly_due_for_participant(
-    dues,
-    participant: FinancialYearParticipant,
-    no_of_months: int,
-    selected_month_obj: datetime,
-) -> float:
-    """
-    Calculate the due for given participant.
-    """
-    monthly_dues = compute_monthly_due(dues, no_of_months)
-    individual_dues = IndividualDue.objects.filter(
-        financial_year=participant.financial_year,
-        club_member=participant.club_member,
-        due_date__month__lte=selected_month_obj.month,
-    ).aggregate(total_individual_due=Sum("amount"))
-    return monthly_dues + (individual_dues["total_individual_due"] or 0)
-
-
-class FinancialReportView(LoginRequiredMixin, View):
+class FinancialReportView(LoginRequiredMixin, ClubAccessMixin, View):
     """
     View to display financial reports for a specific financial year of a club.
     """
 
+    read_replica = True
+
     def get_no_of_months(
         self,
         selected_date: date,
@@ -75,159 +63,249 @@ class FinancialReportView(LoginRequiredMixin, View):
         """
         Return the number of months from the financial year start to the selected date (inclusive).
         """
-        start = financial_year.start_date
-        return (
-            (selected_date.year - start.year) * 12
-            + (selected_date.month - start.month)
-            + 1
-        )
-
-    def get_selected_month_and_year(
-        self,
-        selected_month: str | None,
-        selected_year: str | None,
-        financial_year: FinancialYear,
-        fy_years: list[int],
-    ) -> tuple[int, int]:
-        """
-        Resolve and validate month/year from request params. Return defaults when invalid.
-        """
-        current_datetime = datetime.now()
-        if not selected_month or selected_month not in [str(i) for i in range(1, 13)]:
-            month = current_datetime.month
-            year = current_datetime.year
-        else:
-            month = int(selected_month)
-            try:
-                if not selected_year or int(selected_year) not in fy_years:
-                    year = (
-                        current_datetime.year
-                        if current_datetime.year in fy_years
-                        else financial_year.end_date.year
-                    )
-                else:
-                    year = int(selected_year)
-            except (ValueError, TypeError):
-                year = (
-                    current_datetime.year
-                    if current_datetime.year in fy_years
-                    else financial_year.end_date.year
-                )
-        return (month, year)
+        return months_since_start(financial_year, selected_date)
 
     def build_participant_dues(
         self,
         financial_year: FinancialYear,
         selected_month_obj: datetime,
-        selected_month: int,
-        selected_year: int,
     ) -> list[dict]:
         """
-        Build the list of participant dues with credits and debits for each participant.
+        Build the list of participant dues with credits and debits for each participant
+        up to and including the selected month.
         """
-        no_of_months = self.get_no_of_months(
-            date(selected_year, selected_month, 1), financial_year
-        )
-        applicable_dues = FinancialYearContribution.objects.filter(
-            financial_year=financial_year,
-            due_period=DuePeriod.MONTHLY.value,
-        )
-        participants = FinancialYearParticipant.objects.filter(
-            financial_year=financial_year
-        ).select_related("club_member__user")
-        participant_dues = []
-        for participant in participants:
-            participant_due = calculate_monthly_due_for_participant(
-                applicable_dues, participant, no_of_months, selected_month_obj
-            )
-            transaction_sums = self.get_participants_transactions(
-                participant.club_member, financial_year, selected_month_obj
-            )
-            participant_dues.append(
-                {
-                    "first_name": participant.club_member.user.first_name,
-                    "last_name": participant.club_member.user.last_name,
-                    "due": participant_due,
-                    "total_credit": transaction_sums["total_credit"] or 0,
-                    "total_debit": transaction_sums["total_debit"] or 0,
-                }
-            )
-        return participant_dues
+        return participant_balances(financial_year, selected_month_obj.date())
 
-    def get_participants_transactions(
-        self,
-        club_member: ClubMember,
-        financial_year: FinancialYear,
-        selected_month_obj: datetime,
-    ):
+    def build_report(
+        self, financial_year: FinancialYear, selected_month_obj: datetime
+    ) -> dict:
         """
-        Sum up the credits and debits for a single club_member up to and including
-        the selected month.
+        Compute the cash-flow totals and participant dues of the selected month.
+        These are the same for every member so they are cached per month.
         """
-        last_day = monthrange(selected_month_obj.year, selected_month_obj.month)[1]
-        end_of_month = date(selected_month_obj.year, selected_month_obj.month, last_day)
-        return FinancialTransaction.objects.filter(
-            financial_year=financial_year,
-            transaction_date__lte=end_of_month,
-            club_member=club_member,
-        ).aggregate(total_credit=Sum("credit"), total_debit=Sum("debit"))
+        totals = cash_flow_totals(financial_year, selected_month_obj.date())
+        return {
+            "sum_credit": totals["total_credit"],
+            "sum_debit": totals["total_debit"],
+            "participant_dues": self.build_participant_dues(
+                financial_year, selected_month_obj
+            ),
+        }
 
-    def get(self, request, club_id, financial_year_id):
+    def get_report_month(
+        self, request, financial_year: FinancialYear
+    ) -> tuple[list[int], datetime]:
         """
-        Handle GET requests to display financial reports.
+        Return the calendar years of the financial year and the first day of
+        the month selected in the query string.
         """
-        try:
-            club = Club.objects.get(id=club_id)
-            is_creator = club.created_by_id == request.user.id
-            is_member = club.members.filter(user=request.user).exists()
-            if not is_creator and not is_member:
-                return render(request, "clubs/403.html", status=HTTPStatus.FORBIDDEN)
-            financial_year = club.financial_years.get(id=financial_year_id)
-        except (Club.DoesNotExist, FinancialYear.DoesNotExist):
-            return redirect("clubs:index")
-        fy_years = list(
-            range(
-                financial_year.start_date.year,
-                financial_year.end_date.year + 1,
-            )
+        selected_month, selected_year = resolve_month_and_year(
+            request.GET.get("month"), request.GET.get("year"), financial_year
         )
-        selected_month, selected_year = self.get_selected_month_and_year(
-            request.GET.get("month"),
-            request.GET.get("year"),
-            financial_year,
-            fy_years,
+        return (
+            calendar_years(financial_year),
+            datetime(selected_year, selected_month, 1),
         )
-        financial_transactions = (
+
+    def get_month_transactions(
+        self, financial_year: FinancialYear, selected_month_obj: datetime
+    ) -> QuerySet:
+        """
+        Return the transactions of the selected month.
+        """
+        month_start, month_end = month_range(selected_month_obj.date())
+        return (
             FinancialTransaction.objects.filter(
                 financial_year=financial_year,
-                transaction_date__month=selected_month,
-                transaction_date__year=selected_year,
+                transaction_date__gte=month_start,
+                transaction_date__lt=month_end,
             )
             .order_by("transaction_date")
             .select_related("club_member__user")
         )
-        cash_flow_totals = FinancialTransaction.objects.filter(
-            financial_year=financial_year,
-            transaction_date__month=selected_month,
-            transaction_date__year=selected_year,
-        ).aggregate(total_credit=Sum("credit"), total_debit=Sum("debit"))
-        selected_month_obj = datetime(selected_year, selected_month, 1)
-        participant_dues = self.build_participant_dues(
-            financial_year,
-            selected_month_obj,
-            selected_month,
-            selected_year,
-        )
-        year_choices = [(y, y) for y in fy_years]
-        context = {
-            "club": club,
-            "financial_year": financial_year,
+
+    def get_context(
+        self,
+        fy_years: list[int],
+        selected_month_obj: datetime,
+        financial_transactions,
+        report: dict,
+    ) -> dict:
+        """
+        Build the template context of the report page.
+        """
+        return {
+            "club": self.access.club,
+            "financial_year": self.access.financial_year,
             "financial_transactions": financial_transactions,
             "selected_month": selected_month_obj,
             "month_choices": MONTH_CHOICES,
-            "year_choices": year_choices,
-            "sum_credit": cash_flow_totals["total_credit"] or 0,
-            "sum_debit": cash_flow_totals["total_debit"] or 0,
-            "participant_dues": participant_dues,
+            "year_choices": [(y, y) for y in fy_years],
+            **report,
         }
+
+    def get(self, request, club_id, financial_year_id):
+        """
+        Handle GET requests to display financial reports.
+        """
+        financial_year = self.access.financial_year
+        fy_years, selected_month_obj = self.get_report_month(request, financial_year)
+        report = get_cached_report(
+            financial_year.id,
+            selected_month_obj.date(),
+            lambda: self.build_report(financial_year, selected_month_obj),
+        )
+        context = self.get_context(
+            fy_years,
+            selected_month_obj,
+            self.get_month_transactions(financial_year, selected_month_obj),
+            report,
+        )
         return render(request, "clubs/financial_reports.html", context)
+
+
+class AsyncFinancialReportView(FinancialReportView):
+    """
+    Async variant of FinancialReportView for ASGI deployments. The month's
+    transactions, the cash-flow totals and the participant dues do not depend
+    on each other, so they are loaded concurrently.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        denied = await sync_to_async(self.check_access)(request, kwargs)
+        if denied is not None:
+            return denied
+        if request.method.lower() not in ("get", "head"):
+            return await self.http_method_not_allowed(request, *args, **kwargs)
+        return await self.get(request, *args, **kwargs)
+
+    def check_access(self, request, kwargs: dict) -> HttpResponse | None:
+        """
+        The LoginRequiredMixin and ClubAccessMixin checks, which query the
+        database and so run on a thread.
+        """
+        if not request.user.is_authenticated:
+            return self.handle_no_permission()
+        return self.check_club_access(request, kwargs)
+
+    async def build_report_async(
+        self, financial_year: FinancialYear, selected_month_obj: datetime
+    ) -> dict:
+        """
+        build_report with the cash-flow totals and the participant dues
+        computed concurrently.
+        """
+        totals, participant_dues = await asyncio.gather(
+            run_query(cash_flow_totals, financial_year, selected_month_obj.date()),
+            run_query(self.build_participant_dues, financial_year, selected_month_obj),
+        )
+        return {
+            "sum_credit": totals["total_credit"],
+            "sum_debit": totals["total_debit"],
+            "participant_dues": participant_dues,
+        }
+
+    async def get(self, request, club_id, financial_year_id):
+        """
+        Handle GET requests to display financial reports.
+        """
+        financial_year = self.access.financial_year
+        fy_years, selected_month_obj = self.get_report_month(request, financial_year)
+        financial_transactions, report = await asyncio.gather(
+            run_query(
+                list, self.get_month_transactions(financial_year, selected_month_obj)
+            ),
+            aget_cached_report(
+                financial_year.id,
+                selected_month_obj.date(),
+                lambda: self.build_report_async(financial_year, selected_month_obj),
+            ),
+        )
+        context = self.get_context(
+            fy_years, selected_month_obj, financial_transactions, report
+        )
+        return await sync_to_async(render)(
+            request, "clubs/financial_reports.html", context
+        )
+
+
+def parse_amount(value) -> Decimal:
+    """
+    Parse a scenario amount. Raises ValueError unless it is a finite number
+    that fits the amount fields of the ledger models.
+    """
+    field = IndividualDue._meta.get_field("amount")
+    amount = Decimal(value)
+    limit = Decimal(10) ** (field.max_digits - field.decimal_places)
+    if not amount.is_finite() or abs(amount) >= limit:
+        raise ValueError(f"Amount {value} is out of range.")
+    return amount
+
+
+def parse_scenario(body: bytes) -> Scenario:
+    """
+    Parse a JSON scenario of the form
+    ``{"contributions": {"<id>": "amount"}, "individual_dues": [{"club_member":
+    id, "amount": "amount", "due_date": "YYYY-MM-DD"}]}``. Raises ValueError
+    when it is malformed or an amount is out of range.
+    """
+    try:
+        payload = json.loads(body or b"{}")
+        return Scenario(
+            contribution_amounts={
+                int(pk): parse_amount(amount)
+                for pk, amount in payload.get("contributions", {}).items()
+            },
+            individual_dues=[
+                HypotheticalDue(
+                    club_member_id=int(due["club_member"]),
+                    amount=parse_amount(due["amount"]),
+                    due_date=date.fromisoformat(due["due_date"]),
+                )
+                for due in payload.get("individual_dues", [])
+            ],
+        )
+    except (AttributeError, KeyError, TypeError, InvalidOperation) as error:
+        raise ValueError("Malformed scenario.") from error
+
+
+class DuesSimulatorView(LoginRequiredMixin, ClubAccessMixin, View):
+    """
+    What-if dues simulator for treasurers. Returns the cumulative due and the
+    balance of every participant at the end of every month of the financial
+    year as JSON. GET simulates no changes, POST applies the JSON scenario
+    in the request body, see parse_scenario. Nothing is written.
+    """
+
+    club_admin_required = True
+
+    def get(self, request, club_id, financial_year_id):
+        return self.simulate(Scenario())
+
+    def post(self, request, club_id, financial_year_id):
+        try:
+            scenario = parse_scenario(request.body)
+        except ValueError as error:
+            return JsonResponse({"error": str(error)}, status=HTTPStatus.BAD_REQUEST)
+        return self.simulate(scenario)
+
+    def simulate(self, scenario: Scenario) -> JsonResponse:
+        """
+        Run ``scenario`` against the ledger of the financial year.
+        """
+        ledger = load_ledger(self.access.financial_year)
+        try:
+            result = simulate(ledger, scenario)
+        except ValueError as error:
+            return JsonResponse({"error": str(error)}, status=HTTPStatus.BAD_REQUEST)
+        due = (result["due"] / 100).tolist()
+        balance = (result["balance"] / 100).tolist()
+        return JsonResponse(
+            {
+                "months": [f"{month:%Y-%m}" for month in ledger.months],
+                "participants": [
+                    {**member, "due": due[row], "balance": balance[row]}
+                    for row, member in enumerate(ledger.members)
+                ],
+            }
+        )
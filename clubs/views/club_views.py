@@ -1,6 +1,17 @@
-from http import HTTPStatus
-
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db.models import (
+    BooleanField,
+    Case,
+    Count,
+    Exists,
+    Max,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
 from django.shortcuts import redirect, render
 from django.views import View
 
@@ -9,8 +20,72 @@ from clubs.forms.club_financials_forms import (
     FinancialYearForm,
 )
 from clubs.forms.club_membership_form import MemberLookupForm
-from clubs.models import Club, ClubMember, FinancialYear
-from clubs.views.utils import is_club_admin_or_creator
+from clubs.models import Club, ClubMember, FinancialTransaction, FinancialYear
+from clubs.views.pagination import keyset_paginate
+from clubs.views.utils import ClubAccessMixin
+
+CLUBS_PAGE_SIZE = 20
+
+
+def visible_clubs(user):
+    """
+    Clubs ``user`` created or is a member of.
+    """
+    return Club.objects.filter(
+        Q(created_by=user)
+        | Exists(ClubMember.objects.filter(club=OuterRef("pk"), user=user))
+    )
+
+
+def user_clubs(user):
+    """
+    Clubs ``user`` created or is a member of, each annotated with the user's
+    role, the member count, the latest active financial year and the date of
+    the latest transaction, so a page of clubs is a single query.
+    """
+    membership = ClubMember.objects.filter(club=OuterRef("pk"), user=user)
+    active_year = FinancialYear.objects.filter(
+        club=OuterRef("pk"), is_active=True
+    ).order_by("-start_date")
+    return visible_clubs(user).annotate(
+        is_creator=Case(
+            When(created_by=user, then=Value(True)),
+            default=Value(False),
+            output_field=BooleanField(),
+        ),
+        role=Subquery(membership.values("role")[:1]),
+        is_admin=Subquery(membership.values("is_admin")[:1]),
+        member_count=Coalesce(
+            Subquery(
+                ClubMember.objects.filter(club=OuterRef("pk"))
+                .order_by()
+                .values("club")
+                .annotate(count=Count("id"))
+                .values("count")
+            ),
+            0,
+        ),
+        active_year_id=Subquery(active_year.values("id")[:1]),
+        active_year_start=Subquery(active_year.values("start_date")[:1]),
+        active_year_end=Subquery(active_year.values("end_date")[:1]),
+        last_transaction_date=Subquery(
+            FinancialTransaction.objects.filter(financial_year__club=OuterRef("pk"))
+            .order_by()
+            .values("financial_year__club")
+            .annotate(last=Max("transaction_date"))
+            .values("last")
+        ),
+    )
+
+
+def club_totals(user) -> dict:
+    """
+    Count the clubs ``user`` can see and the ones they created, in one query
+    independent of the page shown.
+    """
+    return visible_clubs(user).aggregate(
+        club_total=Count("id"), created_total=Count("id", filter=Q(created_by=user))
+    )
 
 
 class ClubsListView(LoginRequiredMixin, View):
@@ -18,28 +93,35 @@ class ClubsListView(LoginRequiredMixin, View):
     View to display a list of investment clubs.
     """
 
+    def get_context(self, request, form: ClubCreationForm) -> dict:
+        """
+        Build the context of the club list, keyset paginated on
+        (created_at, id), oldest first.
+        """
+        club_page = keyset_paginate(
+            user_clubs(request.user),
+            ("created_at", "id"),
+            after=request.GET.get("after"),
+            before=request.GET.get("before"),
+            page_size=CLUBS_PAGE_SIZE,
+            descending=False,
+        )
+        totals = club_totals(request.user)
+        return {
+            "clubs": club_page.items,
+            "club_page": club_page,
+            **totals,
+            "member_total": totals["club_total"] - totals["created_total"],
+            "create_club_form": form,
+        }
+
     def get(self, request):
         """
         Handle GET requests to display the list of clubs.
         """
-        current_user = request.user
-        clubs = (
-            Club.objects.filter(created_by=current_user)
-            .order_by("created_at")
-            .all()[:10]
+        return render(
+            request, "clubs/index.html", self.get_context(request, ClubCreationForm())
         )
-        additional_clubs = (
-            Club.objects.filter(members__user=current_user)
-            .exclude(created_by=current_user)
-            .order_by("created_at")
-            .all()[:10]
-        )
-        context = {
-            "clubs": clubs,
-            "additional_clubs": additional_clubs,
-            "create_club_form": ClubCreationForm(),
-        }
-        return render(request, "clubs/index.html", context)
 
     def post(self, request):
         """
@@ -47,24 +129,7 @@ class ClubsListView(LoginRequiredMixin, View):
         """
         form = ClubCreationForm(request.POST)
         if not form.is_valid():
-            current_user = request.user
-            clubs = (
-                Club.objects.filter(created_by=current_user)
-                .order_by("created_at")
-                .all()[:10]
-            )
-            additional_clubs = (
-                Club.objects.filter(members__user=current_user)
-                .exclude(created_by=current_user)
-                .order_by("created_at")
-                .all()[:10]
-            )
-            context = {
-                "clubs": clubs,
-                "additional_clubs": additional_clubs,
-                "create_club_form": form,
-            }
-            return render(request, "clubs/index.html", context)
+            return render(request, "clubs/index.html", self.get_context(request, form))
         new_club = form.save(commit=False)
         new_club.created_by = request.user
         new_club.updated_by = request.user
@@ -77,25 +142,18 @@ class ClubsListView(LoginRequiredMixin, View):
         return redirect("clubs:index")
 
 
-class ClubDetailView(LoginRequiredMixin, View):
+class ClubDetailView(LoginRequiredMixin, ClubAccessMixin, View):
     """
     View to display details of a specific investment club.
     """
 
+    read_replica = True
+
     def get(self, request, club_id):
         """
         Handle GET requests to display club details.
         """
-        try:
-            club = Club.objects.get(id=club_id)
-        except Club.DoesNotExist:
-            return redirect("clubs:index")
-
-        creator_or_admin = is_club_admin_or_creator(request, club)
-        is_member = club.members.filter(user=request.user).exists()
-        if not creator_or_admin and not is_member:
-            return render(request, "clubs/403.html", status=HTTPStatus.FORBIDDEN)
-
+        club = self.access.club
         members = club.members.select_related("user").all()[:25]
         financial_years = FinancialYear.objects.filter(club=club).order_by(
             "-start_date"
@@ -106,6 +164,6 @@ class ClubDetailView(LoginRequiredMixin, View):
             "look_up_form": MemberLookupForm(),
             "financial_year_form": FinancialYearForm(),
             "financial_years": financial_years,
-            "is_creator_or_admin": creator_or_admin,
+            "is_creator_or_admin": self.access.is_admin,
         }
         return render(request, "clubs/detail.html", context)
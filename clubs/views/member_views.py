@@ -1,13 +1,29 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db.models import Exists, OuterRef
+from django.db.models.functions import Lower
+from django.http import JsonResponse
 from django.shortcuts import redirect, render
 from django.views import View
 
 from accounts.models import CustomUser as User
 from clubs.forms.club_membership_form import MemberLookupForm
-from clubs.models import Club, ClubMember
+from clubs.models import ClubMember
+from clubs.views.utils import ClubAccessMixin
 
 
-class MemberLookUpView(LoginRequiredMixin, View):
+class ClubAdminMixin(ClubAccessMixin):
+    """
+    Require club admin access, sending everybody else back to the club page.
+    """
+
+    club_admin_required = True
+
+    def handle_no_club_access(self):
+        # Todo: Add message to inform user that they do not have permission to view this page.
+        return redirect("clubs:detail", club_id=self.access.club.id)
+
+
+class MemberLookUpView(LoginRequiredMixin, ClubAdminMixin, View):
     """
     View to look up and display member details.
     """
@@ -16,15 +32,7 @@ class MemberLookUpView(LoginRequiredMixin, View):
         """
         Handle POST requests to look up a member by email.
         """
-        club = Club.objects.get(id=club_id)
-        if not club:
-            # Todo: Add message to inform user that the club does not exist.
-            return redirect("clubs:index")
-        if not ClubMember.objects.filter(
-            club=club, user=request.user, is_admin=True
-        ).exists():
-            # Todo: Add message to inform user that they do not have permission to view this page.
-            return redirect("clubs:detail", club_id=club.id)
+        club = self.access.club
         form = MemberLookupForm(request.POST)
         if not form.is_valid():
             context = {
@@ -32,8 +40,8 @@ class MemberLookUpView(LoginRequiredMixin, View):
             }
             return render(request, "clubs/member_lookup.html", context)
         email = form.cleaned_data["email"]
-        try:
-            user = User.objects.get(email=email)
+        user = User.objects.with_email(email).order_by("id").first()
+        if user is not None:
             context = {
                 "look_up_form": form,
                 "member": user,
@@ -41,8 +49,7 @@ class MemberLookUpView(LoginRequiredMixin, View):
                 "club": club,
             }
             return render(request, "clubs/member_lookup.html", context)
-        except User.DoesNotExist:
-            form.add_error("email", "No user found with this email address.")
+        form.add_error("email", "No user found with this email address.")
         context = {
             "look_up_form": form,
             "email": email,
@@ -50,7 +57,7 @@ class MemberLookUpView(LoginRequiredMixin, View):
         return render(request, "clubs/member_lookup.html", context)
 
 
-class ClubMemberView(LoginRequiredMixin, View):
+class ClubMemberView(LoginRequiredMixin, ClubAdminMixin, View):
     """
     View to add a member to a club.
     """
@@ -59,19 +66,49 @@ class ClubMemberView(LoginRequiredMixin, View):
         """
         Handle get requests to add a member to a club.
         """
-        club = Club.objects.get(id=club_id)
-        if not club:
-            return redirect("clubs:index")
-        if not ClubMember.objects.filter(
-            club=club, user=request.user, is_admin=True
-        ).exists():
-            # Todo: Add message to inform user that they do not have permission to view this page.
-            return redirect("clubs:detail", club_id=club.id)
+        club = self.access.club
         form = MemberLookupForm(request.GET)
         if not form.is_valid():
             return redirect("clubs:detail", club_id=club.id)
-        user = User.objects.filter(email=form.cleaned_data["email"]).first()
+        user = (
+            User.objects.with_email(form.cleaned_data["email"]).order_by("id").first()
+        )
         if not user:
             return redirect("clubs:detail", club_id=club.id)
         ClubMember.objects.get_or_create(club=club, user=user, is_admin=False)
         return redirect("clubs:detail", club_id=club.id)
+
+
+class MemberSearchView(LoginRequiredMixin, ClubAdminMixin, View):
+    """
+    Typeahead for adding members: active users who are not members of the
+    club yet and either share another club with the admin and have an email,
+    first name or last name starting with the ``q`` query parameter, or have
+    exactly that email, ignoring case. Returns JSON.
+
+    Prefix matches stay within the admin's own clubs so that the typeahead
+    cannot be used to list the user directory.
+    """
+
+    min_length = 2
+    limit = 10
+
+    def get(self, request, club_id: int):
+        term = request.GET.get("q", "").strip()
+        if len(term) < self.min_length:
+            return JsonResponse({"results": []})
+        members = ClubMember.objects.filter(club=self.access.club, user=OuterRef("pk"))
+        shared_clubs = ClubMember.objects.filter(
+            user=OuterRef("pk"), club__members__user=request.user
+        )
+        users = (
+            (
+                User.objects.search(term).filter(Exists(shared_clubs))
+                | User.objects.with_email(term)
+            )
+            .filter(is_active=True)
+            .filter(~Exists(members))
+            .order_by(Lower("email"))
+            .values("id", "email", "first_name", "last_name")[: self.limit]
+        )
+        return JsonResponse({"results": list(users)})
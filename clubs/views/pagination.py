@@ -0,0 +1,114 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q, QuerySet
+
+
+@dataclass(frozen=True)
+class KeysetPage:
+    """
+    One page of a keyset paginated queryset with opaque cursors to the
+    neighbouring pages.
+    """
+
+    items: list
+    next_cursor: str | None
+    previous_cursor: str | None
+
+
+def encode_cursor(obj, fields: tuple[str, ...]) -> str:
+    """
+    Encode the ordering values of ``obj`` as an opaque URL safe cursor.
+    """
+    values = [obj._meta.get_field(name).value_to_string(obj) for name in fields]
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(model, cursor: str | None, fields: tuple[str, ...]) -> list | None:
+    """
+    Decode a cursor made by encode_cursor. Returns None for a missing or
+    tampered cursor, including values out of the range of their field, so
+    that callers fall back to the first page.
+    """
+    if not cursor:
+        return None
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if (
+            not isinstance(values, list)
+            or len(values) != len(fields)
+            or not all(isinstance(value, str) for value in values)
+        ):
+            return None
+        decoded = []
+        for name, value in zip(fields, values):
+            field = model._meta.get_field(name)
+            value = field.to_python(value)
+            field.run_validators(value)
+            decoded.append(value)
+        return decoded
+    except (binascii.Error, ValueError, TypeError, OverflowError, ValidationError):
+        return None
+
+
+def _seek(fields: tuple[str, ...], values: list, lookup: str) -> Q:
+    """
+    Build the lexicographic ``(fields) <lookup> (values)`` row comparison.
+    """
+    condition = Q()
+    for index, name in enumerate(fields):
+        step = Q(**{f"{name}__{lookup}": values[index]})
+        for previous, value in zip(fields[:index], values[:index]):
+            step &= Q(**{previous: value})
+        condition |= step
+    return condition
+
+
+def keyset_paginate(
+    queryset: QuerySet,
+    fields: tuple[str, ...],
+    after: str | None = None,
+    before: str | None = None,
+    page_size: int = 50,
+    descending: bool = True,
+) -> KeysetPage:
+    """
+    Return the page of ``queryset`` ordered by ``fields`` that follows the
+    ``after`` cursor, or precedes the ``before`` cursor. The last field must
+    be unique (usually "id") so that the ordering is total.
+
+    Each page is a single index range scan of ``page_size + 1`` rows, so its
+    cost does not depend on how deep into the results it is.
+    """
+    forward, backward = ("lt", "gt") if descending else ("gt", "lt")
+    ordering = [f"-{name}" if descending else name for name in fields]
+    reverse_ordering = [name if descending else f"-{name}" for name in fields]
+
+    after_values = decode_cursor(queryset.model, after, fields)
+    before_values = decode_cursor(queryset.model, before, fields)
+    if before_values is not None:
+        rows = list(
+            queryset.filter(_seek(fields, before_values, backward)).order_by(
+                *reverse_ordering
+            )[: page_size + 1]
+        )
+        has_previous = len(rows) > page_size
+        items = list(reversed(rows[:page_size]))
+        has_next = True
+    else:
+        if after_values is not None:
+            queryset = queryset.filter(_seek(fields, after_values, forward))
+        rows = list(queryset.order_by(*ordering)[: page_size + 1])
+        has_next = len(rows) > page_size
+        items = rows[:page_size]
+        has_previous = after_values is not None
+    return KeysetPage(
+        items=items,
+        next_cursor=encode_cursor(items[-1], fields) if items and has_next else None,
+        previous_cursor=(
+            encode_cursor(items[0], fields) if items and has_previous else None
+        ),
+    )
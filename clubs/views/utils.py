@@ -1,19 +1,173 @@
+from dataclasses import dataclass
+from http import HTTPStatus
+
+from django.db.models import F, FilteredRelation, Q
+from django.http import HttpResponse
+from django.shortcuts import redirect, render
+
 from clubs.models import (
     Club,
+    ClubMember,
+    FinancialYear,
 )
 
 
+@dataclass(frozen=True)
+class ClubAccess:
+    """
+    What the requesting user may do in a club, with the rows that decided it.
+    member is None when the user is not a member of the club, and
+    financial_year is None when no financial year was requested.
+    """
+
+    user_id: int
+    club: Club
+    member: ClubMember | None
+    financial_year: FinancialYear | None = None
+
+    @property
+    def is_creator(self) -> bool:
+        return self.club.created_by_id == self.user_id
+
+    @property
+    def is_member(self) -> bool:
+        return self.member is not None
+
+    @property
+    def is_admin(self) -> bool:
+        """
+        Members who created the club or are club admins can manage its
+        financials (create financial years, dues, etc).
+        """
+        return self.is_member and (self.is_creator or self.member.is_admin)
+
+    @property
+    def can_view(self) -> bool:
+        return self.is_creator or self.is_member
+
+
+def _row_annotations(prefix: str, relation: str, model) -> dict:
+    """
+    Annotate every concrete field of ``model`` reached through ``relation``.
+    """
+    return {
+        f"{prefix}{field.attname}": F(f"{relation}__{field.attname}")
+        for field in model._meta.concrete_fields
+    }
+
+
+def _instance_from_row(obj, prefix: str, model):
+    """
+    Build the ``model`` instance annotated by _row_annotations, or None when
+    the joined row is missing.
+    """
+    fields = model._meta.concrete_fields
+    values = [getattr(obj, f"{prefix}{field.attname}") for field in fields]
+    if getattr(obj, f"{prefix}{model._meta.pk.attname}") is None:
+        return None
+    return model.from_db(obj._state.db, [field.attname for field in fields], values)
+
+
+def get_club_access(
+    request, club_id: int, financial_year_id: int | None = None
+) -> ClubAccess:
+    """
+    Load the club, the requesting user's ClubMember row and, when asked for,
+    a financial year of the club in a single joined query. The result is
+    memoized on the request so later checks in the same request are free.
+
+    Raises Club.DoesNotExist or FinancialYear.DoesNotExist.
+    """
+    cache = request.__dict__.setdefault("_club_access", {})
+    key = (int(club_id), financial_year_id and int(financial_year_id))
+    if key in cache:
+        return cache[key]
+
+    clubs = Club.objects.filter(id=club_id).annotate(
+        access_membership=FilteredRelation(
+            "members", condition=Q(members__user_id=request.user.id)
+        ),
+        **_row_annotations("access_member_", "access_membership", ClubMember),
+    )
+    if financial_year_id is not None:
+        clubs = clubs.annotate(
+            access_financial_year=FilteredRelation(
+                "financial_years",
+                condition=Q(financial_years__id=financial_year_id),
+            ),
+            **_row_annotations(
+                "access_financial_year_", "access_financial_year", FinancialYear
+            ),
+        )
+    club = clubs.get()
+    financial_year = None
+    if financial_year_id is not None:
+        financial_year = _instance_from_row(
+            club, "access_financial_year_", FinancialYear
+        )
+        if financial_year is None:
+            raise FinancialYear.DoesNotExist
+        financial_year.club = club
+    member = _instance_from_row(club, "access_member_", ClubMember)
+    if member is not None:
+        member.club = club
+    cache[key] = ClubAccess(request.user.id, club, member, financial_year)
+    return cache[key]
+
+
+class ClubAccessMixin:
+    """
+    Resolve ``self.access`` from the club_id and financial_year_id URL kwargs
+    before dispatching. Unknown clubs and financial years redirect to the club
+    list, users without the required access get a 403 page.
+    Must come after LoginRequiredMixin.
+    """
+
+    club_admin_required = False
+
+    def dispatch(self, request, *args, **kwargs):
+        denied = self.check_club_access(request, kwargs)
+        if denied is not None:
+            return denied
+        return super().dispatch(request, *args, **kwargs)
+
+    def check_club_access(self, request, kwargs: dict) -> HttpResponse | None:
+        """
+        Set ``self.access`` and return the response for users who may not
+        see the page, or None when they may.
+        """
+        try:
+            self.access = get_club_access(
+                request, kwargs["club_id"], kwargs.get("financial_year_id")
+            )
+        except (Club.DoesNotExist, FinancialYear.DoesNotExist):
+            return redirect("clubs:index")
+        allowed = (
+            self.access.is_admin if self.club_admin_required else self.access.can_view
+        )
+        if not allowed:
+            return self.handle_no_club_access()
+        return None
+
+    def handle_no_club_access(self):
+        """
+        Response for users without the required access.
+        """
+        return render(self.request, "clubs/403.html", status=HTTPStatus.FORBIDDEN)
+
+
+def wants_fragment(request) -> bool:
+    """
+    Whether the page asked for just the changed fragment of the page, by
+    sending the X-Fragment header, instead of a full page.
+    """
+    return request.headers.get("X-Fragment") == "true"
+
+
 def is_club_admin_or_creator(request, club: Club) -> bool:
     """
     Check if the user can manage club financials (create financial years, dues, etc).
     User must be a member and either the club creator or an admin.
     Returns bool.
     """
-    is_creator = club.created_by_id == request.user.id
-    club_member = club.members.filter(user=request.user).first()
-    if not club_member:
-        return False
-    can_create = is_creator or club_member.is_admin
-    if not can_create:
-        return False
-    return True
+    return get_club_access(request, club.id).is_admin
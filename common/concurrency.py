@@ -0,0 +1,40 @@
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections, connections
+
+from common.middleware import track_queries
+
+
+def _in_transaction() -> bool:
+    return any(
+        connection.in_atomic_block
+        for connection in connections.all(initialized_only=True)
+    )
+
+
+def _run_on_worker_thread(func, *args):
+    """
+    Run ``func`` on a thread of the shared executor, with its own database
+    connection, counting its queries towards the current request.
+    """
+    try:
+        with track_queries():
+            return func(*args)
+    finally:
+        close_old_connections()
+
+
+async def run_query(func, *args):
+    """
+    Run the synchronous ORM code ``func(*args)`` from async code so that
+    several of them can run at the same time under asyncio.gather.
+
+    Django's async ORM runs every query on one shared thread, one after the
+    other. Here each call gets a thread, and so a connection, of its own.
+    Inside a transaction the call stays on the transaction's connection,
+    since other connections would not see its uncommitted rows.
+    """
+    if await sync_to_async(_in_transaction)():
+        return await sync_to_async(func)(*args)
+    return await sync_to_async(_run_on_worker_thread, thread_sensitive=False)(
+        func, *args
+    )
@@ -0,0 +1,132 @@
+import contextvars
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+SAFE_METHODS = ("GET", "HEAD")
+
+
+@dataclass
+class RoutingState:
+    """
+    Where the queries of the current request go. ``pinned`` keeps every read
+    on the primary once the request, or a recent one of the same client, has
+    written.
+    """
+
+    use_replica: bool = False
+    pinned: bool = False
+    wrote: bool = False
+
+
+_routing: contextvars.ContextVar[RoutingState | None] = contextvars.ContextVar(
+    "db_routing", default=None
+)
+_primary_reads: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "db_primary_reads", default=False
+)
+
+
+@contextmanager
+def primary_reads():
+    """
+    Send the reads in the block to the primary, for results that outlive the
+    request, such as cached reports, and must not be built from a replica
+    lagging behind a write.
+    """
+    token = _primary_reads.set(True)
+    try:
+        yield
+    finally:
+        _primary_reads.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """
+    Send the reads of views with ``read_replica = True`` to the
+    REPLICA_DATABASE alias and everything else, including every write, to the
+    primary. Without a REPLICA_DATABASE, or outside a request, all queries go
+    to the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _routing.get()
+        replica = getattr(settings, "REPLICA_DATABASE", None)
+        if (
+            replica
+            and state is not None
+            and state.use_replica
+            and not state.pinned
+            and not _primary_reads.get()
+        ):
+            return replica
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        state = _routing.get()
+        if state is not None:
+            state.wrote = True
+            state.pinned = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Route the reads of GET requests to views with ``read_replica = True`` to
+    the replica. After a request writes, a cookie pins the client to the
+    primary for REPLICA_PIN_SECONDS so it reads its own writes even when the
+    replica lags behind.
+    """
+
+    cookie_name = "db_primary"
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        state = RoutingState(pinned=self.cookie_name in request.COOKIES)
+        request.db_routing = state
+        token = _routing.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _routing.reset(token)
+        if state.wrote:
+            response.set_cookie(
+                self.cookie_name,
+                "1",
+                max_age=getattr(settings, "REPLICA_PIN_SECONDS", 5),
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view = getattr(view_func, "view_class", view_func)
+        if getattr(view, "read_replica", False) and request.method in SAFE_METHODS:
+            request.db_routing.use_replica = True
+
+
+def iterate_in_request_context(iterable: Iterable) -> Iterator:
+    """
+    Iterate ``iterable`` in the context of the current request. Streaming
+    responses are consumed after the middleware returned, so their queries
+    would otherwise lose the request's routing.
+    """
+    context = contextvars.copy_context()
+    iterator = iter(iterable)
+
+    def run():
+        while True:
+            try:
+                yield context.run(next, iterator)
+            except StopIteration:
+                return
+
+    return run()
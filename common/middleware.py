@@ -0,0 +1,176 @@
+import json
+import logging
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger(__name__)
+
+
+class RequestBudgetExceeded(AssertionError):
+    """
+    Raised when REQUEST_BUDGET_ACTION is "raise" and a view goes over its
+    REQUEST_BUDGETS entry, so that the test requesting it fails.
+    """
+
+
+@dataclass
+class RequestMetrics:
+    """
+    Counters of a single request. Times are in milliseconds.
+    """
+
+    queries: int = 0
+    connects: int = 0
+    db_ms: float = 0.0
+    template_ms: float = 0.0
+    total_ms: float = 0.0
+
+    def as_dict(self) -> dict:
+        """
+        Return the counters rounded for logging.
+        """
+        return {
+            "queries": self.queries,
+            "connects": self.connects,
+            "db_ms": round(self.db_ms, 2),
+            "template_ms": round(self.template_ms, 2),
+            "total_ms": round(self.total_ms, 2),
+        }
+
+
+_current_metrics: ContextVar[RequestMetrics | None] = ContextVar(
+    "request_metrics", default=None
+)
+
+
+def record_template_time(duration_ms: float) -> None:
+    """
+    Add a template render time to the metrics of the current request, if any.
+    """
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.template_ms += duration_ms
+
+
+def _record_query(execute, sql, params, many, context):
+    """
+    Database execute wrapper counting and timing the queries of a request.
+    """
+    metrics = _current_metrics.get()
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        if metrics is not None:
+            metrics.queries += 1
+            metrics.db_ms += (time.perf_counter() - started) * 1000
+
+
+@contextmanager
+def track_queries():
+    """
+    Count and time the queries run on this thread's connections in the block
+    towards the metrics of the current request.
+    """
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(_record_query))
+        yield
+
+
+def _record_connect(sender, connection, **kwargs):
+    """
+    Count the database connections opened during a request. With persistent
+    or pooled connections this stays at zero for most requests.
+    """
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.connects += 1
+
+
+connection_created.connect(_record_connect)
+
+
+def pool_stats() -> dict:
+    """
+    Return the psycopg pool counters (waiting requests, total wait time, pool
+    size, etc) of every pooled database alias in this process.
+    """
+    stats = {}
+    for connection in connections.all(initialized_only=True):
+        pool = getattr(connection, "pool", None)
+        if pool is not None:
+            stats[connection.alias] = pool.get_stats()
+    return stats
+
+
+def _over_budget(metrics: RequestMetrics, budget: dict) -> list[str]:
+    """
+    Describe every metric that is over its limit in ``budget``.
+    """
+    measured = metrics.as_dict()
+    return [
+        f"{name} {measured[name]} > {limit}"
+        for name, limit in budget.items()
+        if measured[name] > limit
+    ]
+
+
+class RequestMetricsMiddleware:
+    """
+    Record the query count, DB time, template render time and total latency of
+    every request. They are logged as one JSON line, sent back in a
+    Server-Timing header and checked against the REQUEST_BUDGETS of the
+    resolved URL name, e.g. {"clubs:financial-reports": {"queries": 10}}.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics = RequestMetrics()
+        token = _current_metrics.set(metrics)
+        started = time.perf_counter()
+        try:
+            with track_queries():
+                response = self.get_response(request)
+        finally:
+            _current_metrics.reset(token)
+        metrics.total_ms = (time.perf_counter() - started) * 1000
+
+        match = getattr(request, "resolver_match", None)
+        view_name = match.view_name if match else None
+        if getattr(settings, "SERVER_TIMING_HEADER", True):
+            response["Server-Timing"] = (
+                f'db;dur={metrics.db_ms:.2f};desc="{metrics.queries} queries", '
+                f"tpl;dur={metrics.template_ms:.2f}, "
+                f"total;dur={metrics.total_ms:.2f}"
+            )
+        overruns = _over_budget(
+            metrics, getattr(settings, "REQUEST_BUDGETS", {}).get(view_name, {})
+        )
+        logger.log(
+            logging.WARNING if overruns else logging.INFO,
+            json.dumps(
+                {
+                    "view": view_name,
+                    "method": request.method,
+                    "path": request.path,
+                    "status": response.status_code,
+                    **metrics.as_dict(),
+                    "over_budget": overruns,
+                    **({"pool": pool} if (pool := pool_stats()) else {}),
+                }
+            ),
+        )
+        if overruns and getattr(settings, "REQUEST_BUDGET_ACTION", "log") == "raise":
+            raise RequestBudgetExceeded(
+                f"{view_name} went over its budget: {', '.join(overruns)}"
+            )
+        return response
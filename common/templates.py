@@ -0,0 +1,37 @@
+import time
+
+from django.template.backends.django import DjangoTemplates
+
+from common.middleware import record_template_time
+
+
+class TimedTemplate:
+    """
+    Wrap a backend template so that its render time is added to the metrics
+    of the current request.
+    """
+
+    def __init__(self, template):
+        self.template = template
+
+    def __getattr__(self, name):
+        return getattr(self.template, name)
+
+    def render(self, context=None, request=None):
+        started = time.perf_counter()
+        try:
+            return self.template.render(context, request)
+        finally:
+            record_template_time((time.perf_counter() - started) * 1000)
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """
+    The Django template backend with render timing for RequestMetricsMiddleware.
+    """
+
+    def from_string(self, template_code):
+        return TimedTemplate(super().from_string(template_code))
+
+    def get_template(self, template_name):
+        return TimedTemplate(super().get_template(template_name))
@@ -0,0 +1,303 @@
+import gzip
+import json
+import tempfile
+from contextlib import contextmanager
+from datetime import date
+from http import HTTPStatus
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles import storage
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, connections
+from django.db.backends.signals import connection_created
+from django.test import (
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.models import CustomUser as User
+from clubs.models import Club, ClubMember, FinancialYear
+from common.db_router import (
+    PrimaryReplicaRouter,
+    ReplicaRoutingMiddleware,
+    RoutingState,
+    _routing,
+    primary_reads,
+)
+from common.middleware import (
+    RequestBudgetExceeded,
+    RequestMetrics,
+    _current_metrics,
+)
+
+
+class RequestMetricsMiddlewareTestCase(TestCase):
+    """
+    Test case for the request metrics middleware.
+    """
+
+    def setUp(self):
+        """
+        Log in a user so the club list view runs its queries.
+        """
+        User.objects.create_user(email="jane.doe@example.com", password="testPass123")
+        self.client.login(email="jane.doe@example.com", password="testPass123")
+
+    def test_server_timing_header_and_log_line(self):
+        """
+        Query count, DB, template and total times are sent and logged.
+        """
+        with self.assertLogs("common.middleware", level="INFO") as logs:
+            response = self.client.get(reverse("clubs:index"))
+        self.assertRegex(
+            response["Server-Timing"],
+            r'^db;dur=[\d.]+;desc="\d+ queries", tpl;dur=[\d.]+, total;dur=[\d.]+$',
+        )
+        line = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(line["view"], "clubs:index")
+        self.assertGreater(line["queries"], 0)
+        self.assertGreater(line["template_ms"], 0)
+        self.assertEqual(line["over_budget"], [])
+
+    @override_settings(REQUEST_BUDGETS={"clubs:index": {"queries": 1}})
+    def test_over_budget_raises(self):
+        """
+        Going over the budget of a URL name fails the request under test.
+        """
+        with (
+            self.assertRaises(RequestBudgetExceeded),
+            self.assertLogs("common.middleware", level="WARNING"),
+        ):
+            self.client.get(reverse("clubs:index"))
+
+    @override_settings(
+        REQUEST_BUDGETS={"clubs:index": {"queries": 1}}, REQUEST_BUDGET_ACTION="log"
+    )
+    def test_over_budget_logs(self):
+        """
+        Outside tests an overrun is only logged as a warning.
+        """
+        with self.assertLogs("common.middleware", level="WARNING") as logs:
+            response = self.client.get(reverse("clubs:index"))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertIn(
+            "queries", json.loads(logs.records[-1].getMessage())["over_budget"][0]
+        )
+
+    def test_reused_connection_is_not_counted(self):
+        """
+        A request on an already open connection logs no new connects.
+        """
+        with self.assertLogs("common.middleware", level="INFO") as logs:
+            self.client.get(reverse("clubs:index"))
+        line = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(line["connects"], 0)
+        self.assertNotIn("pool", line)
+
+    def test_new_connection_is_counted(self):
+        """
+        Connections opened while a request is running are counted.
+        """
+        metrics = RequestMetrics()
+        token = _current_metrics.set(metrics)
+        try:
+            connection_created.send(sender=None, connection=connection)
+        finally:
+            _current_metrics.reset(token)
+        self.assertEqual(metrics.connects, 1)
+
+
+@override_settings(REPLICA_DATABASE="replica")
+class ReplicaRoutingTestCase(TransactionTestCase):
+    """
+    Test case for the primary/replica database router. The replica alias
+    mirrors the test database over a connection of its own, so the queries
+    each alias served are captured separately. The rows are committed for
+    the replica connection to see them.
+    """
+
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        """
+        Log in the creator of a club with a financial year.
+        """
+        self.user = User.objects.create_user(
+            email="jane.doe@example.com", password="testPass123"
+        )
+        self.club = Club.objects.create(
+            name="Investment Club",
+            description="A club for investment enthusiasts.",
+            contact_email=self.user.email,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        ClubMember.objects.create(user=self.user, club=self.club, is_admin=True)
+        self.financial_year = FinancialYear.objects.create(
+            club=self.club,
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 12, 31),
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.client.login(email="jane.doe@example.com", password="testPass123")
+        self.client.cookies.pop(ReplicaRoutingMiddleware.cookie_name, None)
+
+    @contextmanager
+    def served_reads(self):
+        """
+        Collect the SELECT statements run in the block by each alias.
+        """
+        reads = {"default": [], "replica": []}
+        with (
+            CaptureQueriesContext(connections["default"]) as primary,
+            CaptureQueriesContext(connections["replica"]) as replica,
+        ):
+            yield reads
+        for alias, queries in (("default", primary), ("replica", replica)):
+            reads[alias] = [
+                query["sql"]
+                for query in queries.captured_queries
+                if query["sql"].startswith("SELECT")
+            ]
+
+    def test_read_only_view_reads_from_replica(self):
+        """
+        GET requests to read_replica views read from the replica.
+        """
+        with self.served_reads() as reads:
+            response = self.client.get(reverse("clubs:detail", args=[self.club.id]))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertContains(response, "Investment Club")
+        self.assertTrue(reads["replica"])
+        self.assertEqual(reads["default"], [])
+
+    def test_other_views_read_from_primary(self):
+        """
+        Views without read_replica read from the primary.
+        """
+        with self.served_reads() as reads:
+            self.client.get(reverse("clubs:index"))
+        self.assertTrue(reads["default"])
+        self.assertEqual(reads["replica"], [])
+
+    def test_streamed_export_reads_from_replica(self):
+        """
+        Export rows streamed after the view returned still use the replica.
+        """
+        with self.served_reads() as reads:
+            response = self.client.get(
+                reverse(
+                    "clubs:export-transactions",
+                    args=[self.club.id, self.financial_year.id],
+                )
+            )
+            b"".join(response.streaming_content)
+        self.assertTrue(
+            any("clubs_financialtransaction" in sql for sql in reads["replica"])
+        )
+        self.assertEqual(reads["default"], [])
+
+    @override_settings(
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+        },
+        REPORT_CACHE_TIMEOUT=3600,
+    )
+    def test_cached_report_is_built_from_primary(self):
+        """
+        A report stored in the cache is built from the primary, the rest of
+        the page still reads from the replica.
+        """
+        cache.clear()
+        with self.served_reads() as reads:
+            response = self.client.get(
+                reverse(
+                    "clubs:financial-reports",
+                    args=[self.club.id, self.financial_year.id],
+                ),
+                {"month": 3, "year": 2025},
+            )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertTrue(
+            any("clubs_monthlyledgersnapshot" in sql for sql in reads["default"])
+        )
+        self.assertFalse(
+            any("clubs_monthlyledgersnapshot" in sql for sql in reads["replica"])
+        )
+        self.assertTrue(reads["replica"])
+
+    def test_primary_reads_override_the_replica(self):
+        """
+        primary_reads() sends the reads of a read_replica request to the
+        primary.
+        """
+        state = RoutingState(use_replica=True)
+        token = _routing.set(state)
+        self.addCleanup(_routing.reset, token)
+        with self.served_reads() as reads:
+            self.assertTrue(Club.objects.exists())
+            with primary_reads():
+                self.assertTrue(FinancialYear.objects.exists())
+        self.assertEqual(len(reads["replica"]), 1)
+        self.assertIn("clubs_club", reads["replica"][0])
+        self.assertEqual(len(reads["default"]), 1)
+        self.assertIn("clubs_financialyear", reads["default"][0])
+
+    def test_write_pins_client_to_primary(self):
+        """
+        After a write the client reads from the primary until the cookie expires.
+        """
+        response = self.client.post(
+            reverse("clubs:financial-year", args=[self.club.id]),
+            {"start_date": "2026-01-01", "end_date": "2026-12-31"},
+        )
+        self.assertIn(ReplicaRoutingMiddleware.cookie_name, response.cookies)
+        with self.served_reads() as reads:
+            response = self.client.get(reverse("clubs:detail", args=[self.club.id]))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertTrue(reads["default"])
+        self.assertEqual(reads["replica"], [])
+
+    def test_outside_requests_use_primary(self):
+        """
+        Management commands and shells are not routed to the replica.
+        """
+        self.assertEqual(PrimaryReplicaRouter().db_for_read(Club), "default")
+
+
+class CompressedManifestStaticFilesStorageTestCase(SimpleTestCase):
+    """
+    Test case for the hashed and pre-compressed static files storage.
+    """
+
+    def test_collectstatic_writes_hashed_and_compressed_files(self):
+        """
+        Every hashed stylesheet gets a gzip variant with the same content.
+        """
+        with (
+            tempfile.TemporaryDirectory() as static_root,
+            override_settings(
+                STATIC_ROOT=static_root,
+                STORAGES={
+                    **settings.STORAGES,
+                    "staticfiles": {
+                        "BACKEND": "common.storage.CompressedManifestStaticFilesStorage"
+                    },
+                },
+            ),
+        ):
+            call_command("collectstatic", interactive=False, verbosity=0)
+            hashed = storage.staticfiles_storage.stored_name("css/savingsinc.css")
+            self.assertRegex(hashed, r"^css/savingsinc\.[0-9a-f]{12}\.css$")
+            path = Path(static_root, hashed)
+            self.assertEqual(
+                gzip.decompress(Path(f"{path}.gz").read_bytes()), path.read_bytes()
+            )
+            self.assertFalse(Path(static_root, "css/savingsinc.css.gz").exists())
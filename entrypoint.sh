@@ -5,10 +5,6 @@ set -e
 python manage.py migrate --noinput
 python manage.py collectstatic --noinput
 
-exec gunicorn investment_club.wsgi:application \
-    --bind 0.0.0.0:8000 \
-    --workers 3 \
-    --timeout 120 \
-    --reload \
-    --access-logfile - \
-    --error-logfile -
+# Workers, threads, preload and reload come from gunicorn.conf.py, set
+# GUNICORN_RELOAD=True in the environment for development.
+exec gunicorn --config gunicorn.conf.py
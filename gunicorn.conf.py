@@ -0,0 +1,77 @@
+"""
+Gunicorn configuration for the container and the systemd service.
+
+Every setting can be overridden with an environment variable:
+
+    GUNICORN_BIND          address or unix socket (default 0.0.0.0:8000)
+    GUNICORN_WORKER_CLASS  "gthread" (default), "sync" or, to serve the ASGI
+                           app, "uvicorn_worker.UvicornWorker"
+    GUNICORN_WORKERS       default 2 x CPUs + 1 for sync, CPUs + 1 otherwise
+    GUNICORN_THREADS       threads per gthread worker (default 4)
+    GUNICORN_TIMEOUT       seconds before a silent worker is killed (default 120)
+    GUNICORN_MAX_REQUESTS  requests before a worker is recycled (default 1000)
+    GUNICORN_MAX_REQUESTS_JITTER  random spread of the above (default 100)
+    GUNICORN_PRELOAD       load the app once before forking (default True)
+    GUNICORN_RELOAD        restart workers on code changes, dev only (default False)
+    GUNICORN_ACCESS_LOG / GUNICORN_ERROR_LOG  log files, "-" for stdout/stderr
+
+With preload on, SIGHUP does not pick up new code: restart the service after
+a deploy instead of reloading it.
+"""
+
+import multiprocessing
+import os
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    return os.getenv(name, str(default)) == "True"
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, default))
+
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+
+# gthread keeps a worker serving other requests while one thread waits on a
+# slow report query, sync workers stall the whole process instead.
+# "uvicorn_worker.UvicornWorker" serves the ASGI app, for the async views.
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+_asgi = "uvicorn" in worker_class.lower()
+wsgi_app = (
+    "investment_club.asgi:application" if _asgi else "investment_club.wsgi:application"
+)
+_cpus = multiprocessing.cpu_count()
+workers = _env_int(
+    "GUNICORN_WORKERS",
+    _cpus + 1 if worker_class == "gthread" or _asgi else _cpus * 2 + 1,
+)
+threads = _env_int("GUNICORN_THREADS", 4) if worker_class == "gthread" else 1
+
+timeout = _env_int("GUNICORN_TIMEOUT", 120)
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle workers now and then to bound slow memory growth, spread out so
+# they do not all restart at once.
+max_requests = _env_int("GUNICORN_MAX_REQUESTS", 1000)
+max_requests_jitter = _env_int("GUNICORN_MAX_REQUESTS_JITTER", 100)
+
+reload = _env_bool("GUNICORN_RELOAD", False)
+# Reloading re-imports the app in each worker, so it cannot be preloaded.
+preload_app = _env_bool("GUNICORN_PRELOAD", True) and not reload
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")
+errorlog = os.getenv("GUNICORN_ERROR_LOG", "-")
+
+
+def post_fork(server, worker):
+    """
+    Drop database connections inherited from the preloading master, so that
+    workers never share a socket.
+    """
+    from django.conf import settings
+    from django.db import connections
+
+    if settings.configured:
+        connections.close_all()
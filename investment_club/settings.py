@@ -12,8 +12,10 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 import os
 import sys
+from importlib.util import find_spec
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -54,6 +56,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "common.middleware.RequestMetricsMiddleware",
+    "common.db_router.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -66,7 +70,7 @@ ROOT_URLCONF = "investment_club.urls"
 
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "BACKEND": "common.templates.TimedDjangoTemplates",
         "DIRS": [os.path.join(BASE_DIR, "templates")],
         "APP_DIRS": True,
         "OPTIONS": {
@@ -84,6 +88,23 @@ WSGI_APPLICATION = "investment_club.wsgi.application"
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
+# Connections are kept open between requests for DB_CONN_MAX_AGE seconds and
+# checked before reuse. DB_POOL=True uses a psycopg 3 connection pool per
+# worker process instead (requires "psycopg[binary,pool]"), sized to the
+# threads that can hold a connection in that process: the gunicorn threads
+# of a gthread worker. Under the uvicorn worker every run_query of an async
+# view takes a thread of the event loop's default executor, and so a
+# connection, of its own (up to 3 per report request), next to the thread
+# that runs the sync code.
+
+DB_POOL = os.getenv("DB_POOL", "False") == "True"
+
+_ASGI = "uvicorn" in os.getenv("GUNICORN_WORKER_CLASS", "").lower()
+_DB_THREADS = (
+    min(32, (os.cpu_count() or 1) + 4) + 1
+    if _ASGI
+    else int(os.getenv("GUNICORN_THREADS", "4"))
+)
 
 DATABASES = {
     "default": {
@@ -93,14 +114,148 @@ DATABASES = {
         "PASSWORD": os.environ.get("POSTGRES_DB_PASSWORD"),
         "HOST": os.environ.get("POSTGRES_DB_HOST"),
         "PORT": os.environ.get("POSTGRES_DB_PORT"),
+        "CONN_MAX_AGE": 0 if DB_POOL else int(os.getenv("DB_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": os.getenv("DB_CONN_HEALTH_CHECKS", "True") == "True",
     }
 }
 
+if DB_POOL and not (find_spec("psycopg") and find_spec("psycopg_pool")):
+    # Django only notices on the first connection, psycopg2 cannot pool.
+    raise ImproperlyConfigured(
+        'DB_POOL=True requires psycopg 3: pip install "psycopg[binary,pool]".'
+    )
+
+if DB_POOL:
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "1")),
+            "max_size": int(os.getenv("DB_POOL_MAX_SIZE", _DB_THREADS)),
+            "timeout": int(os.getenv("DB_POOL_TIMEOUT", "10")),
+        }
+    }
+
+# Read replica
+# Views with read_replica = True read from the "replica" alias when
+# POSTGRES_REPLICA_HOST is set. A client that wrote stays on the primary for
+# REPLICA_PIN_SECONDS so it reads its own writes.
+
+DATABASE_ROUTERS = ["common.db_router.PrimaryReplicaRouter"]
+
+REPLICA_DATABASE = None
+REPLICA_PIN_SECONDS = int(os.getenv("REPLICA_PIN_SECONDS", "5"))
+
+if os.getenv("POSTGRES_REPLICA_HOST"):
+    REPLICA_DATABASE = "replica"
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "NAME": os.getenv("POSTGRES_REPLICA_NAME", DATABASES["default"]["NAME"]),
+        "HOST": os.getenv("POSTGRES_REPLICA_HOST"),
+        "PORT": os.getenv("POSTGRES_REPLICA_PORT", DATABASES["default"]["PORT"]),
+    }
+
 if "test" in sys.argv or "test_coverage" in sys.argv:
-    DATABASES["default"] = {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": ":memory:",
+    # The replica alias mirrors the test database over a connection of its
+    # own, so tests can tell which alias served a query. Reads only go there
+    # when a test sets REPLICA_DATABASE.
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": ":memory:",
+        },
+        "replica": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": ":memory:",
+            "TEST": {"MIRROR": "default"},
+        },
     }
+    REPLICA_DATABASE = None
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# "locmem" is private to each worker process, use "file" when running more
+# than one gunicorn worker so that invalidations are seen by every worker.
+
+CACHE_BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+}
+
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "locmem")
+
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKENDS[CACHE_BACKEND],
+        "LOCATION": os.getenv("CACHE_LOCATION")
+        or ("/var/tmp/investment_club_cache" if CACHE_BACKEND == "file" else ""),
+    }
+}
+
+if "test" in sys.argv or "test_coverage" in sys.argv:
+    CACHES["default"] = {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+    }
+
+_SHARED_CACHE = CACHE_BACKEND != "locmem"
+
+# Seconds a computed financial report is kept, 0 computes it on every
+# request. Writes invalidate it earlier, but only in the workers that see the
+# version bump, so reports are only cached when every worker shares the cache.
+REPORT_CACHE_TIMEOUT = int(
+    os.getenv("REPORT_CACHE_TIMEOUT", "3600" if _SHARED_CACHE else "0")
+)
+
+
+# Sessions and users
+# "cached_db" reads sessions from the cache and falls back to the database,
+# "signed_cookies" keeps them in the client. Both caches are only safe when
+# every worker shares the cache: a logout or a deactivated user seen by one
+# locmem cache would stay valid in the others, so locmem keeps the database.
+
+SESSION_BACKENDS = {
+    "db": "django.contrib.sessions.backends.db",
+    "cached_db": "django.contrib.sessions.backends.cached_db",
+    "signed_cookies": "django.contrib.sessions.backends.signed_cookies",
+}
+
+SESSION_ENGINE = SESSION_BACKENDS[
+    os.getenv("SESSION_BACKEND", "cached_db" if _SHARED_CACHE else "db")
+]
+
+# A single backend, so a failed login hashes the password once. Sessions
+# started with ModelBackend were moved over by accounts migration 0003.
+AUTHENTICATION_BACKENDS = ["accounts.backends.CachedModelBackend"]
+
+# Seconds the user of a session is cached, 0 loads it on every request.
+USER_CACHE_TIMEOUT = int(
+    os.getenv("USER_CACHE_TIMEOUT", "300" if _SHARED_CACHE else "0")
+)
+
+
+# Request metrics
+# common.middleware.RequestMetricsMiddleware logs the query count, DB time,
+# template time and total latency of every request and checks them against
+# these budgets per URL name. Tests raise on an overrun, elsewhere it is logged.
+# Streamed exports run their queries after the middleware returned, so they
+# have no budget.
+
+SERVER_TIMING_HEADER = os.getenv("SERVER_TIMING_HEADER", "True") == "True"
+
+REQUEST_BUDGETS = {
+    "clubs:index": {"queries": 8},
+    "clubs:detail": {"queries": 10},
+    "clubs:member-search": {"queries": 6},
+    "clubs:financial-year-detail": {"queries": 20},
+    "clubs:financial-transaction": {"queries": 20},
+    "clubs:financial-reports": {"queries": 10},
+    "clubs:financial-reports-async": {"queries": 10},
+    "clubs:dues-simulator": {"queries": 10},
+}
+
+REQUEST_BUDGET_ACTION = os.getenv("REQUEST_BUDGET_ACTION", "log")
+
+if "test" in sys.argv or "test_coverage" in sys.argv:
+    REQUEST_BUDGET_ACTION = "raise"
 
 
 # Password validation
@@ -143,6 +298,20 @@ STATICFILES_DIRS = [
 
 STATIC_URL = "/static/"
 
+# collectstatic names files after their content and writes gzip and brotli
+# variants next to them, so nginx can cache them forever and serve them
+# without compressing on every request.
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "common.storage.CompressedManifestStaticFilesStorage"},
+}
+
+if "test" in sys.argv or "test_coverage" in sys.argv:
+    # Tests render templates without running collectstatic first.
+    STORAGES["staticfiles"] = {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+    }
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
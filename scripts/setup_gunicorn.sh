@@ -58,12 +58,12 @@ User=${APP_USER}
 Group=${APP_USER}
 WorkingDirectory=${APP_DIR}
 EnvironmentFile=${ENV_FILE}
-ExecStart=${VENV_DIR}/bin/gunicorn investment_club.wsgi:application \\
-    --bind unix:${GUNICORN_SOCKET} \\
-    --workers 3 \\
-    --timeout 120 \\
-    --access-logfile /var/log/gunicorn/access.log \\
-    --error-logfile /var/log/gunicorn/error.log
+Environment=GUNICORN_BIND=unix:${GUNICORN_SOCKET}
+Environment=GUNICORN_ACCESS_LOG=/var/log/gunicorn/access.log
+Environment=GUNICORN_ERROR_LOG=/var/log/gunicorn/error.log
+# Workers, threads and preloading are set in gunicorn.conf.py. The app is
+# preloaded, so restart (not reload) the service after deploying new code.
+ExecStart=${VENV_DIR}/bin/gunicorn --config ${APP_DIR}/gunicorn.conf.py
 ExecReload=/bin/kill -s HUP \$MAINPID
 KillMode=mixed
 TimeoutStopSec=5
@@ -118,10 +118,21 @@ server {
 
     client_max_body_size 20M;
 
+    # collectstatic writes content hashed copies (name.0123456789ab.css)
+    # with .gz and .br variants next to them. Hashed names never change
+    # content so they are cached for a year, anything else is revalidated.
+    location ~ "^/static/(.+\.[0-9a-f]{12}\.[a-z0-9]+)$" {
+        alias ${APP_DIR}/staticfiles/\$1;
+        gzip_static on;
+        # brotli_static on;  # needs the ngx_brotli module
+        expires 365d;
+        add_header Cache-Control "public, immutable";
+    }
+
     location /static/ {
         alias ${APP_DIR}/staticfiles/;
-        expires 30d;
-        add_header Cache-Control "public, immutable";
+        gzip_static on;
+        expires 1h;
     }
 
     location / {